@@ -1,76 +1,157 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+from pathlib import Path
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady, ConfigEntryError
-
-from .const import CONF_HOST, CONF_PORT, DEFAULT_PORT, LOGGER, SUPPORTED_PROTOCOL_MAJOR
+from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    CONF_DUCKING,
+    CONF_HOST,
+    CONF_JOURNAL,
+    CONF_PORT,
+    CONF_STREAM_NAME,
+    CONF_TRANSPORT,
+    DEFAULT_PORT,
+    DEFAULT_VBAN_STREAM,
+    DOMAIN,
+    LOGGER,
+    SUPPORTED_PROTOCOL_MAJOR,
+    TRANSPORT_VBAN,
+    TRANSPORT_WEBSOCKET,
+)
 from .coordinator import VoicemeeterCoordinator
 from .data import VoicemeeterRuntimeData
+from .ducking import DuckingConfig, DuckingEngine
+from .hub import StateHub, async_register_websocket_commands
+from .journal import ChangeJournal
+from .services import async_setup_services
+from .transport import VoicemeeterTransport
+from .vban import VoicemeeterVban
+from .watchers import async_remove_watcher_registry
 from .websocket import VoicemeeterWebSocket
 
-PLATFORMS = [Platform.SWITCH, Platform.NUMBER]
+PLATFORMS = [Platform.SWITCH, Platform.NUMBER, Platform.SENSOR]
+
+FIRST_STATE_TIMEOUT = 10  # seconds
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 
-FIRST_STATE_TIMEOUT = 10 # seconds
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    async_register_websocket_commands(hass)
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = VoicemeeterCoordinator(hass)
 
-    ws = VoicemeeterWebSocket(
-        host=entry.data[CONF_HOST],
-        port=entry.data.get(CONF_PORT, DEFAULT_PORT),
-        on_message=coordinator.handle_message,
-        on_connect=coordinator.handle_connect,
-        on_disconnect=coordinator.handle_disconnect,
-    )
+    transport = _create_transport(hass, entry, coordinator)
 
-    entry.runtime_data = VoicemeeterRuntimeData(coordinator=coordinator, ws=ws)
+    hub = StateHub(coordinator)
 
-    ws_task = hass.async_create_background_task(
-        ws.start(),
-        name="voicemeeter_websocket",
+    entry.runtime_data = VoicemeeterRuntimeData(
+        coordinator=coordinator, transport=transport, hub=hub
     )
-    async def _cancel_ws_task() -> None:
-        ws_task.cancel()
 
-    entry.async_on_unload(_cancel_ws_task)
-    entry.async_on_unload(ws.stop)
+    transport_task = hass.async_create_background_task(
+        transport.start(),
+        name=f"voicemeeter_{entry.data.get(CONF_TRANSPORT, TRANSPORT_WEBSOCKET)}",
+    )
+
+    async def _stop_transport() -> None:
+        # Unload callbacks run concurrently, so anything that still has to
+        # go out (the ducking restore) is awaited here before closing.
+        if coordinator.ducking:
+            await coordinator.ducking.async_stop()
+        # Ask the loop to exit cleanly first so the socket is closed, then
+        # cancel in case it is stuck in a connect attempt or a sleep.
+        await transport.stop()
+        transport_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await transport_task
+
+    entry.async_on_unload(_stop_transport)
+    entry.async_on_unload(hub.async_shutdown)
+    entry.async_on_unload(coordinator.async_shutdown_offline_queue)
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
 
     # Wait until the coordinator has real state (set by first state message)
     # before setting up platforms — entities need coordinator.data to exist
     # so they know how many strips and buses to create.
     try:
         await asyncio.wait_for(
-            _wait_for_state(coordinator),
+            coordinator.async_wait_for_state(),
             timeout=FIRST_STATE_TIMEOUT,
         )
         current_protocol = coordinator.data.protocol
         _check_protocol(current_protocol)
     except TimeoutError:
         LOGGER.warning(
-            "Voicemeeter companion app did not send state within %ss — "
-            "check that the app is running at %s:%s",
+            "Voicemeeter did not send state within %ss — "
+            "check that the companion app or VBAN is running at %s:%s",
             FIRST_STATE_TIMEOUT,
             entry.data[CONF_HOST],
             entry.data.get(CONF_PORT, DEFAULT_PORT),
         )
-        raise ConfigEntryNotReady("No state received from companion app")
+        raise ConfigEntryNotReady("No state received from Voicemeeter")
+
+    if entry.options.get(CONF_JOURNAL, False):
+        coordinator.journal = ChangeJournal(
+            hass, Path(hass.config.path(DOMAIN, f"journal_{entry.entry_id}.jsonl"))
+        )
+        coordinator.journal.async_start()
+        entry.async_on_unload(coordinator.journal.async_stop)
+
+    if entry.options.get(CONF_DUCKING, False):
+        coordinator.ducking = DuckingEngine(
+            hass, coordinator, DuckingConfig.from_options(entry.options)
+        )
+        coordinator.ducking.async_start()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
-async def _wait_for_state(coordinator: VoicemeeterCoordinator) -> None:
-    """Block until coordinator.data is populated."""
-    while coordinator.data is None:
-        await asyncio.sleep(0.1)
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Options decide which entities exist, so reload to apply them."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+def _create_transport(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: VoicemeeterCoordinator
+) -> VoicemeeterTransport:
+    """Build the transport selected in the config flow."""
+    if entry.data.get(CONF_TRANSPORT, TRANSPORT_WEBSOCKET) == TRANSPORT_VBAN:
+        return VoicemeeterVban(
+            host=entry.data[CONF_HOST],
+            port=entry.data[CONF_PORT],
+            stream_name=entry.data.get(CONF_STREAM_NAME, DEFAULT_VBAN_STREAM),
+            on_message=coordinator.handle_message,
+            on_connect=coordinator.handle_connect,
+            on_disconnect=coordinator.handle_disconnect,
+        )
+    return VoicemeeterWebSocket(
+        session=async_get_clientsession(hass),
+        host=entry.data[CONF_HOST],
+        port=entry.data.get(CONF_PORT, DEFAULT_PORT),
+        on_message=coordinator.handle_message,
+        on_connect=coordinator.handle_connect,
+        on_disconnect=coordinator.handle_disconnect,
+        decode=coordinator.decode_frame,
+        offload=hass.async_add_executor_job,
+    )
+
 
 def _check_protocol(current_protocol: str) -> None:
-    
     current_major = current_protocol.split(".")[0]
 
     if current_major != SUPPORTED_PROTOCOL_MAJOR:
@@ -84,3 +165,8 @@ def _check_protocol(current_protocol: str) -> None:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Clean up what outlives reloads once the entry is deleted."""
+    async_remove_watcher_registry(hass, entry.entry_id)
@@ -0,0 +1,134 @@
+"""
+Outbound command handling for the Voicemeeter companion app.
+
+Entities never talk to the transport directly. They hand their set commands
+to the coordinator, which funnels them through a CommandBatcher so that a
+service call touching many entities costs one frame instead of one per entity.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import LOGGER
+from .data import VoicemeeterState, get_param
+
+CommandKey = tuple[str, int, str]  # (target, index, param)
+
+
+def make_command(target: str, index: int, param: str, value: Any) -> dict[str, Any]:
+    """Build the body of a set command as understood by the companion app."""
+    return {"target": target, "index": index, "param": param, "value": value}
+
+
+class CommandBatcher:
+    """
+    Collects commands issued in the same event loop tick and sends them together.
+
+    When HA calls e.g. switch.turn_off on twenty entities, each entity's
+    async_turn_off runs as its own task, all scheduled in the same tick. The
+    first command starts a flush task which yields once before sending, so
+    every command queued in that tick ends up in a single batch frame.
+
+    Older companion protocols do not understand batch frames; in that case the
+    collected commands are sent as individual set frames instead.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+        supports_batch: Callable[[], bool],
+    ) -> None:
+        self._hass = hass
+        self._send = send
+        self._supports_batch = supports_batch
+
+        # Keyed by (target, index, param) so that two commands for the same
+        # parameter in one tick collapse into the last one.
+        self._pending: dict[CommandKey, dict[str, Any]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+
+    async def async_add(self, *commands: dict[str, Any]) -> None:
+        """Queue commands and wait until the frame carrying them has been sent."""
+        for command in commands:
+            key = (command["target"], command["index"], command["param"])
+            self._pending[key] = command
+
+        if self._flush_task is None:
+            self._flush_task = self._hass.async_create_task(
+                self._async_flush(), name="voicemeeter_command_flush"
+            )
+
+        # Shield so one cancelled caller doesn't cancel the send for everyone
+        # else sharing the batch.
+        await asyncio.shield(self._flush_task)
+
+    async def _async_flush(self) -> None:
+        # Yield once so every command issued in this tick joins the batch.
+        await asyncio.sleep(0)
+
+        commands = list(self._pending.values())
+        self._pending.clear()
+        self._flush_task = None
+
+        if len(commands) == 1:
+            await self._send({"type": "set", **commands[0]})
+        elif self._supports_batch():
+            LOGGER.debug("Sending batch of %s commands", len(commands))
+            await self._send({"type": "batch", "commands": commands})
+        else:
+            for command in commands:
+                await self._send({"type": "set", **command})
+
+
+class OfflineCommandQueue:
+    """
+    Holds commands issued while disconnected, for replay after reconnect.
+
+    Commands are coalesced per (target, index, param) so only the final
+    intent survives, and expire after a TTL so a stale command doesn't fire
+    long after the automation that issued it.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        # Value is (command, expiry as time.monotonic()).
+        self._pending: dict[CommandKey, tuple[dict[str, Any], float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, *commands: dict[str, Any]) -> None:
+        """Queue commands, replacing earlier ones for the same parameter."""
+        expiry = time.monotonic() + self._ttl
+        for command in commands:
+            key = (command["target"], command["index"], command["param"])
+            # Pop first so a re-issued command moves to the end of the order.
+            self._pending.pop(key, None)
+            self._pending[key] = (command, expiry)
+
+    def clear(self) -> None:
+        self._pending.clear()
+
+    def drain(self, state: VoicemeeterState) -> list[dict[str, Any]]:
+        """
+        Empty the queue, returning the commands still worth sending.
+
+        Expired commands are dropped, as are those the given state already
+        satisfies (e.g. the user fixed it by hand on the Windows box).
+        """
+        now = time.monotonic()
+        commands = [
+            command
+            for (target, index, param), (command, expiry) in self._pending.items()
+            if expiry > now
+            and get_param(state, target, index, param) != command["value"]
+        ]
+        self._pending.clear()
+        return commands
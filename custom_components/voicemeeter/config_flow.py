@@ -1,36 +1,74 @@
 from __future__ import annotations
 
 import voluptuous as vol
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigEntryState,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
 
 from .const import (
+    CONF_COMPACT_ROUTING,
+    CONF_DUCKING,
+    CONF_DUCKING_ATTACK,
+    CONF_DUCKING_DEPTH,
+    CONF_DUCKING_RATE,
+    CONF_DUCKING_RELEASE,
+    CONF_DUCKING_SOURCE,
+    CONF_DUCKING_TARGETS,
+    CONF_DUCKING_THRESHOLD,
     CONF_HOST,
+    CONF_JOURNAL,
     CONF_KIND,
     CONF_NAME,
+    CONF_OFFLINE_QUEUE,
+    CONF_OFFLINE_QUEUE_TTL,
     CONF_PORT,
+    CONF_STREAM_NAME,
+    CONF_TRANSPORT,
+    DEFAULT_DUCKING_ATTACK,
+    DEFAULT_DUCKING_DEPTH,
+    DEFAULT_DUCKING_RATE,
+    DEFAULT_DUCKING_RELEASE,
+    DEFAULT_DUCKING_THRESHOLD,
     DEFAULT_KIND,
+    DEFAULT_OFFLINE_QUEUE_TTL,
     DEFAULT_PORT,
+    DEFAULT_VBAN_PORT,
+    DEFAULT_VBAN_STREAM,
     DOMAIN,
-    VOICEMEETER_KINDS,
+    STRIP_LABELS,
+    TRANSPORT_VBAN,
+    TRANSPORT_WEBSOCKET,
+    get_strip_label,
 )
 
 
 class VoicemeeterConfigFlow(ConfigFlow, domain=DOMAIN):
-
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        return VoicemeeterOptionsFlow()
+
     async def async_step_user(self, user_input: dict | None = None) -> ConfigFlowResult:
+        return self.async_show_menu(
+            step_id="user",
+            menu_options=[TRANSPORT_WEBSOCKET, TRANSPORT_VBAN],
+        )
+
+    async def async_step_websocket(
+        self, user_input: dict | None = None
+    ) -> ConfigFlowResult:
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            # Prevent duplicate entries for the same host
-            await self.async_set_unique_id(
-                f"{user_input[CONF_HOST]}:{user_input[CONF_PORT]}"
-            )
-            self._abort_if_unique_id_configured()
-            name = user_input.get(CONF_NAME, "").strip()
-            title = name if name else f"Voicemeeter ({user_input[CONF_HOST]})"
-            return self.async_create_entry(title=title, data=user_input)
+            return await self._async_create(TRANSPORT_WEBSOCKET, user_input)
 
         schema = vol.Schema(
             {
@@ -41,7 +79,153 @@ class VoicemeeterConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
         return self.async_show_form(
-            step_id="user",
+            step_id=TRANSPORT_WEBSOCKET,
             data_schema=schema,
             errors=errors,
         )
+
+    async def async_step_vban(self, user_input: dict | None = None) -> ConfigFlowResult:
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            return await self._async_create(TRANSPORT_VBAN, user_input)
+
+        schema = vol.Schema(
+            {
+                vol.Optional(CONF_NAME, default=""): str,
+                vol.Required(CONF_HOST, default="192.168.1.63"): str,
+                vol.Required(CONF_PORT, default=DEFAULT_VBAN_PORT): int,
+                vol.Required(CONF_STREAM_NAME, default=DEFAULT_VBAN_STREAM): str,
+            }
+        )
+
+        return self.async_show_form(
+            step_id=TRANSPORT_VBAN,
+            data_schema=schema,
+            errors=errors,
+        )
+
+    async def _async_create(self, transport: str, user_input: dict) -> ConfigFlowResult:
+        # Prevent duplicate entries for the same host
+        await self.async_set_unique_id(
+            f"{user_input[CONF_HOST]}:{user_input[CONF_PORT]}"
+        )
+        self._abort_if_unique_id_configured()
+        name = user_input.get(CONF_NAME, "").strip()
+        title = name if name else f"Voicemeeter ({user_input[CONF_HOST]})"
+        return self.async_create_entry(
+            title=title, data={**user_input, CONF_TRANSPORT: transport}
+        )
+
+
+class VoicemeeterOptionsFlow(OptionsFlow):
+    def __init__(self) -> None:
+        self._options: dict = {}
+
+    async def async_step_init(self, user_input: dict | None = None) -> ConfigFlowResult:
+        if user_input is not None:
+            self._options = {**self.config_entry.options, **user_input}
+            if user_input[CONF_DUCKING]:
+                return await self.async_step_ducking()
+            return self.async_create_entry(data=self._options)
+
+        options = self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_COMPACT_ROUTING,
+                    default=options.get(CONF_COMPACT_ROUTING, False),
+                ): bool,
+                vol.Optional(
+                    CONF_OFFLINE_QUEUE,
+                    default=options.get(CONF_OFFLINE_QUEUE, False),
+                ): bool,
+                vol.Optional(
+                    CONF_OFFLINE_QUEUE_TTL,
+                    default=options.get(
+                        CONF_OFFLINE_QUEUE_TTL, DEFAULT_OFFLINE_QUEUE_TTL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                vol.Optional(
+                    CONF_JOURNAL,
+                    default=options.get(CONF_JOURNAL, False),
+                ): bool,
+                vol.Optional(
+                    CONF_DUCKING,
+                    default=options.get(CONF_DUCKING, False),
+                ): bool,
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=schema)
+
+    async def async_step_ducking(
+        self, user_input: dict | None = None
+    ) -> ConfigFlowResult:
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            if user_input[CONF_DUCKING_SOURCE] in user_input[CONF_DUCKING_TARGETS]:
+                errors[CONF_DUCKING_TARGETS] = "source_in_targets"
+            else:
+                return self.async_create_entry(data={**self._options, **user_input})
+
+        strips = self._strip_choices()
+        options = self.config_entry.options
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_DUCKING_SOURCE,
+                    default=options.get(CONF_DUCKING_SOURCE, next(iter(strips))),
+                ): vol.In(strips),
+                vol.Required(
+                    CONF_DUCKING_TARGETS,
+                    default=options.get(CONF_DUCKING_TARGETS, []),
+                ): cv.multi_select(strips),
+                vol.Required(
+                    CONF_DUCKING_THRESHOLD,
+                    default=options.get(
+                        CONF_DUCKING_THRESHOLD, DEFAULT_DUCKING_THRESHOLD
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=-100, max=0)),
+                vol.Required(
+                    CONF_DUCKING_DEPTH,
+                    default=options.get(CONF_DUCKING_DEPTH, DEFAULT_DUCKING_DEPTH),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                vol.Required(
+                    CONF_DUCKING_ATTACK,
+                    default=options.get(CONF_DUCKING_ATTACK, DEFAULT_DUCKING_ATTACK),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=10000)),
+                vol.Required(
+                    CONF_DUCKING_RELEASE,
+                    default=options.get(CONF_DUCKING_RELEASE, DEFAULT_DUCKING_RELEASE),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=10000)),
+                vol.Required(
+                    CONF_DUCKING_RATE,
+                    default=options.get(CONF_DUCKING_RATE, DEFAULT_DUCKING_RATE),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="ducking", data_schema=schema, errors=errors
+        )
+
+    def _strip_choices(self) -> dict[str, str]:
+        """Strip index -> label, from live state when the entry is loaded."""
+        entry = self.config_entry
+        if (
+            entry.state is ConfigEntryState.LOADED
+            and entry.runtime_data.coordinator.data
+        ):
+            state = entry.runtime_data.coordinator.data
+            return {
+                str(strip.index): strip.label
+                or get_strip_label(state.kind, strip.index)
+                for strip in state.strips
+            }
+        kind = entry.data.get(CONF_KIND, DEFAULT_KIND)
+        return {
+            str(index): get_strip_label(kind, index)
+            for index in range(len(STRIP_LABELS[kind]))
+        }
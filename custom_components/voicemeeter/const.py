@@ -7,10 +7,41 @@ CONF_HOST = "host"
 CONF_PORT = "port"
 CONF_KIND = "kind"
 CONF_NAME = "name"
+CONF_TRANSPORT = "transport"
+CONF_STREAM_NAME = "stream_name"
+CONF_SUBTYPE = "subtype"
+
+CONF_COMPACT_ROUTING = "compact_routing"
+CONF_OFFLINE_QUEUE = "offline_queue"
+CONF_OFFLINE_QUEUE_TTL = "offline_queue_ttl"
+CONF_JOURNAL = "journal"
+CONF_DUCKING = "ducking"
+CONF_DUCKING_SOURCE = "ducking_source"
+CONF_DUCKING_TARGETS = "ducking_targets"
+CONF_DUCKING_THRESHOLD = "ducking_threshold"
+CONF_DUCKING_DEPTH = "ducking_depth"
+CONF_DUCKING_ATTACK = "ducking_attack"
+CONF_DUCKING_RELEASE = "ducking_release"
+CONF_DUCKING_RATE = "ducking_rate"
+
+TRANSPORT_WEBSOCKET = "websocket"
+TRANSPORT_VBAN = "vban"
 
 SUPPORTED_PROTOCOL_MAJOR = "1"
+# First protocol version whose companion app accepts "batch" frames.
+BATCH_MIN_PROTOCOL = (1, 1)
 
 DEFAULT_PORT = 27001
+DEFAULT_VBAN_PORT = 6980
+DEFAULT_VBAN_STREAM = "Command1"
+
+DEFAULT_OFFLINE_QUEUE_TTL = 60  # seconds
+
+DEFAULT_DUCKING_THRESHOLD = -30.0  # dB
+DEFAULT_DUCKING_DEPTH = 12.0  # dB
+DEFAULT_DUCKING_ATTACK = 50  # ms
+DEFAULT_DUCKING_RELEASE = 500  # ms
+DEFAULT_DUCKING_RATE = 20  # Hz
 DEFAULT_KIND = "banana"
 
 VOICEMEETER_KINDS = ["basic", "banana", "potato"]
@@ -1,14 +1,46 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import json
+from collections.abc import Callable
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.config_entries import ConfigEntryDisabler
 
-from .const import DOMAIN, LOGGER
-from .data import VoicemeeterState, apply_update_message, parse_state_message
+from .commands import CommandBatcher, OfflineCommandQueue, make_command
+from .const import (
+    BATCH_MIN_PROTOCOL,
+    CONF_OFFLINE_QUEUE,
+    CONF_OFFLINE_QUEUE_TTL,
+    DEFAULT_OFFLINE_QUEUE_TTL,
+    DOMAIN,
+    LOGGER,
+)
+from .data import (
+    ParamChange,
+    VoicemeeterState,
+    apply_update_message,
+    diff_states,
+    get_param,
+    parse_state_message,
+    reported_params,
+    same_layout,
+    state_to_message,
+)
+from .params import ParamSelection, parse_param_unique_id
+from .watchers import async_get_watcher_registry
+
+if TYPE_CHECKING:
+    from .ducking import DuckingEngine
+    from .journal import ChangeJournal
+
+# Key under which decode_frame attaches the parsed VoicemeeterState to a
+# state message.
+PARSED_STATE = "_parsed_state"
 
 
 class VoicemeeterCoordinator(DataUpdateCoordinator[VoicemeeterState | None]):
@@ -26,46 +58,211 @@ class VoicemeeterCoordinator(DataUpdateCoordinator[VoicemeeterState | None]):
             name=DOMAIN,
         )
         self.connected = False
+        self._state_received = asyncio.Event()
+        self._batcher = CommandBatcher(
+            hass, self._async_send_frame, self._supports_batch
+        )
+        self._watchers = async_get_watcher_registry(hass, self.config_entry.entry_id)
+        self._event_listeners: list[Callable[[dict[str, Any]], None]] = []
+        self.selection = self._load_selection()
+
+        options = self.config_entry.options
+        self._offline_ttl = options.get(
+            CONF_OFFLINE_QUEUE_TTL, DEFAULT_OFFLINE_QUEUE_TTL
+        )
+        self._offline_queue = (
+            OfflineCommandQueue(self._offline_ttl)
+            if options.get(CONF_OFFLINE_QUEUE, False)
+            else None
+        )
+        self._offline_window_open = False
+        self._cancel_offline_window: CALLBACK_TYPE | None = None
+        self._offline_queue_shut_down = False
+
+        # Latest per-strip levels (dB). Kept off coordinator.data so meter
+        # traffic never triggers entity updates.
+        self.levels: list[float] = []
+        self.ducking: DuckingEngine | None = None
+        self.journal: ChangeJournal | None = None
+        # Parameter keys the host's first state dump carried, per target.
+        self.reported_params: dict[str, frozenset[str]] = {}
+
+    @property
+    def available(self) -> bool:
+        """
+        Whether entities should accept commands.
+
+        With the offline queue enabled, entities stay available for the
+        queue's TTL after a disconnect so automations firing during e.g. a
+        companion restart are queued instead of being rejected by HA.
+        """
+        return self.connected or self._offline_window_open
+
+    def _load_selection(self) -> ParamSelection:
+        """
+        Materialise core params plus the extended ones with an enabled entity.
+
+        Enabling or disabling an entity reloads the entry, which rebuilds
+        the selection, so it never needs updating while loaded.
+        """
+        entry_id = self.config_entry.entry_id
+        registry = er.async_get(self.hass)
+        selected = []
+        for entity in er.async_entries_for_config_entry(registry, entry_id):
+            if entity.disabled_by is not None:
+                continue
+            param = parse_param_unique_id(entry_id, entity.unique_id)
+            if param is not None:
+                selected.append(param)
+        return ParamSelection(selected)
+
+    async def async_wait_for_state(self) -> None:
+        """Block until the first state message has populated coordinator.data."""
+        await self._state_received.wait()
+
+    @callback
+    def async_add_event_listener(
+        self, listener: Callable[[dict[str, Any]], None]
+    ) -> CALLBACK_TYPE:
+        """
+        Listen for state events, for consumers outside the entity model.
+
+        Events are JSON-ready dicts of one of three shapes:
+            {"type": "state", ...}  full snapshot, when the layout is new
+            {"type": "changes", "changes": [{"target", "index", "param", "value"}]}
+            {"type": "connection", "connected": bool}
+        """
+        self._event_listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._event_listeners.remove(listener)
+
+        return _remove
+
+    @callback
+    def _fire_event(self, event: dict[str, Any]) -> None:
+        for listener in list(self._event_listeners):
+            try:
+                listener(event)
+            except Exception:
+                LOGGER.exception("Error in Voicemeeter event listener")
+
+    # ------------------------------------------------------------------
+    # Outbound commands — called by entities
+    # ------------------------------------------------------------------
+
+    async def async_send_command(
+        self, target: str, index: int, param: str, value: Any
+    ) -> None:
+        """
+        Send a set command to the companion app.
+
+        Commands issued in the same event loop tick are batched into a single
+        frame, so group actions over many entities cost one round trip.
+        """
+        await self.async_send_commands([make_command(target, index, param, value)])
+
+    async def async_send_commands(self, commands: list[dict[str, Any]]) -> None:
+        """Send several commands (built with make_command) in one batch."""
+        if not commands:
+            return
+        if not self.connected and self._offline_queue is not None:
+            LOGGER.debug("Voicemeeter offline, queueing %s commands", len(commands))
+            self._offline_queue.add(*commands)
+            return
+        # Journal what is actually sent: queued commands are recorded when
+        # replayed, and those the queue drops never are.
+        if self.journal:
+            self.journal.record_commands(commands)
+        await self._batcher.async_add(*commands)
+
+    async def _async_send_frame(self, data: dict[str, Any]) -> None:
+        await self.config_entry.runtime_data.transport.send(data)
+
+    def _supports_batch(self) -> bool:
+        if self.data is None:
+            return False
+        try:
+            version = tuple(int(part) for part in self.data.protocol.split(".")[:2])
+        except ValueError:
+            return False
+        return version >= BATCH_MIN_PROTOCOL
 
     # ------------------------------------------------------------------
-    # WebSocket callbacks — called by VoicemeeterWebSocket
+    # Transport callbacks — called by VoicemeeterTransport implementations
     # ------------------------------------------------------------------
 
     @callback
     def handle_connect(self) -> None:
         """
-        Called when the WebSocket connection is established.
+        Called when the connection to the host is established.
 
         We don't set data here — we wait for the state message that the
         companion app sends immediately after connect. That way entities
         only become available once we actually have state, not just a socket.
         """
         self.connected = True
+        self._close_offline_window()
+        if self._event_listeners:
+            self._fire_event({"type": "connection", "connected": True})
         LOGGER.debug("Voicemeeter coordinator: connected")
 
     @callback
     def handle_disconnect(self) -> None:
-        """Called when the WebSocket connection is lost."""
+        """Called when the connection to the host is lost."""
         self.connected = False
+        if self.ducking:
+            self.ducking.async_handle_disconnect()
+        if self._offline_queue is not None and not self._offline_queue_shut_down:
+            self._open_offline_window()
         self.async_update_listeners()
+        if self._event_listeners:
+            self._fire_event({"type": "connection", "connected": False})
         LOGGER.debug("Voicemeeter coordinator: disconnected, entities now unavailable")
 
+    def decode_frame(self, raw: str) -> dict[str, Any]:
+        """
+        Decode a raw frame into a message, parsing state messages up front.
+
+        Thread-safe — it only reads the selection, which is immutable — so
+        transports may run it in the executor for large frames. handle_message
+        then reuses the attached state instead of parsing on the event loop.
+        """
+        msg = json.loads(raw)
+        if msg.get("type") == "state":
+            msg[PARSED_STATE] = parse_state_message(msg, self.selection)
+        return msg
+
     @callback
     def handle_message(self, msg: dict[str, Any]) -> None:
-        """Called for every incoming WebSocket message."""
+        """Called for every incoming message from the transport."""
         msg_type = msg.get("type")
 
         if msg_type == "state":
-            LOGGER.debug(f"Recieved state: {msg}")
+            LOGGER.debug("Received state: %s", msg)
             old_state = self.data
             old_kind = old_state.kind if old_state else None
             old_protocol = old_state.protocol if old_state else None
 
-            parsed_new_state = parse_state_message(msg)
+            parsed_new_state = msg.get(PARSED_STATE) or parse_state_message(
+                msg, self.selection
+            )
+            if not self._state_received.is_set():
+                self.reported_params = reported_params(msg)
             self.async_set_updated_data(parsed_new_state)
+            self._state_received.set()
+            if not same_layout(old_state, parsed_new_state) and self._event_listeners:
+                self._fire_event(state_to_message(parsed_new_state))
+            self._process_changes(diff_states(old_state, parsed_new_state))
+            self._replay_offline_queue(old_state, parsed_new_state)
+            if self.ducking:
+                self.ducking.async_handle_state(parsed_new_state)
 
             if old_kind and old_kind != parsed_new_state.kind:
-                LOGGER.debug(f"New kind ({parsed_new_state.kind}) recieved, reloading entry")
+                LOGGER.debug(
+                    f"New kind ({parsed_new_state.kind}) recieved, reloading entry"
+                )
                 self.hass.async_create_task(
                     self.hass.config_entries.async_reload(self.config_entry.entry_id)
                 )
@@ -74,22 +271,108 @@ class VoicemeeterCoordinator(DataUpdateCoordinator[VoicemeeterState | None]):
                 old_major_ver = old_protocol.split(".")[0]
                 new_major_ver = parsed_new_state.protocol.split(".")[0]
                 if old_major_ver != new_major_ver:
-                    LOGGER.warning("Protocol major version change detected, triggering reload")
+                    LOGGER.warning(
+                        "Protocol major version change detected, triggering reload"
+                    )
                     self.hass.async_create_task(
-                        self.hass.config_entries.async_reload(self.config_entry.entry_id)
+                        self.hass.config_entries.async_reload(
+                            self.config_entry.entry_id
+                        )
                     )
                     return
 
                 # TODO: Notify user
-                pass
+
+        elif msg_type == "levels":
+            self.levels = msg["strips"]
+            if self.ducking:
+                self.ducking.ingest(self.levels)
 
         elif msg_type == "update":
-            LOGGER.debug(f"Voicemeeter: recieved update message: {msg}")
+            LOGGER.debug("Voicemeeter: received update message: %s", msg)
             if self.data is None:
                 # Received an update before the initial state dump — ignore.
                 LOGGER.warning("Voicemeeter: received update before state, ignoring")
                 return
+            if not self.selection.wants(msg["target"], msg["index"], msg["param"]):
+                # Nobody has this parameter's entity enabled.
+                return
+            change = ParamChange(
+                msg["target"], msg["index"], msg["param"], msg["value"]
+            )
+            current = get_param(self.data, change.target, change.index, change.param)
             self.async_set_updated_data(apply_update_message(self.data, msg))
+            if current != change.value:
+                self._process_changes([change])
 
         else:
             LOGGER.debug("Voicemeeter: unknown message type %r, ignoring", msg_type)
+
+    # ------------------------------------------------------------------
+    # Offline queue
+    # ------------------------------------------------------------------
+
+    @callback
+    def _open_offline_window(self) -> None:
+        self._close_offline_window()
+        self._offline_window_open = True
+
+        @callback
+        def _expire(_now: Any) -> None:
+            self._cancel_offline_window = None
+            self._offline_window_open = False
+            self.async_update_listeners()
+
+        self._cancel_offline_window = async_call_later(
+            self.hass, self._offline_ttl, _expire
+        )
+
+    @callback
+    def _close_offline_window(self) -> None:
+        self._offline_window_open = False
+        if self._cancel_offline_window:
+            self._cancel_offline_window()
+            self._cancel_offline_window = None
+
+    @callback
+    def async_shutdown_offline_queue(self) -> None:
+        """
+        Cancel the offline window timer; called on unload.
+
+        Runs before the transport is stopped, whose disconnect callback must
+        then not open a new window (and timer) on the unloaded entry.
+        """
+        self._offline_queue_shut_down = True
+        self._close_offline_window()
+
+    @callback
+    def _replay_offline_queue(
+        self, old_state: VoicemeeterState | None, new_state: VoicemeeterState
+    ) -> None:
+        """Send what was queued while offline, in one batch, after reconnect."""
+        if not self._offline_queue:  # disabled or empty
+            return
+        if old_state and old_state.kind != new_state.kind:
+            # Indices may mean different strips now; don't guess.
+            LOGGER.warning("Voicemeeter kind changed, dropping queued commands")
+            self._offline_queue.clear()
+            return
+        commands = self._offline_queue.drain(new_state)
+        if commands:
+            LOGGER.debug("Replaying %s queued Voicemeeter commands", len(commands))
+            self.hass.async_create_task(
+                self.async_send_commands(commands), name="voicemeeter_offline_replay"
+            )
+
+    @callback
+    def _process_changes(self, changes: list[ParamChange]) -> None:
+        """Evaluate device triggers, journal and notify listeners of what changed."""
+        if not changes:
+            return
+        self._watchers.async_process(changes)
+        if self.journal:
+            self.journal.record_changes(changes)
+        if self._event_listeners:
+            self._fire_event(
+                {"type": "changes", "changes": [asdict(c) for c in changes]}
+            )
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any
 
+from .params import ParamSelection
+
 if TYPE_CHECKING:
     from .coordinator import VoicemeeterCoordinator
-    from .websocket import VoicemeeterWebSocket
+    from .hub import StateHub
+    from .transport import VoicemeeterTransport
 
 
 # ---------------------------------------------------------------------------
@@ -15,27 +18,46 @@ if TYPE_CHECKING:
 
 @dataclass
 class StripData:
+    """
+    One input strip. Parameter values live in a sparse map keyed by the
+    names in params.py, holding only the parameters that are materialised.
+    """
+
     index: int
     label: str
-    mute: bool
-    gain: float
     virtual: bool
-    a1: bool
-    a2: bool
-    a3: bool
-    a4: bool
-    a5: bool
-    b1: bool
-    b2: bool
-    b3: bool
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def mute(self) -> bool:
+        return self.params.get("mute", False)
+
+    @property
+    def gain(self) -> float:
+        return self.params.get("gain", 0.0)
+
+    def get(self, param: str, default: Any = None) -> Any:
+        return self.params.get(param, default)
 
 
 @dataclass
 class BusData:
+    """One output bus, with the same sparse parameter map as StripData."""
+
     index: int
     label: str
-    mute: bool
-    gain: float
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def mute(self) -> bool:
+        return self.params.get("mute", False)
+
+    @property
+    def gain(self) -> float:
+        return self.params.get("gain", 0.0)
+
+    def get(self, param: str, default: Any = None) -> Any:
+        return self.params.get(param, default)
 
 
 @dataclass
@@ -46,6 +68,16 @@ class VoicemeeterState:
     buses: list[BusData] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class ParamChange:
+    """A single parameter that changed value between two states."""
+
+    target: str  # "strip" or "bus"
+    index: int
+    param: str
+    value: Any
+
+
 # ---------------------------------------------------------------------------
 # Runtime data (stored in entry.runtime_data)
 # ---------------------------------------------------------------------------
@@ -54,7 +86,8 @@ class VoicemeeterState:
 @dataclass
 class VoicemeeterRuntimeData:
     coordinator: VoicemeeterCoordinator
-    ws: VoicemeeterWebSocket
+    transport: VoicemeeterTransport
+    hub: StateHub
 
 
 # ---------------------------------------------------------------------------
@@ -62,7 +95,9 @@ class VoicemeeterRuntimeData:
 # ---------------------------------------------------------------------------
 
 
-def parse_state_message(msg: dict[str, Any]) -> VoicemeeterState:
+def parse_state_message(
+    msg: dict[str, Any], selection: ParamSelection | None = None
+) -> VoicemeeterState:
     """
     Parse a full state dump from the companion app.
 
@@ -73,22 +108,18 @@ def parse_state_message(msg: dict[str, Any]) -> VoicemeeterState:
         "strips": [{"index": 0, "label": "Mic", "mute": false, "gain": 0.0, "virtual": false}, ...],
         "buses":  [{"index": 0, "label": "A1",  "mute": false, "gain": 0.0}, ...]
     }
+
+    Extended parameters (see params.py) appear as further keys of a strip or
+    bus. Only the parameters in the selection are kept; without one, only
+    the core parameters are.
     """
+    selection = selection or ParamSelection()
     strips = [
         StripData(
             index=s["index"],
             label=s.get("label", f"Strip {s['index']}"),
-            mute=s["mute"],
-            gain=s["gain"],
             virtual=s["virtual"],
-            a1=s["a1"],
-            a2=s["a2"],
-            a3=s["a3"],
-            a4=s["a4"],
-            a5=s["a5"],
-            b1=s["b1"],
-            b2=s["b2"],
-            b3=s["b3"],
+            params=_pick_params(s, selection.keys_for("strip", s["index"])),
         )
         for s in msg.get("strips", [])
     ]
@@ -97,13 +128,34 @@ def parse_state_message(msg: dict[str, Any]) -> VoicemeeterState:
         BusData(
             index=b["index"],
             label=b.get("label", f"Bus {b['index']}"),
-            mute=b["mute"],
-            gain=b["gain"],
+            params=_pick_params(b, selection.keys_for("bus", b["index"])),
         )
         for b in msg.get("buses", [])
     ]
 
-    return VoicemeeterState(kind=msg["kind"], protocol=msg["protocol"], strips=strips, buses=buses)
+    return VoicemeeterState(
+        kind=msg["kind"], protocol=msg["protocol"], strips=strips, buses=buses
+    )
+
+
+def _pick_params(channel: dict[str, Any], keys: frozenset[str]) -> dict[str, Any]:
+    # Iterate the (small) wanted set, not the message, so the cost doesn't
+    # grow with the number of parameters the companion reports.
+    return {key: channel[key] for key in keys if key in channel}
+
+
+def reported_params(msg: dict[str, Any]) -> dict[str, frozenset[str]]:
+    """
+    The parameter keys a state dump carries, per target.
+
+    Hosts report different subsets of the catalogue (VBAN only has what fits
+    in its RT packet, a companion whatever it implements), so this decides
+    which extended entities are worth creating.
+    """
+    return {
+        "strip": frozenset().union(*msg.get("strips", [])),
+        "bus": frozenset().union(*msg.get("buses", [])),
+    }
 
 
 def apply_update_message(
@@ -117,51 +169,100 @@ def apply_update_message(
 
     Returns a new VoicemeeterState rather than mutating the existing one.
     This keeps coordinator.data immutable between updates, which avoids
-    any risk of partial state being read by an entity mid-update.
+    any risk of partial state being read by an entity mid-update. Only the
+    updated channel is copied; the others are shared with the old state.
     """
     target = msg["target"]  # "strip" or "bus"
     index = msg["index"]
-    param = msg["param"]  # "mute" or "gain" or bus labels
+    param = msg["param"]  # key from params.py
     value = msg["value"]
 
-    new_strips = list(state.strips)
-    new_buses = list(state.buses)
+    new_strips = state.strips
+    new_buses = state.buses
 
     if target == "strip":
         new_strips = [
-            _apply_to_strip(s, param, value) if s.index == index else s
-            for s in new_strips
+            replace(s, params={**s.params, param: value}) if s.index == index else s
+            for s in state.strips
         ]
     elif target == "bus":
         new_buses = [
-            _apply_to_bus(b, param, value) if b.index == index else b for b in new_buses
+            replace(b, params={**b.params, param: value}) if b.index == index else b
+            for b in state.buses
         ]
 
-    return VoicemeeterState(kind=state.kind, protocol=state.protocol, strips=new_strips, buses=new_buses)
-
-
-def _apply_to_strip(strip: StripData, param: str, value: Any) -> StripData:
-    return StripData(
-        index=strip.index,
-        label=strip.label,
-        mute=value if param == "mute" else strip.mute,
-        gain=value if param == "gain" else strip.gain,
-        virtual=strip.virtual,
-        a1=value if param == "a1" else strip.a1,
-        a2=value if param == "a2" else strip.a2,
-        a3=value if param == "a3" else strip.a3,
-        a4=value if param == "a4" else strip.a4,
-        a5=value if param == "a5" else strip.a5,
-        b1=value if param == "b1" else strip.b1,
-        b2=value if param == "b2" else strip.b2,
-        b3=value if param == "b3" else strip.b3,
+    return VoicemeeterState(
+        kind=state.kind, protocol=state.protocol, strips=new_strips, buses=new_buses
     )
 
 
-def _apply_to_bus(bus: BusData, param: str, value: Any) -> BusData:
-    return BusData(
-        index=bus.index,
-        label=bus.label,
-        mute=value if param == "mute" else bus.mute,
-        gain=value if param == "gain" else bus.gain,
+def state_to_message(state: VoicemeeterState) -> dict[str, Any]:
+    """Serialise a state back into the companion's state message shape."""
+    return {
+        "type": "state",
+        "kind": state.kind,
+        "protocol": state.protocol,
+        "strips": [
+            {"index": s.index, "label": s.label, "virtual": s.virtual, **s.params}
+            for s in state.strips
+        ],
+        "buses": [
+            {"index": b.index, "label": b.label, **b.params} for b in state.buses
+        ],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------------
+
+
+def get_param(state: VoicemeeterState, target: str, index: int, param: str) -> Any:
+    """Return the current value of a parameter, or None if it doesn't exist."""
+    channels = state.strips if target == "strip" else state.buses
+    channel = next((c for c in channels if c.index == index), None)
+    if channel is None:
+        return None
+    return channel.params.get(param)
+
+
+def same_layout(old: VoicemeeterState | None, new: VoicemeeterState) -> bool:
+    """True if both states have the same kind, channels and labels."""
+    if old is None or old.kind != new.kind:
+        return False
+    if len(old.strips) != len(new.strips) or len(old.buses) != len(new.buses):
+        return False
+    return all(
+        o.index == n.index and o.label == n.label
+        for o, n in zip(old.strips + old.buses, new.strips + new.buses, strict=True)
     )
+
+
+def diff_states(
+    old: VoicemeeterState | None, new: VoicemeeterState
+) -> list[ParamChange]:
+    """
+    List the parameters whose value differs between two states.
+
+    Channels are matched by index, so a dump that also renames a strip or
+    adds channels still reports the values that changed on the others.
+    Returns nothing when there is no old state to compare with.
+    """
+    if old is None:
+        return []
+
+    changes = []
+    for target, old_channels, new_channels in (
+        ("strip", old.strips, new.strips),
+        ("bus", old.buses, new.buses),
+    ):
+        old_by_index = {channel.index: channel for channel in old_channels}
+        for new_channel in new_channels:
+            old_channel = old_by_index.get(new_channel.index)
+            if old_channel is None or old_channel.params == new_channel.params:
+                continue
+            for param, value in new_channel.params.items():
+                # A parameter the old state didn't have isn't a change of value.
+                if param in old_channel.params and old_channel.params[param] != value:
+                    changes.append(ParamChange(target, new_channel.index, param, value))
+    return changes
@@ -0,0 +1,142 @@
+"""Device conditions for Voicemeeter, read straight from coordinator state."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components.device_automation import (
+    DEVICE_CONDITION_BASE_SCHEMA,
+)
+from homeassistant.components.device_automation.exceptions import (
+    InvalidDeviceAutomationConfig,
+)
+from homeassistant.const import CONF_CONDITION, CONF_DEVICE_ID, CONF_DOMAIN, CONF_TYPE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.condition import ConditionCheckerType
+from homeassistant.helpers.typing import ConfigType, TemplateVarsType
+
+from .const import CONF_SUBTYPE, DOMAIN
+from .data import get_param
+from .watchers import (
+    CONF_INDEX,
+    CONF_PARAM,
+    CONF_TARGET,
+    CONF_THRESHOLD,
+    async_get_coordinator_for_device,
+    iter_automation_targets,
+)
+
+CONDITION_IS_MUTED = "is_muted"
+CONDITION_IS_UNMUTED = "is_unmuted"
+CONDITION_IS_ROUTED = "is_routed"
+CONDITION_IS_UNROUTED = "is_unrouted"
+CONDITION_GAIN_ABOVE = "gain_above"
+CONDITION_GAIN_BELOW = "gain_below"
+
+CONDITION_TYPES = {
+    CONDITION_IS_MUTED,
+    CONDITION_IS_UNMUTED,
+    CONDITION_IS_ROUTED,
+    CONDITION_IS_UNROUTED,
+    CONDITION_GAIN_ABOVE,
+    CONDITION_GAIN_BELOW,
+}
+GAIN_CONDITION_TYPES = {CONDITION_GAIN_ABOVE, CONDITION_GAIN_BELOW}
+
+_TYPES_BY_KIND = {
+    "mute": (CONDITION_IS_MUTED, CONDITION_IS_UNMUTED),
+    "route": (CONDITION_IS_ROUTED, CONDITION_IS_UNROUTED),
+    "gain": (CONDITION_GAIN_ABOVE, CONDITION_GAIN_BELOW),
+}
+
+CONDITION_SCHEMA = DEVICE_CONDITION_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_TYPE): vol.In(CONDITION_TYPES),
+        vol.Required(CONF_TARGET): vol.In(["strip", "bus"]),
+        vol.Required(CONF_INDEX): cv.positive_int,
+        vol.Required(CONF_PARAM): cv.string,
+        vol.Optional(CONF_SUBTYPE): cv.string,
+        vol.Optional(CONF_THRESHOLD): vol.Coerce(float),
+    }
+)
+
+
+async def async_validate_condition_config(
+    hass: HomeAssistant, config: ConfigType
+) -> ConfigType:
+    """Validate config, requiring a threshold for gain conditions."""
+    config = CONDITION_SCHEMA(config)
+    if config[CONF_TYPE] in GAIN_CONDITION_TYPES and CONF_THRESHOLD not in config:
+        raise InvalidDeviceAutomationConfig(
+            f"Condition type {config[CONF_TYPE]} requires a {CONF_THRESHOLD}"
+        )
+    return config
+
+
+async def async_get_conditions(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, Any]]:
+    """List the conditions available for a Voicemeeter device."""
+    coordinator = async_get_coordinator_for_device(hass, device_id)
+    if coordinator is None:
+        return []
+
+    conditions = []
+    for target in iter_automation_targets(coordinator):
+        for condition_type in _TYPES_BY_KIND[target.kind]:
+            conditions.append(
+                {
+                    CONF_CONDITION: "device",
+                    CONF_DOMAIN: DOMAIN,
+                    CONF_DEVICE_ID: device_id,
+                    CONF_TYPE: condition_type,
+                    CONF_TARGET: target.target,
+                    CONF_INDEX: target.index,
+                    CONF_PARAM: target.param,
+                    CONF_SUBTYPE: target.subtype,
+                }
+            )
+    return conditions
+
+
+async def async_get_condition_capabilities(
+    hass: HomeAssistant, config: ConfigType
+) -> dict[str, vol.Schema]:
+    """Gain conditions take a threshold."""
+    if config[CONF_TYPE] not in GAIN_CONDITION_TYPES:
+        return {}
+    return {
+        "extra_fields": vol.Schema({vol.Required(CONF_THRESHOLD): vol.Coerce(float)})
+    }
+
+
+@callback
+def async_condition_from_config(
+    hass: HomeAssistant, config: ConfigType
+) -> ConditionCheckerType:
+    """Build a checker that reads the parameter from the coordinator."""
+    condition_type = config[CONF_TYPE]
+    device_id = config[CONF_DEVICE_ID]
+    key = (config[CONF_TARGET], config[CONF_INDEX], config[CONF_PARAM])
+    threshold = config.get(CONF_THRESHOLD)
+
+    @callback
+    def _check(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        coordinator = async_get_coordinator_for_device(hass, device_id)
+        if coordinator is None or coordinator.data is None:
+            return False
+        value = get_param(coordinator.data, *key)
+        if value is None:
+            return False
+
+        if condition_type in (CONDITION_IS_MUTED, CONDITION_IS_ROUTED):
+            return bool(value)
+        if condition_type in (CONDITION_IS_UNMUTED, CONDITION_IS_UNROUTED):
+            return not value
+        if condition_type == CONDITION_GAIN_ABOVE:
+            return value > threshold
+        return value < threshold
+
+    return _check
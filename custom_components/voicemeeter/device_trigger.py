@@ -0,0 +1,189 @@
+"""
+Device triggers for Voicemeeter.
+
+Triggers are evaluated by the coordinator on the parameters each frame
+actually changed, instead of HA re-rendering template triggers on every
+state change. They fire only on real transitions or threshold crossings.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.components.device_automation.exceptions import (
+    InvalidDeviceAutomationConfig,
+)
+from homeassistant.const import (
+    CONF_DEVICE_ID,
+    CONF_DOMAIN,
+    CONF_PLATFORM,
+    CONF_TYPE,
+)
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+
+from .const import CONF_SUBTYPE, DOMAIN
+from .data import get_param
+from .watchers import (
+    CONF_HYSTERESIS,
+    CONF_INDEX,
+    CONF_PARAM,
+    CONF_TARGET,
+    CONF_THRESHOLD,
+    DEFAULT_HYSTERESIS,
+    GAIN_TRIGGER_TYPES,
+    TRIGGER_GAIN_ABOVE,
+    TRIGGER_GAIN_BELOW,
+    TRIGGER_MUTED,
+    TRIGGER_ROUTED,
+    TRIGGER_TYPES,
+    TRIGGER_UNMUTED,
+    TRIGGER_UNROUTED,
+    ParamWatcher,
+    ThresholdWatcher,
+    TransitionWatcher,
+    async_get_coordinator_for_device,
+    async_get_entry_id_for_device,
+    async_get_watcher_registry,
+    iter_automation_targets,
+)
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_TYPE): vol.In(TRIGGER_TYPES),
+        vol.Required(CONF_TARGET): vol.In(["strip", "bus"]),
+        vol.Required(CONF_INDEX): cv.positive_int,
+        vol.Required(CONF_PARAM): cv.string,
+        vol.Optional(CONF_SUBTYPE): cv.string,
+        vol.Optional(CONF_THRESHOLD): vol.Coerce(float),
+        vol.Optional(CONF_HYSTERESIS, default=DEFAULT_HYSTERESIS): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+
+_TYPES_BY_KIND = {
+    "mute": (TRIGGER_MUTED, TRIGGER_UNMUTED),
+    "route": (TRIGGER_ROUTED, TRIGGER_UNROUTED),
+    "gain": (TRIGGER_GAIN_ABOVE, TRIGGER_GAIN_BELOW),
+}
+
+
+async def async_validate_trigger_config(
+    hass: HomeAssistant, config: ConfigType
+) -> ConfigType:
+    """Validate config, requiring a threshold for gain triggers."""
+    config = TRIGGER_SCHEMA(config)
+    if config[CONF_TYPE] in GAIN_TRIGGER_TYPES and CONF_THRESHOLD not in config:
+        raise InvalidDeviceAutomationConfig(
+            f"Trigger type {config[CONF_TYPE]} requires a {CONF_THRESHOLD}"
+        )
+    return config
+
+
+async def async_get_triggers(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, Any]]:
+    """List the triggers available for a Voicemeeter device."""
+    coordinator = async_get_coordinator_for_device(hass, device_id)
+    if coordinator is None:
+        return []
+
+    triggers = []
+    for target in iter_automation_targets(coordinator):
+        for trigger_type in _TYPES_BY_KIND[target.kind]:
+            triggers.append(
+                {
+                    CONF_PLATFORM: "device",
+                    CONF_DOMAIN: DOMAIN,
+                    CONF_DEVICE_ID: device_id,
+                    CONF_TYPE: trigger_type,
+                    CONF_TARGET: target.target,
+                    CONF_INDEX: target.index,
+                    CONF_PARAM: target.param,
+                    CONF_SUBTYPE: target.subtype,
+                }
+            )
+    return triggers
+
+
+async def async_get_trigger_capabilities(
+    hass: HomeAssistant, config: ConfigType
+) -> dict[str, vol.Schema]:
+    """Gain triggers take a threshold and hysteresis."""
+    if config[CONF_TYPE] not in GAIN_TRIGGER_TYPES:
+        return {}
+    return {
+        "extra_fields": vol.Schema(
+            {
+                vol.Required(CONF_THRESHOLD): vol.Coerce(float),
+                vol.Optional(CONF_HYSTERESIS, default=DEFAULT_HYSTERESIS): vol.Coerce(
+                    float
+                ),
+            }
+        )
+    }
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Attach a watcher for this trigger to the entry's watcher registry."""
+    entry_id = async_get_entry_id_for_device(hass, config[CONF_DEVICE_ID])
+    if entry_id is None:
+        raise InvalidDeviceAutomationConfig(
+            f"Device {config[CONF_DEVICE_ID]} is not a Voicemeeter device"
+        )
+
+    target = config[CONF_TARGET]
+    index = config[CONF_INDEX]
+    param = config[CONF_PARAM]
+
+    # If the entry is loaded, seed the watcher with the current value so
+    # attaching doesn't fire. Otherwise it arms on the first value it sees.
+    initial = None
+    coordinator = async_get_coordinator_for_device(hass, config[CONF_DEVICE_ID])
+    if coordinator is not None and coordinator.data is not None:
+        initial = get_param(coordinator.data, target, index, param)
+
+    watcher = _create_watcher(config, initial)
+    job = HassJob(action, f"voicemeeter device trigger {trigger_info}")
+    trigger_data = trigger_info["trigger_data"]
+
+    @callback
+    def _fire(value: Any) -> None:
+        hass.async_run_hass_job(
+            job,
+            {
+                "trigger": {
+                    **trigger_data,
+                    **config,
+                    "value": value,
+                    "description": f"{config[CONF_TYPE]} on {target} {index} {param}",
+                }
+            },
+        )
+
+    registry = async_get_watcher_registry(hass, entry_id)
+    return registry.async_add((target, index, param), watcher, _fire)
+
+
+def _create_watcher(config: ConfigType, initial: Any) -> ParamWatcher:
+    trigger_type = config[CONF_TYPE]
+    if trigger_type in GAIN_TRIGGER_TYPES:
+        return ThresholdWatcher(
+            above=trigger_type == TRIGGER_GAIN_ABOVE,
+            threshold=config[CONF_THRESHOLD],
+            hysteresis=config[CONF_HYSTERESIS],
+            initial=initial,
+        )
+    return TransitionWatcher(
+        to=trigger_type in (TRIGGER_MUTED, TRIGGER_ROUTED), initial=initial
+    )
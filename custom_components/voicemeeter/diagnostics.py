@@ -0,0 +1,52 @@
+"""Diagnostics for Voicemeeter config entries."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_HOST
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """
+    Report connection lifecycle counters alongside the current state.
+
+    Connect/disconnect counts and the number of running voicemeeter tasks
+    make it easy to spot a connection loop that leaks across reconnects.
+    """
+    coordinator = entry.runtime_data.coordinator
+    transport = entry.runtime_data.transport
+    state = coordinator.data
+
+    voicemeeter_tasks = [
+        task.get_name()
+        for task in asyncio.all_tasks()
+        if task.get_name().startswith("voicemeeter")
+    ]
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "connected": coordinator.connected,
+        "transport": type(transport).__name__,
+        "stats": asdict(transport.stats),
+        "tasks": voicemeeter_tasks,
+        "state": {
+            "kind": state.kind,
+            "protocol": state.protocol,
+            "strips": len(state.strips),
+            "buses": len(state.buses),
+            "params": sum(len(c.params) for c in state.strips + state.buses),
+        }
+        if state
+        else None,
+    }
@@ -0,0 +1,239 @@
+"""
+Auto-ducking: lower target strips while a source strip (e.g. a mic) is active.
+
+Runs entirely inside the integration at a fixed control rate, fed by the
+level messages the coordinator receives, so no HA automation or service
+call sits between the mic opening and the music dipping.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .commands import make_command
+from .const import (
+    CONF_DUCKING_ATTACK,
+    CONF_DUCKING_DEPTH,
+    CONF_DUCKING_RATE,
+    CONF_DUCKING_RELEASE,
+    CONF_DUCKING_SOURCE,
+    CONF_DUCKING_TARGETS,
+    CONF_DUCKING_THRESHOLD,
+    DEFAULT_DUCKING_ATTACK,
+    DEFAULT_DUCKING_DEPTH,
+    DEFAULT_DUCKING_RATE,
+    DEFAULT_DUCKING_RELEASE,
+    DEFAULT_DUCKING_THRESHOLD,
+    LOGGER,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import VoicemeeterCoordinator
+    from .data import VoicemeeterState
+
+GAIN_DECIMALS = 1  # 0.1 dB, matches the gain sliders' step
+MIN_GAIN = -60.0  # dB, bottom of Voicemeeter's fader range
+
+
+@dataclass(frozen=True)
+class DuckingConfig:
+    source: int  # strip whose level opens the ducker
+    targets: tuple[int, ...]  # strips that get ducked
+    threshold: float  # dB level above which the source counts as active
+    depth: float  # dB of attenuation when fully ducked
+    attack: float  # seconds to reach full depth
+    release: float  # seconds to return to no attenuation
+    rate: float  # control updates per second
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> DuckingConfig:
+        return cls(
+            source=int(options[CONF_DUCKING_SOURCE]),
+            targets=tuple(int(t) for t in options.get(CONF_DUCKING_TARGETS, [])),
+            threshold=options.get(CONF_DUCKING_THRESHOLD, DEFAULT_DUCKING_THRESHOLD),
+            depth=options.get(CONF_DUCKING_DEPTH, DEFAULT_DUCKING_DEPTH),
+            attack=options.get(CONF_DUCKING_ATTACK, DEFAULT_DUCKING_ATTACK) / 1000,
+            release=options.get(CONF_DUCKING_RELEASE, DEFAULT_DUCKING_RELEASE) / 1000,
+            rate=options.get(CONF_DUCKING_RATE, DEFAULT_DUCKING_RATE),
+        )
+
+
+class DuckingEngine:
+    """
+    Threshold/attack/release envelope driving target strip gains.
+
+    Levels are peak-held between control ticks so short bursts aren't missed.
+    On every tick the attenuation moves towards full depth (source active)
+    or zero (source quiet) by at most one attack/release step, and the
+    resulting target gains go out as one batch — only when they changed.
+
+    The gains the targets had when ducking began are restored on release.
+    A dropped connection releases at once: the held level is forgotten and
+    the restore is sent with the first state after reconnecting.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: VoicemeeterCoordinator,
+        config: DuckingConfig,
+    ) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self._config = config
+
+        # Per-tick envelope steps; a zero time constant means an instant jump.
+        interval = 1 / config.rate
+        self._attack_step = config.depth
+        if config.attack:
+            self._attack_step = config.depth * interval / config.attack
+        self._release_step = config.depth
+        if config.release:
+            self._release_step = config.depth * interval / config.release
+
+        self._level: float | None = None
+        self._peak: float | None = None
+        self._attenuation = 0.0
+        self._base_gains: dict[int, float] = {}
+        self._sent_gains: dict[int, float] = {}
+        # Base gains to restore once the host is back, after a disconnect.
+        self._restore_gains: dict[int, float] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start the fixed-rate control loop."""
+        self._unsub_timer = async_track_time_interval(
+            self._hass,
+            self._async_tick,
+            timedelta(seconds=1 / self._config.rate),
+            name="voicemeeter_ducking",
+        )
+
+    async def async_stop(self) -> None:
+        """
+        Stop the control loop, restoring target gains if still ducked.
+
+        Returns once the restore has been sent, so callers can stop the
+        transport afterwards without losing it.
+        """
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._base_gains:
+            commands = self._commands(self._base_gains)
+            self._base_gains = {}
+            if commands:
+                await self._coordinator.async_send_commands(commands)
+
+    @callback
+    def async_handle_disconnect(self) -> None:
+        """
+        Release without waiting for levels that won't come while offline.
+
+        Otherwise a source that was loud when the connection dropped would
+        hold the targets ducked for the whole outage. Nothing is sent now:
+        it could only be dropped or land in the offline queue.
+        """
+        self._level = None
+        self._peak = None
+        if self._attenuation:
+            self._attenuation = 0.0
+            self._restore_gains = self._base_gains
+            self._base_gains = {}
+
+    @callback
+    def async_handle_state(self, state: VoicemeeterState) -> None:
+        """Restore targets a disconnect left ducked, given the host's state."""
+        if not self._restore_gains:
+            return
+        restore, self._restore_gains = self._restore_gains, {}
+        gains = {strip.index: strip.gain for strip in state.strips}
+        # Leave targets alone that were changed by other means meanwhile.
+        commands = [
+            make_command("strip", index, "gain", base)
+            for index, base in restore.items()
+            if gains.get(index) == self._sent_gains.get(index) != base
+        ]
+        self._sent_gains.update(restore)
+        if commands:
+            self._hass.async_create_task(
+                self._coordinator.async_send_commands(commands),
+                name="voicemeeter_ducking_send",
+            )
+
+    @callback
+    def ingest(self, levels: list[float]) -> None:
+        """Take a per-strip level frame (dB) from the coordinator."""
+        if self._config.source >= len(levels):
+            return
+        level = levels[self._config.source]
+        self._peak = level if self._peak is None else max(self._peak, level)
+
+    @callback
+    def _async_tick(self, _now: Any = None) -> None:
+        if self._peak is not None:
+            self._level = self._peak
+            self._peak = None
+
+        active = self._level is not None and self._level > self._config.threshold
+        if active:
+            attenuation = min(self._config.depth, self._attenuation + self._attack_step)
+        else:
+            attenuation = max(0.0, self._attenuation - self._release_step)
+
+        if attenuation == self._attenuation:
+            return
+
+        if self._attenuation == 0.0:
+            self._capture_base_gains()
+        self._attenuation = attenuation
+
+        if attenuation == 0.0:
+            self._send(self._base_gains)
+            self._base_gains = {}
+            return
+
+        self._send(
+            {
+                index: max(MIN_GAIN, round(base - attenuation, GAIN_DECIMALS))
+                for index, base in self._base_gains.items()
+            }
+        )
+
+    def _capture_base_gains(self) -> None:
+        state = self._coordinator.data
+        if state is None:
+            return
+        self._base_gains = {
+            strip.index: strip.gain
+            for strip in state.strips
+            if strip.index in self._config.targets
+        }
+        self._sent_gains = dict(self._base_gains)
+
+    def _commands(self, gains: dict[int, float]) -> list[dict[str, Any]]:
+        """Gain commands for the targets whose gain differs from the last sent."""
+        commands = [
+            make_command("strip", index, "gain", gain)
+            for index, gain in gains.items()
+            if self._sent_gains.get(index) != gain
+        ]
+        self._sent_gains.update(gains)
+        return commands
+
+    def _send(self, gains: dict[int, float]) -> None:
+        commands = self._commands(gains)
+        if not commands:
+            return
+        LOGGER.debug("Ducking: attenuation %.1f dB", self._attenuation)
+        self._hass.async_create_task(
+            self._coordinator.async_send_commands(commands),
+            name="voicemeeter_ducking_send",
+        )
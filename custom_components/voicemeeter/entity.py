@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from homeassistant.const import ATTR_RESTORED, EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, get_bus_label, get_strip_label
 from .coordinator import VoicemeeterCoordinator
+from .params import ParamSpec, extended_specs, param_unique_id
 
 
 class VoicemeeterEntity(CoordinatorEntity[VoicemeeterCoordinator]):
@@ -16,7 +23,7 @@ class VoicemeeterEntity(CoordinatorEntity[VoicemeeterCoordinator]):
 
     @property
     def available(self) -> bool:
-        return self.coordinator.connected
+        return self.coordinator.available
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -27,3 +34,123 @@ class VoicemeeterEntity(CoordinatorEntity[VoicemeeterCoordinator]):
             manufacturer="VB-Audio",
             model="Voicemeeter Remote",
         )
+
+
+class VoicemeeterParamEntity(VoicemeeterEntity):
+    """
+    Entity for one extended parameter of one strip or bus.
+
+    These are generated from the params.py catalogue and disabled by
+    default. The coordinator only keeps values for parameters whose entity
+    is enabled, so enabling one reloads the entry to start tracking it.
+    """
+
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: VoicemeeterCoordinator,
+        entry_id: str,
+        spec: ParamSpec,
+        index: int,
+    ) -> None:
+        super().__init__(coordinator, entry_id)
+        self._spec = spec
+        self._index = index
+        self._attr_unique_id = param_unique_id(entry_id, spec.target, index, spec.key)
+
+    @property
+    def name(self) -> str:
+        channel = self._channel
+        kind = self.coordinator.data.kind if self.coordinator.data else "banana"
+        if channel and channel.label:
+            label = channel.label
+        elif self._spec.target == "strip":
+            label = get_strip_label(kind, self._index)
+        else:
+            label = get_bus_label(kind, self._index)
+        return f"{label} {self._spec.name}"
+
+    @property
+    def _channel(self):
+        if not self.coordinator.data:
+            return None
+        channels = (
+            self.coordinator.data.strips
+            if self._spec.target == "strip"
+            else self.coordinator.data.buses
+        )
+        return next((c for c in channels if c.index == self._index), None)
+
+    @property
+    def _value(self) -> Any:
+        channel = self._channel
+        return channel.get(self._spec.key) if channel else None
+
+    async def _async_set(self, value: Any) -> None:
+        await self.coordinator.async_send_command(
+            self._spec.target, self._index, self._spec.key, value
+        )
+
+
+def iter_param_entities(
+    coordinator: VoicemeeterCoordinator,
+    entry_id: str,
+    value_type: type,
+    entity_cls: Callable[..., VoicemeeterParamEntity],
+) -> Iterator[VoicemeeterParamEntity]:
+    """
+    Create the extended parameter entities of one platform for the layout.
+
+    Only parameters the host reports get an entity; one it never sends a
+    value for would stay unknown forever.
+    """
+    state = coordinator.data
+    reported = coordinator.reported_params
+    for spec in extended_specs("strip", value_type):
+        if spec.key not in reported.get("strip", ()):
+            continue
+        for strip in state.strips:
+            if spec.applies_to(state.kind, strip.virtual):
+                yield entity_cls(coordinator, entry_id, spec, strip.index)
+    for spec in extended_specs("bus", value_type):
+        if spec.key not in reported.get("bus", ()):
+            continue
+        for bus in state.buses:
+            if state.kind in spec.kinds:
+                yield entity_cls(coordinator, entry_id, spec, bus.index)
+
+
+@callback
+def async_set_hidden_by_mode(
+    hass: HomeAssistant, platform: str, unique_ids: Iterable[str], *, hidden: bool
+) -> None:
+    """
+    Disable or re-enable the registered entities an option replaces.
+
+    Disabling rather than removing them keeps the user's names, icons and
+    areas for when the option is switched back. Only entities disabled here
+    are re-enabled; ones the user disabled stay disabled.
+
+    Re-enabling makes HA's EntityRegistryDisabledHandler reload the entry
+    once more, 30 s later. Hiding instead would avoid that but keep every
+    replaced entity loaded, which is what the option exists to avoid.
+    """
+    registry = er.async_get(hass)
+    for unique_id in unique_ids:
+        entity_id = registry.async_get_entity_id(platform, DOMAIN, unique_id)
+        if entity_id is None:
+            continue
+        disabled_by = registry.entities[entity_id].disabled_by
+        if hidden and disabled_by is None:
+            registry.async_update_entity(
+                entity_id, disabled_by=er.RegistryEntryDisabler.INTEGRATION
+            )
+            # The unload before this setup left an "unavailable" placeholder,
+            # which HA only cleans up for removed entities.
+            state = hass.states.get(entity_id)
+            if state is not None and state.attributes.get(ATTR_RESTORED):
+                hass.states.async_remove(entity_id)
+        elif not hidden and disabled_by is er.RegistryEntryDisabler.INTEGRATION:
+            registry.async_update_entity(entity_id, disabled_by=None)
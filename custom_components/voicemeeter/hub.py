@@ -0,0 +1,184 @@
+"""
+Local fan-out of Voicemeeter state over Home Assistant's WebSocket API.
+
+Dashboards and bridges subscribe here instead of opening their own
+connections to the companion app. Each subscriber gets the current snapshot
+followed by incremental changes, and can send commands that are forwarded
+through the entry's single upstream connection.
+
+    {"type": "voicemeeter/subscribe", "entry_id": "..."}
+    {"type": "voicemeeter/set", "entry_id": "...", "commands": [...]}
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.json import json_dumps
+
+from .commands import make_command
+from .const import DOMAIN
+from .coordinator import VoicemeeterCoordinator
+from .data import VoicemeeterRuntimeData, state_to_message
+from .script import Layout, ScriptError, check_command
+
+COMMAND_SCHEMA = vol.Schema(
+    {
+        vol.Required("target"): vol.In(["strip", "bus"]),
+        vol.Required("index"): cv.positive_int,
+        vol.Required("param"): cv.string,
+        vol.Required("value"): vol.Any(bool, vol.Coerce(float)),
+    }
+)
+
+
+class StateHub:
+    """
+    Pushes one entry's state events to any number of WebSocket subscribers.
+
+    The hub holds a single coordinator event listener for all subscribers and
+    serialises each event once, however many subscribers there are.
+    """
+
+    def __init__(self, coordinator: VoicemeeterCoordinator) -> None:
+        self._coordinator = coordinator
+        self._subscribers: dict[tuple[websocket_api.ActiveConnection, int], None] = {}
+        self._unsub_events: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self, connection: websocket_api.ActiveConnection, msg_id: int
+    ) -> CALLBACK_TYPE:
+        """Add a subscriber and send it the current snapshot."""
+        if not self._subscribers:
+            self._unsub_events = self._coordinator.async_add_event_listener(
+                self._handle_event
+            )
+        self._subscribers[(connection, msg_id)] = None
+
+        if self._coordinator.data is not None:
+            connection.send_message(
+                websocket_api.event_message(
+                    msg_id, state_to_message(self._coordinator.data)
+                )
+            )
+        connection.send_message(
+            websocket_api.event_message(
+                msg_id, {"type": "connection", "connected": self._coordinator.connected}
+            )
+        )
+
+        @callback
+        def _unsubscribe() -> None:
+            self._subscribers.pop((connection, msg_id), None)
+            if not self._subscribers and self._unsub_events:
+                self._unsub_events()
+                self._unsub_events = None
+
+        return _unsubscribe
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Tell subscribers the entry went away and drop their subscriptions."""
+        self._handle_event({"type": "unloaded"})
+        for connection, msg_id in list(self._subscribers):
+            unsub = connection.subscriptions.pop(msg_id, None)
+            if unsub:
+                unsub()
+        self._subscribers.clear()
+
+    @callback
+    def _handle_event(self, event: dict[str, Any]) -> None:
+        payload = json_dumps(event)
+        for connection, msg_id in list(self._subscribers):
+            connection.send_message(
+                f'{{"id":{msg_id},"type":"event","event":{payload}}}'
+            )
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the voicemeeter/* WebSocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe)
+    websocket_api.async_register_command(hass, ws_set)
+
+
+@callback
+def _get_runtime_data(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> VoicemeeterRuntimeData | None:
+    entry = hass.config_entries.async_get_entry(msg["entry_id"])
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+    ):
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Voicemeeter entry not loaded"
+        )
+        return None
+    return entry.runtime_data
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voicemeeter/subscribe",
+        vol.Required("entry_id"): cv.string,
+    }
+)
+@callback
+def ws_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Subscribe to the snapshot and changes of one Voicemeeter entry."""
+    runtime_data = _get_runtime_data(hass, connection, msg)
+    if runtime_data is None:
+        return
+    connection.send_result(msg["id"])
+    connection.subscriptions[msg["id"]] = runtime_data.hub.async_subscribe(
+        connection, msg["id"]
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voicemeeter/set",
+        vol.Required("entry_id"): cv.string,
+        vol.Required("commands"): vol.All(cv.ensure_list, [COMMAND_SCHEMA]),
+    }
+)
+@websocket_api.async_response
+async def ws_set(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """
+    Forward commands through the entry's upstream connection as one batch.
+
+    Every command is checked against the parameter catalogue and the current
+    layout first; if one is invalid, none are sent.
+    """
+    runtime_data = _get_runtime_data(hass, connection, msg)
+    if runtime_data is None:
+        return
+    coordinator = runtime_data.coordinator
+    layout = Layout.from_state(coordinator.data)
+    try:
+        commands = [
+            make_command(
+                c["target"],
+                c["index"],
+                c["param"],
+                check_command(c["target"], c["index"], c["param"], c["value"], layout),
+            )
+            for c in msg["commands"]
+        ]
+    except ScriptError as err:
+        connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, str(err))
+        return
+    await coordinator.async_send_commands(commands)
+    connection.send_result(msg["id"])
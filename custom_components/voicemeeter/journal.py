@@ -0,0 +1,164 @@
+"""
+Change journal: a compact audit trail of mixer changes.
+
+Every applied change (from the host) and every outbound command is recorded
+in a bounded in-memory buffer for queries, and appended to a rotating JSON
+lines file. File writes are batched and done in the executor, so sustained
+fader traffic costs one list append per change on the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import LOGGER
+from .data import ParamChange
+
+FLUSH_INTERVAL = timedelta(seconds=2)
+FLUSH_BATCH = 500  # pending records that trigger an early flush
+MAX_PENDING = 10_000  # records held for writing before the oldest are dropped
+HISTORY_SIZE = 1_000  # records kept in memory for get_history
+MAX_BYTES = 5 * 1024 * 1024  # journal file size before rotating
+BACKUP_COUNT = 3  # rotated files kept next to the live one
+
+SOURCE_HOST = "host"  # change applied by Voicemeeter
+SOURCE_COMMAND = "command"  # command sent by the integration
+
+
+class ChangeJournal:
+    """Buffers change records and writes them out in batches."""
+
+    def __init__(self, hass: HomeAssistant, path: Path) -> None:
+        self._hass = hass
+        self._path = path
+        self._history: deque[dict[str, Any]] = deque(maxlen=HISTORY_SIZE)
+        self._pending: deque[dict[str, Any]] = deque(maxlen=MAX_PENDING)
+        self._dropped = 0
+        self._flush_task: asyncio.Task[None] | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start the periodic flush."""
+        self._unsub_timer = async_track_time_interval(
+            self._hass,
+            self._async_scheduled_flush,
+            FLUSH_INTERVAL,
+            name="voicemeeter_journal_flush",
+        )
+
+    async def async_stop(self) -> None:
+        """Stop the periodic flush and write out what is left."""
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._flush_task:
+            await self._flush_task
+        await self._async_flush()
+
+    @callback
+    def record_changes(self, changes: list[ParamChange]) -> None:
+        """Record changes reported by the host."""
+        now = round(time.time(), 3)
+        for change in changes:
+            self._append(
+                {
+                    "t": now,
+                    "src": SOURCE_HOST,
+                    "target": change.target,
+                    "index": change.index,
+                    "param": change.param,
+                    "value": change.value,
+                }
+            )
+
+    @callback
+    def record_commands(self, commands: list[dict[str, Any]]) -> None:
+        """Record commands sent (or queued) by the integration."""
+        now = round(time.time(), 3)
+        for command in commands:
+            self._append({"t": now, "src": SOURCE_COMMAND, **command})
+
+    @callback
+    def history(
+        self,
+        limit: int,
+        target: str | None = None,
+        index: int | None = None,
+        param: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the newest matching records, most recent first."""
+        records = []
+        for record in reversed(self._history):
+            if target is not None and record["target"] != target:
+                continue
+            if index is not None and record["index"] != index:
+                continue
+            if param is not None and record["param"] != param:
+                continue
+            records.append(record)
+            if len(records) >= limit:
+                break
+        return records
+
+    def _append(self, record: dict[str, Any]) -> None:
+        self._history.append(record)
+        if len(self._pending) == MAX_PENDING:
+            self._dropped += 1
+        self._pending.append(record)
+        if len(self._pending) >= FLUSH_BATCH:
+            self._schedule_flush()
+
+    @callback
+    def _async_scheduled_flush(self, _now: Any = None) -> None:
+        if self._pending:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None:
+            self._flush_task = self._hass.async_create_task(
+                self._async_flush(), name="voicemeeter_journal_flush"
+            )
+
+    async def _async_flush(self) -> None:
+        try:
+            if self._dropped:
+                LOGGER.warning(
+                    "Voicemeeter journal fell behind, dropped %s records", self._dropped
+                )
+                self._dropped = 0
+            if not self._pending:
+                return
+            # Records are never mutated once appended, so the executor can
+            # serialise them while the loop keeps appending new ones.
+            records = list(self._pending)
+            self._pending.clear()
+            await self._hass.async_add_executor_job(self._write, records)
+        except OSError as err:
+            LOGGER.error("Failed to write Voicemeeter journal: %s", err)
+        finally:
+            self._flush_task = None
+
+    def _write(self, records: list[dict[str, Any]]) -> None:
+        """Append records to the journal, rotating first if it grew too big."""
+        lines = "".join(
+            json.dumps(record, separators=(",", ":")) + "\n" for record in records
+        )
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        if self._path.exists() and self._path.stat().st_size >= MAX_BYTES:
+            for n in range(BACKUP_COUNT - 1, 0, -1):
+                older = self._path.with_name(f"{self._path.name}.{n}")
+                if older.exists():
+                    older.replace(self._path.with_name(f"{self._path.name}.{n + 1}"))
+            self._path.replace(self._path.with_name(f"{self._path.name}.1"))
+        with self._path.open("a", encoding="utf-8") as file:
+            file.write(lines)
@@ -8,7 +8,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import get_bus_label, get_strip_label
 from .coordinator import VoicemeeterCoordinator
-from .entity import VoicemeeterEntity
+from .entity import VoicemeeterEntity, VoicemeeterParamEntity, iter_param_entities
+from .params import ParamSpec
 
 
 async def async_setup_entry(
@@ -22,6 +23,9 @@ async def async_setup_entry(
         entities.append(StripGainNumber(coordinator, entry.entry_id, strip.index))
     for bus in coordinator.data.buses:
         entities.append(BusGainNumber(coordinator, entry.entry_id, bus.index))
+    entities.extend(
+        iter_param_entities(coordinator, entry.entry_id, float, VoicemeeterParamNumber)
+    )
     async_add_entities(entities)
 
 
@@ -62,15 +66,7 @@ class StripGainNumber(VoicemeeterEntity, NumberEntity):
         )
 
     async def async_set_native_value(self, value: float) -> None:
-        await self.coordinator.config_entry.runtime_data.ws.send(
-            {
-                "type": "set",
-                "target": "strip",
-                "index": self._index,
-                "param": "gain",
-                "value": value,
-            }
-        )
+        await self.coordinator.async_send_command("strip", self._index, "gain", value)
 
 
 class BusGainNumber(VoicemeeterEntity, NumberEntity):
@@ -92,8 +88,9 @@ class BusGainNumber(VoicemeeterEntity, NumberEntity):
     def name(self) -> str:
         if not self.coordinator.data:
             return f"Bus {self._index} Master Gain"
-        if self._bus.label:
-            return f"{self._bus.label} Master Gain"
+        bus = self._bus
+        if bus and bus.label:
+            return f"{bus.label} Master Gain"
         return f"{get_bus_label(self.coordinator.data.kind, self._index)} Master Gain"
 
     @property
@@ -110,12 +107,30 @@ class BusGainNumber(VoicemeeterEntity, NumberEntity):
         )
 
     async def async_set_native_value(self, value: float) -> None:
-        await self.coordinator.config_entry.runtime_data.ws.send(
-            {
-                "type": "set",
-                "target": "bus",
-                "index": self._index,
-                "param": "gain",
-                "value": value,
-            }
-        )
+        await self.coordinator.async_send_command("bus", self._index, "gain", value)
+
+
+class VoicemeeterParamNumber(VoicemeeterParamEntity, NumberEntity):
+    """Numeric parameter from the extended catalogue in params.py."""
+
+    _attr_mode = NumberMode.SLIDER
+
+    def __init__(
+        self,
+        coordinator: VoicemeeterCoordinator,
+        entry_id: str,
+        spec: ParamSpec,
+        index: int,
+    ) -> None:
+        super().__init__(coordinator, entry_id, spec, index)
+        self._attr_native_min_value = spec.min
+        self._attr_native_max_value = spec.max
+        self._attr_native_step = spec.step
+        self._attr_native_unit_of_measurement = spec.unit
+
+    @property
+    def native_value(self) -> float | None:
+        return self._value
+
+    async def async_set_native_value(self, value: float) -> None:
+        await self._async_set(value)
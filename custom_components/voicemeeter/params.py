@@ -0,0 +1,213 @@
+"""
+Schema of the Voicemeeter parameters the integration knows about.
+
+Each strip and bus holds a sparse map of parameter values. Only "core"
+parameters (mute, gain, routing) are always kept; the extended ones (EQ,
+pan, dynamics, bus modes, gain layers, ...) are only materialised for the
+channels whose entity the user has enabled. Entities for extended
+parameters are generated from this catalogue and disabled by default, so
+growing the catalogue costs nothing for channels nobody uses.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from .const import VOICEMEETER_KINDS
+
+ALL_KINDS = frozenset(VOICEMEETER_KINDS)
+BANANA_UP = frozenset({"banana", "potato"})
+POTATO = frozenset({"potato"})
+BASIC = frozenset({"basic"})
+
+
+@dataclass(frozen=True)
+class ParamSpec:
+    """One parameter of a strip or bus."""
+
+    key: str  # integration name, as used in messages and unique ids
+    target: str  # "strip" or "bus"
+    script: str  # Voicemeeter script name, e.g. "EQ.on" or "GainLayer[0]"
+    name: str  # entity name suffix
+    kind: type = bool  # bool params become switches, float params numbers
+    min: float = 0.0
+    max: float = 1.0
+    step: float = 0.1
+    unit: str | None = None
+    kinds: frozenset[str] = ALL_KINDS  # Voicemeeter variants that have it
+    virtual: bool | None = None  # strips only: None = both, else only that type
+    core: bool = False  # always materialised, has a hand-written entity
+
+    def applies_to(self, kind: str, virtual: bool) -> bool:
+        if kind not in self.kinds:
+            return False
+        return self.virtual is None or self.virtual == virtual
+
+
+def _bool(target: str, key: str, script: str, name: str, **kwargs) -> ParamSpec:
+    return ParamSpec(key, target, script, name, bool, **kwargs)
+
+
+def _float(
+    target: str,
+    key: str,
+    script: str,
+    name: str,
+    lo: float,
+    hi: float,
+    step: float = 0.1,
+    unit: str | None = None,
+    **kwargs,
+) -> ParamSpec:
+    return ParamSpec(key, target, script, name, float, lo, hi, step, unit, **kwargs)
+
+
+_ROUTES = ["a1", "a2", "a3", "a4", "a5", "b1", "b2", "b3"]
+
+_BUS_MODES = [
+    ("normal", "Normal"),
+    ("amix", "Mix Down A"),
+    ("bmix", "Mix Down B"),
+    ("repeat", "Stereo Repeat"),
+    ("composite", "Composite"),
+    ("tvmix", "Up Mix TV"),
+    ("upmix21", "Up Mix 2.1"),
+    ("upmix41", "Up Mix 4.1"),
+    ("upmix61", "Up Mix 6.1"),
+    ("centeronly", "Center Only"),
+    ("lfeonly", "LFE Only"),
+    ("rearonly", "Rear Only"),
+]
+
+PARAMETERS: tuple[ParamSpec, ...] = (
+    # Core strip parameters
+    _bool("strip", "mute", "Mute", "Mute", core=True),
+    _float("strip", "gain", "Gain", "Gain", -60.0, 12.0, unit="dB", core=True),
+    *(_bool("strip", r, r.upper(), r.upper(), core=True) for r in _ROUTES),
+    # Extended strip parameters
+    _bool("strip", "solo", "Solo", "Solo"),
+    _bool("strip", "mono", "Mono", "Mono"),
+    _bool("strip", "mc", "MC", "Mute Center", virtual=True),
+    _float("strip", "pan_x", "Pan_x", "Pan", -0.5, 0.5, 0.01),
+    _float(
+        "strip", "color_x", "Color_x", "Color Panel", -0.5, 0.5, 0.01, virtual=False
+    ),
+    _float("strip", "comp", "Comp", "Compressor", 0.0, 10.0, virtual=False),
+    _float("strip", "gate", "Gate", "Gate", 0.0, 10.0, virtual=False),
+    _float("strip", "limit", "Limit", "Limit", -40.0, 12.0, 1.0, "dB"),
+    _float("strip", "audibility", "Audibility", "Audibility", 0.0, 10.0, kinds=BASIC),
+    _float(
+        "strip",
+        "denoiser",
+        "Denoiser",
+        "Denoiser",
+        0.0,
+        10.0,
+        kinds=POTATO,
+        virtual=False,
+    ),
+    *(
+        _float(
+            "strip",
+            f"eqgain{n}",
+            f"EQGain{n}",
+            name,
+            -12.0,
+            12.0,
+            unit="dB",
+            virtual=True,
+        )
+        for n, name in ((1, "EQ Bass"), (2, "EQ Mid"), (3, "EQ Treble"))
+    ),
+    *(
+        _float(
+            "strip",
+            f"gain_layer_{n}",
+            f"GainLayer[{n}]",
+            f"Gain Layer {n + 1}",
+            -60.0,
+            12.0,
+            unit="dB",
+            kinds=POTATO,
+        )
+        for n in range(8)
+    ),
+    # Core bus parameters
+    _bool("bus", "mute", "Mute", "Master Mute", core=True),
+    _float("bus", "gain", "Gain", "Master Gain", -60.0, 12.0, unit="dB", core=True),
+    # Extended bus parameters
+    _bool("bus", "mono", "Mono", "Mono"),
+    _bool("bus", "eq_on", "EQ.on", "EQ"),
+    _bool("bus", "sel", "Sel", "Select", kinds=BANANA_UP),
+    *(
+        _bool("bus", f"mode_{mode}", f"mode.{mode}", f"Mode {name}", kinds=BANANA_UP)
+        for mode, name in _BUS_MODES
+    ),
+)
+
+PARAMS_BY_KEY: dict[tuple[str, str], ParamSpec] = {
+    (spec.target, spec.key): spec for spec in PARAMETERS
+}
+
+CORE_KEYS: dict[str, frozenset[str]] = {
+    target: frozenset(s.key for s in PARAMETERS if s.core and s.target == target)
+    for target in ("strip", "bus")
+}
+
+
+def get_spec(target: str, key: str) -> ParamSpec | None:
+    return PARAMS_BY_KEY.get((target, key))
+
+
+def extended_specs(target: str, platform_kind: type) -> list[ParamSpec]:
+    """Non-core parameters of a target that map to the given value type."""
+    return [
+        s
+        for s in PARAMETERS
+        if s.target == target and not s.core and s.kind is platform_kind
+    ]
+
+
+def param_unique_id(entry_id: str, target: str, index: int, key: str) -> str:
+    """Unique id of a generated parameter entity."""
+    return f"{entry_id}_{target}_{index}_{key}"
+
+
+def parse_param_unique_id(entry_id: str, unique_id: str) -> tuple[str, int, str] | None:
+    """Inverse of param_unique_id; None for ids of other entities."""
+    prefix = f"{entry_id}_"
+    if not unique_id.startswith(prefix):
+        return None
+    parts = unique_id[len(prefix) :].split("_", 2)
+    if len(parts) != 3 or not parts[1].isdigit():
+        return None
+    target, index, key = parts[0], int(parts[1]), parts[2]
+    spec = get_spec(target, key)
+    if spec is None or spec.core:
+        return None
+    return target, index, key
+
+
+class ParamSelection:
+    """
+    The parameters to materialise: all core ones plus selected extended ones.
+
+    Immutable once built, so it can safely be read from the executor.
+    """
+
+    def __init__(self, extended: Iterable[tuple[str, int, str]] = ()) -> None:
+        by_channel: dict[tuple[str, int], set[str]] = {}
+        for target, index, key in extended:
+            by_channel.setdefault((target, index), set()).add(key)
+        self._keys: dict[tuple[str, int], frozenset[str]] = {
+            channel: CORE_KEYS[channel[0]] | keys
+            for channel, keys in by_channel.items()
+        }
+
+    def keys_for(self, target: str, index: int) -> frozenset[str]:
+        """Parameter keys to keep for one strip or bus."""
+        return self._keys.get((target, index), CORE_KEYS[target])
+
+    def wants(self, target: str, index: int, key: str) -> bool:
+        return key in self.keys_for(target, index)
@@ -0,0 +1,162 @@
+"""
+Compile Voicemeeter script into integration commands.
+
+Accepts the statement syntax Voicemeeter itself uses for macro buttons and
+VBAN-TEXT, separated by semicolons or newlines:
+
+    Strip[0].Mute=1; Bus[2].Gain=-10; Strip[3].B1=0
+
+Each statement is checked against the params.py catalogue and the current
+mixer layout. Compiled scripts are cached by text and layout, so a macro
+that runs repeatedly is only parsed once.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from .commands import make_command
+from .const import get_bus_label
+from .data import VoicemeeterState
+from .params import PARAMETERS, ParamSpec, get_spec
+
+CACHE_SIZE = 128  # compiled scripts kept per process
+
+_STATEMENT = re.compile(
+    r"(strip|bus)\s*\[\s*(\d+)\s*\]\s*\.\s*([a-z_][\w.\[\]]*)\s*=\s*(\S+)",
+    re.IGNORECASE,
+)
+_SEPARATOR = re.compile(r"[;\n]")
+
+_SPECS_BY_SCRIPT: dict[tuple[str, str], ParamSpec] = {
+    (spec.target, spec.script.lower()): spec for spec in PARAMETERS
+}
+
+_ROUTE_KEYS = {"a1", "a2", "a3", "a4", "a5", "b1", "b2", "b3"}
+
+
+class ScriptError(ValueError):
+    """A script statement that can't be run against the current mixer."""
+
+
+@dataclass(frozen=True)
+class Layout:
+    """The parts of a state a compiled script depends on."""
+
+    kind: str
+    strips: tuple[bool, ...]  # virtual flag per strip index
+    buses: int
+
+    @classmethod
+    def from_state(cls, state: VoicemeeterState) -> Layout:
+        return cls(
+            kind=state.kind,
+            strips=tuple(s.virtual for s in state.strips),
+            buses=len(state.buses),
+        )
+
+
+def script_to_commands(script: str, state: VoicemeeterState) -> list[dict[str, Any]]:
+    """Compile a script for the given state into commands for async_send_commands."""
+    return [
+        make_command(target, index, param, value)
+        for target, index, param, value in compile_script(
+            script, Layout.from_state(state)
+        )
+    ]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_script(
+    script: str, layout: Layout
+) -> tuple[tuple[str, int, str, Any], ...]:
+    """
+    Parse and validate a script, returning (target, index, param, value) tuples.
+
+    Raises ScriptError on the first statement that doesn't parse, names an
+    unknown parameter or channel, or has a value out of range. Errors aren't
+    cached, so a fixed script is picked up on the next call.
+    """
+    commands = []
+    for raw_statement in _SEPARATOR.split(script):
+        statement = raw_statement.strip()
+        if not statement:
+            continue
+        match = _STATEMENT.fullmatch(statement)
+        if match is None:
+            raise ScriptError(f"Can't parse statement '{statement}'")
+        target, index, name, raw = match.groups()
+        target, index = target.lower(), int(index)
+        spec = _SPECS_BY_SCRIPT.get((target, name.lower()))
+        if spec is None:
+            raise ScriptError(f"Unknown parameter '{name}' in '{statement}'")
+        _check_channel(spec, index, layout, statement)
+        commands.append((target, index, spec.key, _parse_value(spec, raw, statement)))
+
+    if not commands:
+        raise ScriptError("Script contains no statements")
+    return tuple(commands)
+
+
+def _check_channel(spec: ParamSpec, index: int, layout: Layout, statement: str) -> None:
+    if spec.target == "strip":
+        if index >= len(layout.strips):
+            raise ScriptError(
+                f"Voicemeeter {layout.kind} has no strip {index} ('{statement}')"
+            )
+        supported = spec.applies_to(layout.kind, layout.strips[index])
+        if spec.key in _ROUTE_KEYS:
+            # Routes exist only for the buses this variant has.
+            supported = spec.key in {
+                get_bus_label(layout.kind, bus).lower() for bus in range(layout.buses)
+            }
+    else:
+        if index >= layout.buses:
+            raise ScriptError(
+                f"Voicemeeter {layout.kind} has no bus {index} ('{statement}')"
+            )
+        supported = layout.kind in spec.kinds
+    if not supported:
+        raise ScriptError(
+            f"{spec.script} is not available on this {spec.target} ('{statement}')"
+        )
+
+
+def check_command(
+    target: str, index: int, param: str, value: Any, layout: Layout
+) -> Any:
+    """
+    Validate one (target, index, param, value) command like a script statement.
+
+    For commands that don't come from script text, e.g. the voicemeeter/set
+    WebSocket command. Returns the value coerced to the parameter's type.
+    """
+    statement = f"{target}[{index}].{param}={value}"
+    spec = get_spec(target, param)
+    if spec is None:
+        raise ScriptError(f"Unknown parameter '{param}' in '{statement}'")
+    _check_channel(spec, index, layout, statement)
+    return _check_value(spec, float(value), statement)
+
+
+def _parse_value(spec: ParamSpec, raw: str, statement: str) -> Any:
+    try:
+        number = float(raw)
+    except ValueError:
+        raise ScriptError(f"Invalid value '{raw}' in '{statement}'") from None
+    return _check_value(spec, number, statement)
+
+
+def _check_value(spec: ParamSpec, number: float, statement: str) -> Any:
+    if spec.kind is bool:
+        if number not in (0, 1):
+            raise ScriptError(f"{spec.script} takes 0 or 1 ('{statement}')")
+        return bool(number)
+    if not spec.min <= number <= spec.max:
+        raise ScriptError(
+            f"{spec.script} must be between {spec.min} and {spec.max} ('{statement}')"
+        )
+    return number
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .commands import make_command
+from .const import CONF_COMPACT_ROUTING, get_bus_label, get_strip_label
+from .coordinator import VoicemeeterCoordinator
+from .entity import VoicemeeterEntity, async_set_hidden_by_mode
+
+SERVICE_SET_ROUTING = "set_routing"
+ATTR_BUSES = "buses"
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    coordinator = entry.runtime_data.coordinator
+
+    compact_routing = entry.options.get(CONF_COMPACT_ROUTING, False)
+    async_set_hidden_by_mode(
+        hass,
+        "sensor",
+        (
+            StripRoutingSensor.unique_id_for(entry.entry_id, strip.index)
+            for strip in coordinator.data.strips
+        ),
+        hidden=not compact_routing,
+    )
+    if not compact_routing:
+        return
+
+    async_add_entities(
+        StripRoutingSensor(coordinator, entry.entry_id, strip.index)
+        for strip in coordinator.data.strips
+    )
+
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_SET_ROUTING,
+        {vol.Required(ATTR_BUSES): vol.All(cv.ensure_list, [cv.string])},
+        "async_set_routing",
+    )
+
+
+class StripRoutingSensor(VoicemeeterEntity, SensorEntity):
+    """
+    All bus routes of one strip in a single entity (compact routing mode).
+
+    Replaces the per-bus StripRouteSwitch entities. The state lists the
+    buses the strip is routed to, the attributes carry the same as a list
+    and a bitmask (bit n = bus n), and routing is changed with the
+    voicemeeter.set_routing service.
+    """
+
+    def __init__(
+        self, coordinator: VoicemeeterCoordinator, entry_id: str, index: int
+    ) -> None:
+        super().__init__(coordinator, entry_id)
+        self._index = index
+        self._attr_unique_id = self.unique_id_for(entry_id, index)
+
+    @staticmethod
+    def unique_id_for(entry_id: str, index: int) -> str:
+        return f"{entry_id}_strip_{index}_routing"
+
+    @property
+    def name(self) -> str:
+        strip = self._strip
+        kind = self.coordinator.data.kind if self.coordinator.data else "banana"
+        label = (
+            strip.label if strip and strip.label else get_strip_label(kind, self._index)
+        )
+        return f"{label} Routing"
+
+    @property
+    def native_value(self) -> str:
+        routes = self._routes()
+        return ", ".join(routes) if routes else "none"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        routes = self._routes()
+        bitmask = 0
+        for bus_index, bus_label in enumerate(self._bus_labels()):
+            if bus_label in routes:
+                bitmask |= 1 << bus_index
+        return {"routes": routes, "bitmask": bitmask}
+
+    @property
+    def _strip(self):
+        if not self.coordinator.data:
+            return None
+        return next(
+            (s for s in self.coordinator.data.strips if s.index == self._index), None
+        )
+
+    def _bus_labels(self) -> list[str]:
+        """Canonical labels (A1, B1, ...) of the buses in the current layout."""
+        if not self.coordinator.data:
+            return []
+        kind = self.coordinator.data.kind
+        return [get_bus_label(kind, bus.index) for bus in self.coordinator.data.buses]
+
+    def _routes(self) -> list[str]:
+        # One strip lookup per state read, shared by every bus.
+        strip = self._strip
+        if not strip:
+            return []
+        return [
+            label for label in self._bus_labels() if strip.get(label.lower(), False)
+        ]
+
+    async def async_set_routing(self, buses: list[str]) -> None:
+        """Route the strip to exactly the given buses, as one batch."""
+        wanted = {bus.upper() for bus in buses}
+        labels = self._bus_labels()
+        unknown = wanted - set(labels)
+        if unknown:
+            raise ServiceValidationError(
+                f"Unknown buses {sorted(unknown)}, expected any of {labels}"
+            )
+
+        current = set(self._routes())
+        await self.coordinator.async_send_commands(
+            [
+                make_command("strip", self._index, label.lower(), label in wanted)
+                for label in labels
+                if (label in wanted) != (label in current)
+            ]
+        )
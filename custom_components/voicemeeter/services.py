@@ -0,0 +1,105 @@
+"""Integration-wide Voicemeeter services."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN
+from .data import VoicemeeterRuntimeData
+from .journal import HISTORY_SIZE
+from .script import ScriptError, script_to_commands
+
+SERVICE_GET_HISTORY = "get_history"
+SERVICE_EXECUTE = "execute"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_LIMIT = "limit"
+ATTR_TARGET = "target"
+ATTR_INDEX = "index"
+ATTR_PARAM = "param"
+ATTR_SCRIPT = "script"
+
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_LIMIT, default=100): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=HISTORY_SIZE)
+        ),
+        vol.Optional(ATTR_TARGET): vol.In(["strip", "bus"]),
+        vol.Optional(ATTR_INDEX): cv.positive_int,
+        vol.Optional(ATTR_PARAM): cv.string,
+    }
+)
+
+EXECUTE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_SCRIPT): cv.string,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the voicemeeter.* services."""
+
+    @callback
+    def _get_history(call: ServiceCall) -> ServiceResponse:
+        runtime_data = _get_runtime_data(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        journal = runtime_data.coordinator.journal
+        if journal is None:
+            raise ServiceValidationError(
+                "The change journal is not enabled for this Voicemeeter entry"
+            )
+        return {
+            "records": journal.history(
+                call.data[ATTR_LIMIT],
+                target=call.data.get(ATTR_TARGET),
+                index=call.data.get(ATTR_INDEX),
+                param=call.data.get(ATTR_PARAM),
+            )
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        _get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _execute(call: ServiceCall) -> None:
+        coordinator = _get_runtime_data(
+            hass, call.data[ATTR_CONFIG_ENTRY_ID]
+        ).coordinator
+        try:
+            commands = script_to_commands(call.data[ATTR_SCRIPT], coordinator.data)
+        except ScriptError as err:
+            raise ServiceValidationError(str(err)) from err
+        await coordinator.async_send_commands(commands)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_EXECUTE, _execute, schema=EXECUTE_SCHEMA
+    )
+
+
+@callback
+def _get_runtime_data(hass: HomeAssistant, entry_id: str) -> VoicemeeterRuntimeData:
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+    ):
+        raise ServiceValidationError(f"Voicemeeter entry {entry_id} is not loaded")
+    return entry.runtime_data
@@ -6,9 +6,14 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import get_bus_label, get_strip_label
+from .const import CONF_COMPACT_ROUTING, get_bus_label, get_strip_label
 from .coordinator import VoicemeeterCoordinator
-from .entity import VoicemeeterEntity
+from .entity import (
+    VoicemeeterEntity,
+    VoicemeeterParamEntity,
+    async_set_hidden_by_mode,
+    iter_param_entities,
+)
 
 
 async def async_setup_entry(
@@ -17,15 +22,32 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator = entry.runtime_data.coordinator
+    # In compact mode routing is exposed by one sensor per strip instead.
+    compact_routing = entry.options.get(CONF_COMPACT_ROUTING, False)
+    async_set_hidden_by_mode(
+        hass,
+        "switch",
+        (
+            StripRouteSwitch.unique_id_for(entry.entry_id, strip.index, bus.index)
+            for strip in coordinator.data.strips
+            for bus in coordinator.data.buses
+        ),
+        hidden=compact_routing,
+    )
     entities = []
     for strip in coordinator.data.strips:
         entities.append(StripMuteSwitch(coordinator, entry.entry_id, strip.index))
-        for bus in coordinator.data.buses:
-            entities.append(
-                StripRouteSwitch(coordinator, entry.entry_id, strip.index, bus.index)
-            )
+        if compact_routing:
+            continue
+        entities.extend(
+            StripRouteSwitch(coordinator, entry.entry_id, strip.index, bus.index)
+            for bus in coordinator.data.buses
+        )
     for bus in coordinator.data.buses:
         entities.append(BusMuteSwitch(coordinator, entry.entry_id, bus.index))
+    entities.extend(
+        iter_param_entities(coordinator, entry.entry_id, bool, VoicemeeterParamSwitch)
+    )
     async_add_entities(entities)
 
 
@@ -62,26 +84,10 @@ class StripMuteSwitch(VoicemeeterEntity, SwitchEntity):
         )
 
     async def async_turn_on(self, **kwargs) -> None:
-        await self.coordinator.config_entry.runtime_data.ws.send(
-            {
-                "type": "set",
-                "target": "strip",
-                "index": self._index,
-                "param": "mute",
-                "value": True,
-            }
-        )
+        await self.coordinator.async_send_command("strip", self._index, "mute", True)
 
     async def async_turn_off(self, **kwargs) -> None:
-        await self.coordinator.config_entry.runtime_data.ws.send(
-            {
-                "type": "set",
-                "target": "strip",
-                "index": self._index,
-                "param": "mute",
-                "value": False,
-            }
-        )
+        await self.coordinator.async_send_command("strip", self._index, "mute", False)
 
 
 class StripRouteSwitch(VoicemeeterEntity, SwitchEntity):
@@ -95,7 +101,11 @@ class StripRouteSwitch(VoicemeeterEntity, SwitchEntity):
         super().__init__(coordinator, entry_id)
         self._strip_index = strip_index
         self._bus_index = bus_index
-        self._attr_unique_id = f"{entry_id}_strip_{strip_index}-bus_{bus_index}_toggle"
+        self._attr_unique_id = self.unique_id_for(entry_id, strip_index, bus_index)
+
+    @staticmethod
+    def unique_id_for(entry_id: str, strip_index: int, bus_index: int) -> str:
+        return f"{entry_id}_strip_{strip_index}-bus_{bus_index}_toggle"
 
     @property
     def name(self) -> str:
@@ -107,7 +117,9 @@ class StripRouteSwitch(VoicemeeterEntity, SwitchEntity):
             if strip and strip.label
             else get_strip_label(kind, self._strip_index)
         )
-        bus_label = bus.label if bus and bus.label else get_bus_label(kind, self._bus_index)
+        bus_label = (
+            bus.label if bus and bus.label else get_bus_label(kind, self._bus_index)
+        )
         return f"{strip_label} - {bus_label} Toggle"
 
     @property
@@ -115,9 +127,9 @@ class StripRouteSwitch(VoicemeeterEntity, SwitchEntity):
         strip = self._strip
         if not strip:
             return False
-        kind = self.coordinator.data.kind if self.coordinator.data else 'banana'
+        kind = self.coordinator.data.kind if self.coordinator.data else "banana"
         bus_canonical_label = get_bus_label(kind, self._bus_index).lower()
-        return getattr(strip, bus_canonical_label, False)
+        return strip.get(bus_canonical_label, False)
 
     @property
     def _strip(self):
@@ -136,30 +148,20 @@ class StripRouteSwitch(VoicemeeterEntity, SwitchEntity):
             (b for b in self.coordinator.data.buses if b.index == self._bus_index), None
         )
 
+    @property
+    def _route_param(self) -> str:
+        return get_bus_label(
+            self.coordinator.data.kind or "banana", self._bus_index
+        ).lower()
+
     async def async_turn_on(self, **kwargs) -> None:
-        await self.coordinator.config_entry.runtime_data.ws.send(
-            {
-                "type": "set",
-                "target": "strip",
-                "index": self._strip_index,
-                "param": get_bus_label(
-                    self.coordinator.data.kind or "banana", self._bus_index
-                ).lower(),
-                "value": True,
-            }
+        await self.coordinator.async_send_command(
+            "strip", self._strip_index, self._route_param, True
         )
 
     async def async_turn_off(self, **kwargs) -> None:
-        await self.coordinator.config_entry.runtime_data.ws.send(
-            {
-                "type": "set",
-                "target": "strip",
-                "index": self._strip_index,
-                "param": get_bus_label(
-                    self.coordinator.data.kind or "banana", self._bus_index
-                ).lower(),
-                "value": False,
-            }
+        await self.coordinator.async_send_command(
+            "strip", self._strip_index, self._route_param, False
         )
 
 
@@ -177,8 +179,9 @@ class BusMuteSwitch(VoicemeeterEntity, SwitchEntity):
     def name(self) -> str:
         if not self.coordinator.data:
             return f"Bus {self._index} Master Mute"
-        if self._bus.label:
-            return f"{self._bus.label} Master Mute"
+        bus = self._bus
+        if bus and bus.label:
+            return f"{bus.label} Master Mute"
         return f"{get_bus_label(self.coordinator.data.kind, self._index)} Master Mute"
 
     @property
@@ -195,23 +198,21 @@ class BusMuteSwitch(VoicemeeterEntity, SwitchEntity):
         )
 
     async def async_turn_on(self, **kwargs) -> None:
-        await self.coordinator.config_entry.runtime_data.ws.send(
-            {
-                "type": "set",
-                "target": "bus",
-                "index": self._index,
-                "param": "mute",
-                "value": True,
-            }
-        )
+        await self.coordinator.async_send_command("bus", self._index, "mute", True)
 
     async def async_turn_off(self, **kwargs) -> None:
-        await self.coordinator.config_entry.runtime_data.ws.send(
-            {
-                "type": "set",
-                "target": "bus",
-                "index": self._index,
-                "param": "mute",
-                "value": False,
-            }
-        )
+        await self.coordinator.async_send_command("bus", self._index, "mute", False)
+
+
+class VoicemeeterParamSwitch(VoicemeeterParamEntity, SwitchEntity):
+    """On/off parameter from the extended catalogue in params.py."""
+
+    @property
+    def is_on(self) -> bool:
+        return bool(self._value)
+
+    async def async_turn_on(self, **kwargs) -> None:
+        await self._async_set(True)
+
+    async def async_turn_off(self, **kwargs) -> None:
+        await self._async_set(False)
@@ -0,0 +1,119 @@
+"""
+Common interface for connections to a Voicemeeter host.
+
+The coordinator doesn't care how state reaches it. Every transport delivers
+the same "state"/"update" messages the companion app sends over WebSocket
+and accepts the same "set"/"batch" messages for outbound commands.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class TransportStats:
+    """Connection lifecycle counters, reported through diagnostics."""
+
+    connects: int = 0
+    disconnects: int = 0
+    messages: int = 0
+    malformed_messages: int = 0
+    offloaded_messages: int = 0  # frames decoded in the executor
+    # Time our own frame handling held the event loop: decode (when inline)
+    # and dispatch to the coordinator. Says nothing about other work.
+    loop_time_max_ms: float = 0.0
+    loop_time_total_ms: float = 0.0
+    # How late the loop ran a timer while connected, i.e. event loop lag
+    # from everything running on it, including other hosts' frames.
+    loop_lag_max_ms: float = 0.0
+    last_error: str | None = None
+
+    def record_loop_time(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self.loop_time_total_ms = round(self.loop_time_total_ms + ms, 3)
+        self.loop_time_max_ms = max(self.loop_time_max_ms, round(ms, 3))
+
+    def record_loop_lag(self, seconds: float) -> None:
+        self.loop_lag_max_ms = max(self.loop_lag_max_ms, round(seconds * 1000, 3))
+
+
+class LoopLagMonitor:
+    """
+    Measures event loop lag as the overshoot of a periodic timer.
+
+    Every interval seconds a timer is due; on_lag receives how late the
+    loop actually ran it. Must be started and stopped on the event loop.
+    """
+
+    def __init__(self, interval: float, on_lag: Callable[[float], None]) -> None:
+        self._interval = interval
+        self._on_lag = on_lag
+        self._handle: asyncio.TimerHandle | None = None
+        self._due = 0.0
+
+    def start(self) -> None:
+        if self._handle is None:
+            self._schedule()
+
+    def stop(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _schedule(self) -> None:
+        self._due = time.perf_counter() + self._interval
+        self._handle = asyncio.get_running_loop().call_later(
+            self._interval, self._probe
+        )
+
+    def _probe(self) -> None:
+        self._on_lag(max(0.0, time.perf_counter() - self._due))
+        self._schedule()
+
+
+class VoicemeeterTransport(ABC):
+    """
+    Base class for a persistent connection to a Voicemeeter host.
+
+    Implementations own their connection loop and talk to the coordinator
+    exclusively through the callbacks passed in here, so they have no
+    dependency on HA internals.
+    """
+
+    def __init__(
+        self,
+        on_message: Callable[[dict[str, Any]], None],
+        on_connect: Callable[[], None],
+        on_disconnect: Callable[[], None],
+    ) -> None:
+        self._on_message = on_message
+        self._on_connect = on_connect
+        self._on_disconnect = on_disconnect
+        self.stats = TransportStats()
+
+    @abstractmethod
+    async def start(self) -> None:
+        """
+        Run the connection loop until stop() is called.
+
+        Should be launched as a background task:
+            hass.async_create_background_task(transport.start(), ...)
+        """
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop the connection loop and release the connection."""
+
+    @abstractmethod
+    async def send(self, data: dict[str, Any]) -> None:
+        """
+        Send a "set" or "batch" message to the host.
+
+        Silently drops the message if not connected.
+        """
@@ -0,0 +1,419 @@
+"""
+VBAN transport, talking to Voicemeeter's built-in network remote directly.
+
+Commands go out as VBAN-TEXT packets (Voicemeeter script over UDP) and state
+comes back through the VBAN RT-packet service. No companion app is needed,
+which saves a hop and avoids TCP head-of-line blocking for every command.
+
+The RT packets carry the full mixer state each time. They are translated
+into the same "state"/"update" messages the companion app would send, so the
+coordinator can't tell the two transports apart.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .const import (
+    BATCH_MIN_PROTOCOL,
+    KIND_BUSES,
+    KIND_HARDWARE_STRIPS,
+    KIND_VIRTUAL_STRIPS,
+    LOGGER,
+)
+from .params import get_spec
+from .transport import VoicemeeterTransport
+
+# Messages we synthesise are batch-capable: one VBAN-TEXT packet can carry
+# many script statements.
+VBAN_PROTOCOL = ".".join(str(part) for part in BATCH_MIN_PROTOCOL)
+
+RECONNECT_DELAY = 5  # seconds between attempts to open the socket
+WATCHDOG_INTERVAL = 1  # seconds between liveness checks
+REGISTER_TIMEOUT = 15  # seconds Voicemeeter keeps streaming RT packets per register
+REGISTER_INTERVAL = 10  # seconds between RT registrations while connected
+PACKET_TIMEOUT = 5  # seconds without an RT packet before we call it disconnected
+
+MAX_TEXT_PAYLOAD = 1400  # bytes, stays below the VBAN 1436 byte payload limit
+
+# ---------------------------------------------------------------------------
+# VBAN wire format
+# ---------------------------------------------------------------------------
+
+_HEADER = struct.Struct("<4sBBBB16sI")
+
+VBAN_PROTOCOL_TXT = 0x40
+VBAN_PROTOCOL_SERVICE = 0x60
+VBAN_PROTOCOL_MASK = 0xE0
+VBAN_DATATYPE_UTF8 = 0x10
+VBAN_SERVICE_RTPACKETREGISTER = 0x20
+VBAN_SERVICE_RTPACKET = 0x21
+
+_REGISTER_STREAM = "Register RTP"
+
+# VBAN_VMRT_PACKET: type, reserved, buffersize, version, options, samplerate,
+# input levels[34], output levels[64], transport bits, strip state[8],
+# bus state[8], strip gain layers[8][8], bus gain[8], strip labels[8][60],
+# bus labels[8][60].
+_RT_PACKET = struct.Struct("<BBHIII34h64hI8I8I64h8h480s480s")
+
+_VBAN_KINDS = {1: "basic", 2: "banana", 3: "potato"}
+
+_STATE_MUTE = 0x00000001
+_STATE_FLAGS = {
+    "strip": {"solo": 0x00000002, "mono": 0x00000004, "mc": 0x00000008},
+    "bus": {"mono": 0x00000004, "eq_on": 0x00000100},
+}
+_BUS_MODE_MASK = 0x000000F0
+_BUS_MODES = [
+    "normal",
+    "amix",
+    "repeat",
+    "bmix",
+    "composite",
+    "tvmix",
+    "upmix21",
+    "upmix41",
+    "upmix61",
+    "centeronly",
+    "lfeonly",
+    "rearonly",
+]
+_STATE_ROUTES = {
+    "a1": 0x00001000,
+    "a2": 0x00002000,
+    "a3": 0x00004000,
+    "a4": 0x00008000,
+    "b1": 0x00010000,
+    "b2": 0x00020000,
+    "b3": 0x00040000,
+    "a5": 0x00080000,
+}
+_LABEL_SIZE = 60
+_HARDWARE_CHANNELS = 2  # input level channels per hardware strip
+_VIRTUAL_CHANNELS = 8  # input level channels per virtual strip
+
+_GAIN_LAYERS = 8
+_SCRIPT_TARGETS = {"strip": "Strip", "bus": "Bus"}
+
+
+def _pack_header(
+    sub_protocol: int, nbs: int, nbc: int, bit: int, stream: str, frame: int
+) -> bytes:
+    return _HEADER.pack(
+        b"VBAN", sub_protocol, nbs, nbc, bit, stream.encode("ascii")[:16], frame
+    )
+
+
+def _decode_label(labels: bytes, index: int) -> str:
+    raw = labels[index * _LABEL_SIZE : (index + 1) * _LABEL_SIZE]
+    return raw.split(b"\0", 1)[0].decode("utf-8", "replace")
+
+
+def parse_rt_packet(payload: bytes) -> dict[str, Any] | None:
+    """
+    Translate a VBAN_VMRT_PACKET into a companion-style state message.
+
+    Returns None for unknown Voicemeeter types or truncated packets.
+    """
+    if len(payload) < _RT_PACKET.size:
+        return None
+    fields = _RT_PACKET.unpack_from(payload)
+    kind = _VBAN_KINDS.get(fields[0])
+    if kind is None:
+        return None
+
+    strip_state = fields[105:113]
+    bus_state = fields[113:121]
+    strip_layers = fields[121:185]  # [layer][strip], layer 1 is the strip gain
+    bus_gain = fields[185:193]
+    strip_labels, bus_labels = fields[193], fields[194]
+
+    hardware = KIND_HARDWARE_STRIPS[kind]
+    strips = []
+    for index in range(hardware + KIND_VIRTUAL_STRIPS[kind]):
+        state = strip_state[index]
+        strip = {
+            "index": index,
+            "label": _decode_label(strip_labels, index),
+            "mute": bool(state & _STATE_MUTE),
+            "gain": strip_layers[index] / 100,
+            "virtual": index >= hardware,
+        }
+        for route, bit in _STATE_ROUTES.items():
+            strip[route] = bool(state & bit)
+        for param, bit in _STATE_FLAGS["strip"].items():
+            strip[param] = bool(state & bit)
+        if kind == "potato":
+            for layer in range(_GAIN_LAYERS):
+                strip[f"gain_layer_{layer}"] = strip_layers[layer * 8 + index] / 100
+        strips.append(strip)
+
+    buses = []
+    for index in range(KIND_BUSES[kind]):
+        state = bus_state[index]
+        bus = {
+            "index": index,
+            "label": _decode_label(bus_labels, index),
+            "mute": bool(state & _STATE_MUTE),
+            "gain": bus_gain[index] / 100,
+        }
+        for param, bit in _STATE_FLAGS["bus"].items():
+            bus[param] = bool(state & bit)
+        if kind != "basic":
+            mode = (state & _BUS_MODE_MASK) >> 4
+            for number, name in enumerate(_BUS_MODES):
+                bus[f"mode_{name}"] = mode == number
+        buses.append(bus)
+
+    return {
+        "type": "state",
+        "kind": kind,
+        "protocol": VBAN_PROTOCOL,
+        "strips": strips,
+        "buses": buses,
+    }
+
+
+def parse_rt_levels(payload: bytes, kind: str) -> dict[str, Any]:
+    """Build a levels message with each strip's peak input level in dB."""
+    input_levels = _RT_PACKET.unpack_from(payload)[6:40]
+    hardware = KIND_HARDWARE_STRIPS[kind]
+    levels = []
+    channel = 0
+    for index in range(hardware + KIND_VIRTUAL_STRIPS[kind]):
+        width = _HARDWARE_CHANNELS if index < hardware else _VIRTUAL_CHANNELS
+        levels.append(max(input_levels[channel : channel + width]) / 100)
+        channel += width
+    return {"type": "levels", "strips": levels}
+
+
+def command_to_script(command: dict[str, Any]) -> str:
+    """
+    Render one set command as a Voicemeeter script statement.
+
+    Only catalogue parameters are rendered: the name ends up verbatim in the
+    script, so anything else could smuggle in further statements.
+    """
+    target = _SCRIPT_TARGETS[command["target"]]
+    spec = get_spec(command["target"], command["param"])
+    if spec is None:
+        raise ValueError(
+            f"Unknown Voicemeeter parameter {command['target']}.{command['param']}"
+        )
+    param = spec.script
+    value = command["value"]
+    if isinstance(value, bool):
+        value = int(value)
+    return f"{target}[{command['index']}].{param}={value};"
+
+
+# ---------------------------------------------------------------------------
+# Transport
+# ---------------------------------------------------------------------------
+
+
+class _VbanProtocol(asyncio.DatagramProtocol):
+    def __init__(self, on_datagram: Callable[[bytes], None]) -> None:
+        self._on_datagram = on_datagram
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        self._on_datagram(data)
+
+    def error_received(self, exc: Exception) -> None:
+        LOGGER.debug("Voicemeeter VBAN socket error: %s", exc)
+
+
+class VoicemeeterVban(VoicemeeterTransport):
+    """
+    UDP connection to Voicemeeter's VBAN remote.
+
+    UDP has no connection to lose, so "connected" means RT packets are
+    arriving. The first packet after a silence is reported as a state message;
+    after that only the fields that changed are reported as update messages.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        stream_name: str,
+        on_message: Callable[[dict[str, Any]], None],
+        on_connect: Callable[[], None],
+        on_disconnect: Callable[[], None],
+    ) -> None:
+        super().__init__(on_message, on_connect, on_disconnect)
+        self._addr = (host, port)
+        self._stream_name = stream_name
+
+        self._udp: asyncio.DatagramTransport | None = None
+        self._running = False
+        self._connected = False
+        self._last_state: dict[str, Any] | None = None
+        self._last_packet = 0.0
+        self._last_register = 0.0
+        self._text_frame = 0
+        self._register_frame = 0
+
+    async def start(self) -> None:
+        """Run the registration and watchdog loop until stop() is called."""
+        self._running = True
+        loop = asyncio.get_running_loop()
+        while self._running:
+            try:
+                self._udp, _ = await loop.create_datagram_endpoint(
+                    lambda: _VbanProtocol(self._handle_datagram),
+                    remote_addr=self._addr,
+                )
+            except OSError as err:
+                self.stats.last_error = str(err)
+                LOGGER.warning("Voicemeeter VBAN socket error: %s", err)
+                await asyncio.sleep(RECONNECT_DELAY)
+                continue
+
+            try:
+                while self._running:
+                    self._watchdog()
+                    await asyncio.sleep(WATCHDOG_INTERVAL)
+            finally:
+                self._close()
+
+    async def stop(self) -> None:
+        """Stop the loop and close the socket."""
+        self._running = False
+        self._close()
+
+    async def send(self, data: dict[str, Any]) -> None:
+        """Translate a set or batch message into VBAN-TEXT packets."""
+        if self._udp is None or not self._connected:
+            LOGGER.debug("VBAN send skipped, not connected: %s", data)
+            return
+
+        if data["type"] == "batch":
+            statements = [command_to_script(c) for c in data["commands"]]
+        else:
+            statements = [command_to_script(data)]
+
+        packet = ""
+        for statement in statements:
+            if packet and len(packet) + len(statement) > MAX_TEXT_PAYLOAD:
+                self._send_text(packet)
+                packet = ""
+            packet += statement
+        if packet:
+            self._send_text(packet)
+
+    def _send_text(self, script: str) -> None:
+        header = _pack_header(
+            VBAN_PROTOCOL_TXT,
+            0,
+            0,
+            VBAN_DATATYPE_UTF8,
+            self._stream_name,
+            self._text_frame,
+        )
+        self._text_frame = (self._text_frame + 1) & 0xFFFFFFFF
+        self._udp.sendto(header + script.encode("utf-8"))
+
+    def _register(self) -> None:
+        header = _pack_header(
+            VBAN_PROTOCOL_SERVICE,
+            0,
+            VBAN_SERVICE_RTPACKETREGISTER,
+            REGISTER_TIMEOUT,
+            _REGISTER_STREAM,
+            self._register_frame,
+        )
+        self._register_frame = (self._register_frame + 1) & 0xFFFFFFFF
+        self._udp.sendto(header)
+        self._last_register = time.monotonic()
+
+    def _watchdog(self) -> None:
+        now = time.monotonic()
+        if self._connected and now - self._last_packet > PACKET_TIMEOUT:
+            LOGGER.info("Voicemeeter VBAN stopped sending RT packets")
+            self._set_disconnected()
+
+        # Keep the registration alive while connected; while waiting for the
+        # host, ask every tick so we notice it coming back quickly.
+        if not self._connected or now - self._last_register >= REGISTER_INTERVAL:
+            self._register()
+
+    def _close(self) -> None:
+        if self._udp is not None:
+            self._udp.close()
+            self._udp = None
+        if self._connected:
+            self._set_disconnected()
+
+    def _set_disconnected(self) -> None:
+        self._connected = False
+        self.stats.disconnects += 1
+        self._last_state = None
+        self._on_disconnect()
+
+    def _handle_datagram(self, data: bytes) -> None:
+        if len(data) < _HEADER.size or data[:4] != b"VBAN":
+            return
+        _, sub_protocol, _, service, _, _, _ = _HEADER.unpack_from(data)
+        if (sub_protocol & VBAN_PROTOCOL_MASK) != VBAN_PROTOCOL_SERVICE:
+            return
+        if service != VBAN_SERVICE_RTPACKET:
+            return
+
+        self.stats.messages += 1
+        try:
+            state = parse_rt_packet(data[_HEADER.size :])
+        except Exception as err:
+            self.stats.malformed_messages += 1
+            LOGGER.error("Failed to parse VBAN RT packet: %s", err)
+            return
+        if state is None:
+            self.stats.malformed_messages += 1
+            return
+
+        self._last_packet = time.monotonic()
+        if not self._connected:
+            self._connected = True
+            self.stats.connects += 1
+            self._on_connect()
+            LOGGER.info("Receiving Voicemeeter VBAN RT packets from %s:%s", *self._addr)
+
+        try:
+            self._emit(state)
+            self._on_message(parse_rt_levels(data[_HEADER.size :], state["kind"]))
+        except Exception as err:
+            LOGGER.error("Failed to handle VBAN state: %s", err)
+
+    def _emit(self, state: dict[str, Any]) -> None:
+        previous = self._last_state
+        self._last_state = state
+
+        if previous is None or previous["kind"] != state["kind"]:
+            self._on_message(state)
+            return
+
+        # Labels aren't updatable params, so a rename resends the full state.
+        for key in ("strips", "buses"):
+            for old, new in zip(previous[key], state[key], strict=True):
+                if old["label"] != new["label"]:
+                    self._on_message(state)
+                    return
+
+        for target, key in (("strip", "strips"), ("bus", "buses")):
+            for old, new in zip(previous[key], state[key], strict=True):
+                for param, value in new.items():
+                    if old[param] != value:
+                        self._on_message(
+                            {
+                                "type": "update",
+                                "target": target,
+                                "index": new["index"],
+                                "param": param,
+                                "value": value,
+                            }
+                        )
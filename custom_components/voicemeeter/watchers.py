@@ -0,0 +1,248 @@
+"""
+Parameter watchers behind the device triggers.
+
+A watcher is attached to one (target, index, param) key on the coordinator
+and is only evaluated when that key actually changes, so automations on
+Voicemeeter state cost nothing on frames that don't touch their parameter.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+
+from .const import DOMAIN, LOGGER, get_bus_label, get_strip_label
+from .data import ParamChange
+
+if TYPE_CHECKING:
+    from .coordinator import VoicemeeterCoordinator
+
+DATA_WATCHERS = f"{DOMAIN}_watchers"
+
+CONF_TARGET = "target"
+CONF_INDEX = "index"
+CONF_PARAM = "param"
+CONF_THRESHOLD = "threshold"
+CONF_HYSTERESIS = "hysteresis"
+
+DEFAULT_HYSTERESIS = 1.0  # dB
+
+TRIGGER_MUTED = "muted"
+TRIGGER_UNMUTED = "unmuted"
+TRIGGER_ROUTED = "routed"
+TRIGGER_UNROUTED = "unrouted"
+TRIGGER_GAIN_ABOVE = "gain_above"
+TRIGGER_GAIN_BELOW = "gain_below"
+
+TRIGGER_TYPES = {
+    TRIGGER_MUTED,
+    TRIGGER_UNMUTED,
+    TRIGGER_ROUTED,
+    TRIGGER_UNROUTED,
+    TRIGGER_GAIN_ABOVE,
+    TRIGGER_GAIN_BELOW,
+}
+GAIN_TRIGGER_TYPES = {TRIGGER_GAIN_ABOVE, TRIGGER_GAIN_BELOW}
+
+
+class ParamWatcher(ABC):
+    """Decides, per changed value, whether the watched condition was crossed."""
+
+    @abstractmethod
+    def evaluate(self, value: Any) -> bool:
+        """Return True if this change should fire."""
+
+
+class TransitionWatcher(ParamWatcher):
+    """Fires when a boolean parameter switches to the given value."""
+
+    def __init__(self, to: bool, initial: Any) -> None:
+        self._to = to
+        self._last = initial
+
+    def evaluate(self, value: Any) -> bool:
+        fire = self._last is not None and value == self._to and self._last != value
+        self._last = value
+        return fire
+
+
+class ThresholdWatcher(ParamWatcher):
+    """
+    Fires when a numeric parameter crosses a threshold, with hysteresis.
+
+    After firing, the watcher only re-arms once the value has moved back past
+    the threshold by at least the hysteresis, so a fader hovering around the
+    threshold fires once rather than on every frame.
+    """
+
+    def __init__(
+        self, above: bool, threshold: float, hysteresis: float, initial: Any
+    ) -> None:
+        self._above = above
+        self._threshold = threshold
+        self._hysteresis = hysteresis
+        self._armed: bool | None = None
+        if initial is not None:
+            self._armed = not self._crossed(initial)
+
+    def _crossed(self, value: float) -> bool:
+        if self._above:
+            return value > self._threshold
+        return value < self._threshold
+
+    def _rearmed(self, value: float) -> bool:
+        if self._above:
+            return value <= self._threshold - self._hysteresis
+        return value >= self._threshold + self._hysteresis
+
+    def evaluate(self, value: Any) -> bool:
+        if self._armed is None:
+            # First value we've seen; arm without firing.
+            self._armed = not self._crossed(value)
+            return False
+        if self._armed and self._crossed(value):
+            self._armed = False
+            return True
+        if not self._armed and self._rearmed(value):
+            self._armed = True
+        return False
+
+
+ParamKey = tuple[str, int, str]  # (target, index, param)
+
+
+class WatcherRegistry:
+    """
+    The watchers attached to one config entry, indexed by parameter.
+
+    Lives in hass.data rather than on the coordinator: automations attach
+    their triggers once, while the coordinator is replaced on every entry
+    reload (e.g. when the Voicemeeter kind changes).
+    """
+
+    def __init__(self) -> None:
+        self._watchers: defaultdict[
+            ParamKey, list[tuple[ParamWatcher, Callable[[Any], None]]]
+        ] = defaultdict(list)
+
+    @callback
+    def async_add(
+        self, key: ParamKey, watcher: ParamWatcher, on_fire: Callable[[Any], None]
+    ) -> CALLBACK_TYPE:
+        """Attach a watcher; returns a callable that detaches it again."""
+        registration = (watcher, on_fire)
+        self._watchers[key].append(registration)
+
+        @callback
+        def _remove() -> None:
+            self._watchers[key].remove(registration)
+            if not self._watchers[key]:
+                del self._watchers[key]
+
+        return _remove
+
+    @callback
+    def async_process(self, changes: list[ParamChange]) -> None:
+        """Evaluate only the watchers whose parameter is among the changes."""
+        if not self._watchers:
+            return
+        for change in changes:
+            registrations = self._watchers.get(
+                (change.target, change.index, change.param)
+            )
+            if not registrations:
+                continue
+            for watcher, on_fire in list(registrations):
+                if watcher.evaluate(change.value):
+                    try:
+                        on_fire(change.value)
+                    except Exception:
+                        LOGGER.exception("Error firing Voicemeeter trigger")
+
+
+@callback
+def async_get_watcher_registry(hass: HomeAssistant, entry_id: str) -> WatcherRegistry:
+    """Return the watcher registry of a config entry, creating it if needed."""
+    registries: dict[str, WatcherRegistry] = hass.data.setdefault(DATA_WATCHERS, {})
+    if entry_id not in registries:
+        registries[entry_id] = WatcherRegistry()
+    return registries[entry_id]
+
+
+@callback
+def async_remove_watcher_registry(hass: HomeAssistant, entry_id: str) -> None:
+    """Forget the watcher registry of a config entry that was removed."""
+    hass.data.get(DATA_WATCHERS, {}).pop(entry_id, None)
+
+
+@dataclass(frozen=True)
+class AutomationTarget:
+    """One parameter a device trigger or condition can be attached to."""
+
+    kind: str  # "mute", "route" or "gain"
+    target: str
+    index: int
+    param: str
+    subtype: str
+
+
+@callback
+def async_get_entry_id_for_device(hass: HomeAssistant, device_id: str) -> str | None:
+    """Return the id of the Voicemeeter config entry owning a device."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
+        return None
+    for entry_id in device.config_entries:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if entry and entry.domain == DOMAIN:
+            return entry_id
+    return None
+
+
+@callback
+def async_get_coordinator_for_device(
+    hass: HomeAssistant, device_id: str
+) -> VoicemeeterCoordinator | None:
+    """Return the coordinator of the config entry owning a device, if loaded."""
+    entry_id = async_get_entry_id_for_device(hass, device_id)
+    if entry_id is None:
+        return None
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.state is not ConfigEntryState.LOADED:
+        return None
+    return entry.runtime_data.coordinator
+
+
+def iter_automation_targets(
+    coordinator: VoicemeeterCoordinator,
+) -> Iterator[AutomationTarget]:
+    """Yield every mute, route and gain parameter of the current layout."""
+    state = coordinator.data
+    if state is None:
+        return
+
+    for strip in state.strips:
+        strip_label = strip.label or get_strip_label(state.kind, strip.index)
+        yield AutomationTarget("mute", "strip", strip.index, "mute", strip_label)
+        yield AutomationTarget("gain", "strip", strip.index, "gain", strip_label)
+        for bus in state.buses:
+            bus_label = bus.label or get_bus_label(state.kind, bus.index)
+            yield AutomationTarget(
+                "route",
+                "strip",
+                strip.index,
+                get_bus_label(state.kind, bus.index).lower(),
+                f"{strip_label} - {bus_label}",
+            )
+
+    for bus in state.buses:
+        bus_label = bus.label or get_bus_label(state.kind, bus.index)
+        yield AutomationTarget("mute", "bus", bus.index, "mute", bus_label)
+        yield AutomationTarget("gain", "bus", bus.index, "gain", bus_label)
@@ -10,39 +10,64 @@ from __future__ import annotations
 
 import asyncio
 import json
-from collections.abc import Callable
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import aiohttp
 
 from .const import LOGGER
+from .transport import LoopLagMonitor, VoicemeeterTransport
 
 RECONNECT_DELAY = 5  # seconds between reconnect attempts
-
-
-class VoicemeeterWebSocket:
+LOOP_LAG_INTERVAL = 1  # seconds between event loop lag probes while connected
+# Characters. Decoding and parsing a frame costs 20-35 us per KB, so a
+# Potato state dump (2-7 KB) takes 0.05-0.25 ms and an update ~2 us. The
+# decode holds the GIL in the executor too, and handing a frame over costs
+# the loop ~35 us plus a GIL hand-off, so offloading only lowers loop lag
+# once one decode outlasts the 5 ms GIL switch interval: around 250 KB,
+# see tests/benchmarks/test_reconnect_burst.py. Real state dumps stay
+# inline; this guards against oversized frames stalling the loop.
+LARGE_FRAME_SIZE = 256 * 1024
+
+
+class VoicemeeterWebSocket(VoicemeeterTransport):
     """
     Persistent WebSocket connection to the companion app.
 
     Owns the connection loop. Calls provided callbacks when messages arrive
     or the connection state changes. Accepts outbound messages via send().
+
+    Frames are turned into messages by decode, which must be thread-safe.
+    Frames are decoded inline, which is cheapest for everything a real
+    host sends; frames over LARGE_FRAME_SIZE are decoded through offload,
+    typically the executor, so a single huge frame can't stall the event
+    loop. Frames are still handled one at a time, so messages reach
+    on_message in the order they arrived.
     """
 
     def __init__(
         self,
+        session: aiohttp.ClientSession,
         host: str,
         port: int,
         on_message: Callable[[dict[str, Any]], None],
         on_connect: Callable[[], None],
         on_disconnect: Callable[[], None],
+        decode: Callable[[str], dict[str, Any]] = json.loads,
+        offload: Callable[..., Awaitable[dict[str, Any]]] | None = None,
     ) -> None:
+        super().__init__(on_message, on_connect, on_disconnect)
+        self._decode = decode
+        self._offload = offload
+        # The session is shared and owned by the caller, so reconnecting
+        # doesn't create (and leak) a new connector per attempt.
+        self._session = session
         self._url = f"ws://{host}:{port}/ws"
-        self._on_message = on_message
-        self._on_connect = on_connect
-        self._on_disconnect = on_disconnect
 
         self._ws: aiohttp.ClientWebSocketResponse | None = None
         self._running = False
+        self._connected = False
 
     async def start(self) -> None:
         """
@@ -56,10 +81,15 @@ class VoicemeeterWebSocket:
             try:
                 await self._connect_loop()
             except Exception as err:
+                self.stats.last_error = str(err)
                 LOGGER.warning("Voicemeeter WS connection error: %s", err)
 
-            if self._running:
+            if self._connected:
+                self._connected = False
+                self.stats.disconnects += 1
                 self._on_disconnect()
+
+            if self._running:
                 LOGGER.debug(
                     "Voicemeeter WS disconnected, retrying in %ss", RECONNECT_DELAY
                 )
@@ -86,28 +116,51 @@ class VoicemeeterWebSocket:
 
     async def _connect_loop(self) -> None:
         """Open a connection and block until it closes."""
-        async with aiohttp.ClientSession() as session, session.ws_connect(
+        async with self._session.ws_connect(
             self._url,
             heartbeat=30,  # aiohttp sends WS pings every 30s
             timeout=aiohttp.ClientWSTimeout(ws_close=5),
         ) as ws:
             self._ws = ws
-            self._on_connect()
-            LOGGER.info("Connected to Voicemeeter companion app at %s", self._url)
-
-            async for msg in ws:
-                LOGGER.debug("WS msg type: %s", msg.type)
-                if msg.type == aiohttp.WSMsgType.TEXT:
-                    try:
-                        # LOGGER.debug(f"Recieved raw websocket message: {msg.data}")
-                        self._on_message(json.loads(msg.data))
-                    except Exception as err:
-                        LOGGER.error("Failed to handle WS message: %s", err)
-                elif msg.type == aiohttp.WSMsgType.ERROR:
-                    LOGGER.warning("Voicemeeter WS error frame received")
-                    break
-                elif msg.type in [aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSING]:
-                    LOGGER.info("Voicemeeter disconnected from companion websocket")
-                    break
-
-            self._ws = None
+            loop_lag = LoopLagMonitor(LOOP_LAG_INTERVAL, self.stats.record_loop_lag)
+            loop_lag.start()
+            try:
+                self._connected = True
+                self.stats.connects += 1
+                self._on_connect()
+                LOGGER.info("Connected to Voicemeeter companion app at %s", self._url)
+
+                async for msg in ws:
+                    LOGGER.debug("WS msg type: %s", msg.type)
+                    if msg.type == aiohttp.WSMsgType.TEXT:
+                        self.stats.messages += 1
+                        try:
+                            await self._handle_frame(msg.data)
+                        except Exception as err:
+                            self.stats.malformed_messages += 1
+                            LOGGER.error("Failed to handle WS message: %s", err)
+                    elif msg.type == aiohttp.WSMsgType.ERROR:
+                        LOGGER.warning("Voicemeeter WS error frame received")
+                        break
+                    elif msg.type in [
+                        aiohttp.WSMsgType.CLOSE,
+                        aiohttp.WSMsgType.CLOSED,
+                        aiohttp.WSMsgType.CLOSING,
+                    ]:
+                        LOGGER.info("Voicemeeter disconnected from companion websocket")
+                        break
+            finally:
+                loop_lag.stop()
+                self._ws = None
+
+    async def _handle_frame(self, data: str) -> None:
+        """Decode one frame, off the loop if it is large, and deliver it."""
+        if self._offload is not None and len(data) > LARGE_FRAME_SIZE:
+            self.stats.offloaded_messages += 1
+            message = await self._offload(self._decode, data)
+            start = time.perf_counter()
+        else:
+            start = time.perf_counter()
+            message = self._decode(data)
+        self._on_message(message)
+        self.stats.record_loop_time(time.perf_counter() - start)
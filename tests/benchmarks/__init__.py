@@ -0,0 +1 @@
+"""Benchmarks for the Voicemeeter integration, run as part of the test suite."""
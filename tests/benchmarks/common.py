@@ -0,0 +1,15 @@
+"""Helpers shared by the benchmarks."""
+
+from __future__ import annotations
+
+import statistics
+
+
+def summary(name: str, samples: list[float]) -> str:
+    """Median, p95 and max of samples in seconds, as one report line."""
+    ms = sorted(s * 1000 for s in samples)
+    p95 = ms[int(len(ms) * 0.95) - 1]
+    return (
+        f"{name:<10} median {statistics.median(ms):6.3f} ms  "
+        f"p95 {p95:6.3f} ms  max {ms[-1]:6.3f} ms"
+    )
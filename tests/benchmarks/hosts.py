@@ -0,0 +1,83 @@
+"""
+Fake companions served from a separate process.
+
+Real hosts are other machines. Serving them from the loop, or even the
+process, under test would add their handshakes, JSON encoding and GIL
+contention to the event loop lag a benchmark measures.
+
+Run as ``python -m tests.benchmarks.hosts KIND COUNT``: prints the ports
+on one line, then reads commands from stdin, one per line: "drop" closes
+every connection, "push" sends every client a state dump, "stop" exits.
+Each command is acknowledged with "ok" once done.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+from tests.fakes import FakeCompanion
+
+
+async def _serve(kind: str, count: int) -> None:
+    companions = [FakeCompanion(kind, extended=True) for _ in range(count)]
+    for companion in companions:
+        await companion.start()
+    print(" ".join(str(c.port) for c in companions), flush=True)  # noqa: T201
+
+    loop = asyncio.get_running_loop()
+    while command := (await loop.run_in_executor(None, sys.stdin.readline)).strip():
+        if command == "drop":
+            await asyncio.gather(*(c.drop() for c in companions))
+        elif command == "push":
+            await asyncio.gather(*(c.broadcast(c.state) for c in companions))
+        elif command == "stop":
+            break
+        print("ok", flush=True)  # noqa: T201
+
+    for companion in companions:
+        await companion.stop()
+
+
+class RemoteHosts:
+    """Client side: starts the host process and sends it commands."""
+
+    def __init__(self, kind: str, count: int) -> None:
+        self._kind = kind
+        self._count = count
+        self._process: asyncio.subprocess.Process | None = None
+        self.ports: list[int] = []
+
+    async def start(self) -> None:
+        self._process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            __name__,
+            self._kind,
+            str(self._count),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        self.ports = [int(port) for port in (await self._readline()).split()]
+
+    async def stop(self) -> None:
+        if self._process is None:
+            return
+        self._process.stdin.write(b"stop\n")
+        await self._process.stdin.drain()
+        await self._process.wait()
+        self._process = None
+
+    async def command(self, command: str) -> None:
+        """Send a command; returns once the hosts have carried it out."""
+        self._process.stdin.write(f"{command}\n".encode())
+        await self._process.stdin.drain()
+        assert await self._readline() == "ok"
+
+    async def _readline(self) -> str:
+        async with asyncio.timeout(10):
+            return (await self._process.stdout.readline()).decode().strip()
+
+
+if __name__ == "__main__":
+    asyncio.run(_serve(sys.argv[1], int(sys.argv[2])))
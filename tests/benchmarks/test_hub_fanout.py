@@ -0,0 +1,71 @@
+"""Latency of the StateHub fan-out to many WebSocket subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.typing import (
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
+
+from tests.benchmarks.common import summary
+from tests.common import async_setup_entry
+from tests.fakes import FakeCompanion
+
+SUBSCRIBER_COUNTS = (1, 100, 500)
+CLIENTS = 4  # subscribers are spread over this many WebSocket connections
+UPDATES = 50
+
+
+async def _receive(client: MockHAClientWebSocket, count: int) -> None:
+    for _ in range(count):
+        await client.receive_json()
+
+
+async def test_hub_fan_out_latency(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    companion: FakeCompanion,
+    report: Callable[[str], None],
+) -> None:
+    """Time from a companion update until every subscriber has received it."""
+    entry = await async_setup_entry(hass, companion.port)
+    results = {}
+    for count in SUBSCRIBER_COUNTS:
+        clients = [await hass_ws_client(hass) for _ in range(min(count, CLIENTS))]
+        per_client = count // len(clients)
+        for client in clients:
+            for _ in range(per_client):
+                await client.send_json_auto_id(
+                    {"type": "voicemeeter/subscribe", "entry_id": entry.entry_id}
+                )
+            # Result, snapshot and connection event per subscription.
+            await _receive(client, per_client * 3)
+
+        samples = []
+        for n in range(UPDATES):
+            start = time.perf_counter()
+            await companion.broadcast(
+                {
+                    "type": "update",
+                    "target": "bus",
+                    "index": 0,
+                    "param": "gain",
+                    "value": -1.0 - n % 2,
+                }
+            )
+            await asyncio.gather(*(_receive(client, per_client) for client in clients))
+            samples.append(time.perf_counter() - start)
+        results[count] = samples
+        for client in clients:
+            await client.close()
+        await hass.async_block_till_done()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    report(f"hub fan-out ({UPDATES} updates, {CLIENTS} connections)")
+    for count, samples in results.items():
+        report("  " + summary(f"{count} subs", samples))
@@ -0,0 +1,46 @@
+"""Throughput of the change journal, on the event loop and to disk."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.voicemeeter.data import ParamChange
+from custom_components.voicemeeter.journal import ChangeJournal
+
+RECORDS = 100_000  # about 8 MiB, so the journal rotates once
+FRAME = 40  # changes per host frame, e.g. a scene recall on Potato
+
+
+async def test_journal_throughput(
+    hass: HomeAssistant, tmp_path: Path, report: Callable[[str], None]
+) -> None:
+    path = tmp_path / "journal.jsonl"
+    change_journal = ChangeJournal(hass, path)
+    frame = [ParamChange("strip", i % 8, "gain", -i / 10) for i in range(FRAME)]
+
+    start = time.perf_counter()
+    loop_time = 0.0
+    for _ in range(RECORDS // FRAME):
+        frame_start = time.perf_counter()
+        change_journal.record_changes(frame)
+        loop_time += time.perf_counter() - frame_start
+        # Let the early flushes run, as frames arrive between loop iterations.
+        await hass.async_block_till_done()
+    await change_journal.async_stop()
+    total = time.perf_counter() - start
+
+    files = sorted(tmp_path.glob("journal.jsonl*"))
+    written = sum(1 for file in files for _ in file.open())
+    report(f"journal ({RECORDS} records in frames of {FRAME})")
+    report(
+        f"  on the event loop  {RECORDS / loop_time:12,.0f} records/s  "
+        f"({loop_time / RECORDS * 1e6:.2f} us per record)"
+    )
+    report(f"  written to disk    {written / total:12,.0f} records/s")
+    size = sum(file.stat().st_size for file in files)
+    report(f"  journal size       {size / 1024 / 1024:12.1f} MiB in {len(files)} files")
+    assert written == RECORDS
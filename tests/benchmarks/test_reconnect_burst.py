@@ -0,0 +1,222 @@
+"""
+Event loop lag while many hosts send state at once, and what offloading does.
+
+The burst benchmark reconnects 30 hosts at once, as after a network blip,
+and has them all push a state dump over open connections. The crossover
+benchmark finds the frame size from which decoding in the executor lowers
+loop lag, which is what LARGE_FRAME_SIZE is based on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import aiohttp
+import pytest
+
+from custom_components.voicemeeter import websocket
+from custom_components.voicemeeter.coordinator import PARSED_STATE
+from custom_components.voicemeeter.data import parse_state_message
+from custom_components.voicemeeter.params import ParamSelection
+from custom_components.voicemeeter.transport import LoopLagMonitor
+from custom_components.voicemeeter.websocket import VoicemeeterWebSocket
+from tests.benchmarks.common import summary
+from tests.benchmarks.hosts import RemoteHosts
+from tests.fakes import HOST, state_message
+
+KIND = "potato"
+HOSTS = 30
+BURSTS = 10
+PROBE_INTERVAL = 0.001  # seconds
+CROSSOVER_REPEATS = 10
+CROSSOVER_SIZES = (1, 8, 32, 64, 128)  # multiples of an extended Potato dump
+
+
+def _decode(raw: str) -> dict[str, Any]:
+    """Decode like the coordinator's decode_frame, without a coordinator."""
+    msg = json.loads(raw)
+    if msg.get("type") == "state":
+        msg[PARSED_STATE] = parse_state_message(msg, ParamSelection())
+    return msg
+
+
+def _transport(
+    session: aiohttp.ClientSession, port: int, on_message: Callable[..., None]
+) -> VoicemeeterWebSocket:
+    """Build a transport wired up like the integration's."""
+    loop = asyncio.get_running_loop()
+    return VoicemeeterWebSocket(
+        session,
+        HOST,
+        port,
+        on_message,
+        lambda: None,
+        lambda: None,
+        decode=_decode,
+        offload=functools.partial(loop.run_in_executor, None),
+    )
+
+
+async def _warm_up_executor() -> None:
+    """Start the executor's threads, as a running HA instance has."""
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        *(loop.run_in_executor(None, json.loads, "1") for _ in range(HOSTS))
+    )
+
+
+class _Hosts:
+    """One transport per remote host, counting the state dumps received."""
+
+    def __init__(self, session: aiohttp.ClientSession, ports: list[int]) -> None:
+        self.states = 0
+        self._arrived = asyncio.Event()
+        self.transports = [
+            _transport(session, port, self._on_message) for port in ports
+        ]
+
+    def _on_message(self, message: dict[str, Any]) -> None:
+        if message["type"] == "state":
+            self.states += 1
+            self._arrived.set()
+
+    async def wait_states(self, count: int) -> None:
+        async with asyncio.timeout(10):
+            while self.states < count:
+                self._arrived.clear()
+                await self._arrived.wait()
+
+
+@dataclass
+class _Result:
+    reconnect_lag: list[float] = field(default_factory=list)
+    push_lag: list[float] = field(default_factory=list)
+    frame_loop_time_max_ms: float = 0.0
+    frame_loop_time_mean_ms: float = 0.0
+    offloaded: int = 0
+
+
+async def _run(session: aiohttp.ClientSession, remote: RemoteHosts) -> _Result:
+    """
+    Measure loop lag in two kinds of burst, BURSTS times each.
+
+    Reconnects: every host drops its connection, and the transports all
+    reconnect and receive a state dump. Pushes: every host sends a state
+    dump over its open connection, isolating the frame handling.
+    """
+    result = _Result()
+    hosts = _Hosts(session, remote.ports)
+    tasks = [asyncio.create_task(t.start()) for t in hosts.transports]
+    try:
+        await hosts.wait_states(HOSTS)
+        for lag, command in ((result.reconnect_lag, "drop"), (result.push_lag, "push")):
+            monitor = LoopLagMonitor(PROBE_INTERVAL, lag.append)
+            for _ in range(BURSTS):
+                expected = hosts.states + HOSTS
+                monitor.start()
+                await remote.command(command)
+                await hosts.wait_states(expected)
+                monitor.stop()
+    finally:
+        for transport in hosts.transports:
+            await transport.stop()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    stats = [t.stats for t in hosts.transports]
+    result.frame_loop_time_max_ms = max(s.loop_time_max_ms for s in stats)
+    result.frame_loop_time_mean_ms = sum(s.loop_time_total_ms for s in stats) / sum(
+        s.messages for s in stats
+    )
+    result.offloaded = sum(s.offloaded_messages for s in stats)
+    return result
+
+
+async def test_burst_loop_lag(
+    socket_enabled: None,
+    report: Callable[[str], None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Compare loop lag with state dumps decoded inline and in the executor."""
+    monkeypatch.setattr(websocket, "RECONNECT_DELAY", 0)
+    await _warm_up_executor()
+    remote = RemoteHosts(KIND, HOSTS)
+    await remote.start()
+    session = aiohttp.ClientSession()
+    try:
+        inline = await _run(session, remote)
+        monkeypatch.setattr(websocket, "LARGE_FRAME_SIZE", 0)
+        offloaded = await _run(session, remote)
+    finally:
+        await session.close()
+        await remote.stop()
+
+    size = len(json.dumps(state_message(KIND, extended=True)))
+    report(
+        f"state bursts ({HOSTS} {KIND.title()} hosts in another process, "
+        f"{size} char state dumps, {BURSTS} bursts each)"
+    )
+    for name, result in (("inline", inline), ("offloaded", offloaded)):
+        report(
+            f"  {name:<10} frame handling on the loop: "
+            f"mean {result.frame_loop_time_mean_ms:6.3f} ms  "
+            f"max {result.frame_loop_time_max_ms:6.3f} ms"
+        )
+        report("    " + summary("reconnect", result.reconnect_lag) + "  loop lag")
+        report("    " + summary("push", result.push_lag) + "  loop lag")
+
+    # Real state dumps stay under the threshold.
+    assert inline.offloaded == 0
+    assert offloaded.offloaded == HOSTS * (2 * BURSTS + 1)
+
+
+async def _crossover_lag(transport: VoicemeeterWebSocket, raw: str) -> float:
+    """Worst loop lag while handling a frame repeatedly, in seconds."""
+    lag: list[float] = []
+    monitor = LoopLagMonitor(PROBE_INTERVAL, lag.append)
+    monitor.start()
+    for _ in range(CROSSOVER_REPEATS):
+        await transport._handle_frame(raw)
+        # Let the probe run between frames.
+        await asyncio.sleep(5 * PROBE_INTERVAL)
+    monitor.stop()
+    return max(lag)
+
+
+async def test_offload_crossover(
+    report: Callable[[str], None], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Loop lag of one frame decoded inline vs in the executor, by size."""
+    await _warm_up_executor()
+    dump = state_message(KIND, extended=True)
+
+    report(f"offload crossover (worst loop lag over {CROSSOVER_REPEATS} frames)")
+    async with aiohttp.ClientSession() as session:
+        # Frames are fed to the transport directly; it never connects.
+        transport = _transport(session, 0, lambda _: None)
+        for multiple in CROSSOVER_SIZES:
+            raw = json.dumps({**dump, "strips": dump["strips"] * multiple})
+            start = time.perf_counter()
+            _decode(raw)
+            decode = time.perf_counter() - start
+
+            monkeypatch.setattr(websocket, "LARGE_FRAME_SIZE", len(raw))
+            inline = await _crossover_lag(transport, raw)
+            monkeypatch.setattr(websocket, "LARGE_FRAME_SIZE", 0)
+            offloaded = await _crossover_lag(transport, raw)
+            report(
+                f"  {len(raw) // 1024:4} KB  decode {decode * 1000:6.2f} ms  "
+                f"lag inline {inline * 1000:6.2f} ms  "
+                f"offloaded {offloaded * 1000:6.2f} ms"
+            )
+
+    assert transport.stats.offloaded_messages == CROSSOVER_REPEATS * len(
+        CROSSOVER_SIZES
+    )
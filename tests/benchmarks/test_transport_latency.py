@@ -0,0 +1,114 @@
+"""Command round-trip latency of the WebSocket and VBAN transports."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+import aiohttp
+
+from custom_components.voicemeeter.transport import VoicemeeterTransport
+from custom_components.voicemeeter.vban import VoicemeeterVban
+from custom_components.voicemeeter.websocket import VoicemeeterWebSocket
+from tests.benchmarks.common import summary
+from tests.fakes import HOST, FakeCompanion, FakeVban
+
+ROUND_TRIPS = 200
+
+
+class _RoundTrips:
+    """Times set commands until the host reports the new value back."""
+
+    def __init__(self) -> None:
+        self.connected = asyncio.Event()
+        self._expected: float | None = None
+        self._done: asyncio.Future[float] | None = None
+
+    def on_message(self, message: dict[str, Any]) -> None:
+        if message["type"] == "state":
+            self.connected.set()
+        elif (
+            message["type"] == "update"
+            and message["param"] == "gain"
+            and message["value"] == self._expected
+            and self._done
+            and not self._done.done()
+        ):
+            self._done.set_result(time.perf_counter())
+
+    async def run(self, transport: VoicemeeterTransport) -> list[float]:
+        await asyncio.wait_for(self.connected.wait(), 5)
+        samples = []
+        for n in range(ROUND_TRIPS):
+            # Alternate values so every command is an actual change.
+            self._expected = -1.0 - n % 2
+            self._done = asyncio.get_running_loop().create_future()
+            start = time.perf_counter()
+            await transport.send(
+                {
+                    "type": "set",
+                    "target": "strip",
+                    "index": 0,
+                    "param": "gain",
+                    "value": self._expected,
+                }
+            )
+            samples.append(await asyncio.wait_for(self._done, 1) - start)
+        return samples
+
+
+async def _run(
+    make_transport: Callable[[_RoundTrips], VoicemeeterTransport],
+) -> list[float]:
+    trips = _RoundTrips()
+    transport = make_transport(trips)
+    task = asyncio.create_task(transport.start())
+    try:
+        return await trips.run(transport)
+    finally:
+        await transport.stop()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def test_transport_round_trip_latency(
+    socket_enabled: None, report: Callable[[str], None]
+) -> None:
+    """Compare set-to-update latency of both transports against local hosts."""
+    companion = FakeCompanion("banana")
+    vban_host = FakeVban("banana")
+    await companion.start()
+    await vban_host.start()
+    session = aiohttp.ClientSession()
+    try:
+        websocket = await _run(
+            lambda trips: VoicemeeterWebSocket(
+                session,
+                HOST,
+                companion.port,
+                trips.on_message,
+                lambda: None,
+                lambda: None,
+            )
+        )
+        vban = await _run(
+            lambda trips: VoicemeeterVban(
+                HOST,
+                vban_host.port,
+                "Command1",
+                trips.on_message,
+                lambda: None,
+                lambda: None,
+            )
+        )
+    finally:
+        await session.close()
+        await companion.stop()
+        await vban_host.stop()
+
+    report(f"transport round trip ({ROUND_TRIPS} commands, local hosts)")
+    report("  " + summary("websocket", websocket))
+    report("  " + summary("vban", vban))
+    assert len(websocket) == len(vban) == ROUND_TRIPS
@@ -0,0 +1,43 @@
+"""Helpers for setting up Voicemeeter entries against the local stand-ins."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.voicemeeter.const import (
+    CONF_HOST,
+    CONF_PORT,
+    CONF_STREAM_NAME,
+    CONF_TRANSPORT,
+    DOMAIN,
+    TRANSPORT_VBAN,
+    TRANSPORT_WEBSOCKET,
+)
+from tests.fakes import HOST
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    port: int,
+    *,
+    transport: str = TRANSPORT_WEBSOCKET,
+    options: dict[str, Any] | None = None,
+) -> MockConfigEntry:
+    """Add and set up an entry pointing at a stand-in listening on port."""
+    data = {CONF_HOST: HOST, CONF_PORT: port, CONF_TRANSPORT: transport}
+    if transport == TRANSPORT_VBAN:
+        data[CONF_STREAM_NAME] = "Command1"
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=data,
+        options=options or {},
+        unique_id=f"{HOST}:{port}",
+        title="Test",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
@@ -0,0 +1,49 @@
+"""Shared fixtures for the Voicemeeter tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+
+import pytest
+
+from tests.fakes import FakeCompanion, FakeVban
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+# Lines reported by benchmarks and soak runs, printed after the test summary.
+_REPORT: list[str] = []
+
+
+@pytest.fixture
+def report() -> Callable[[str], None]:
+    """Add a line to the benchmark/soak summary printed at the end of the run."""
+    return _REPORT.append
+
+
+@pytest.fixture
+async def companion(
+    socket_enabled: None, enable_custom_integrations: None
+) -> AsyncIterator[FakeCompanion]:
+    """A running companion stand-in (Voicemeeter Banana)."""
+    fake = FakeCompanion("banana")
+    await fake.start()
+    yield fake
+    await fake.stop()
+
+
+@pytest.fixture
+async def vban_host(
+    socket_enabled: None, enable_custom_integrations: None
+) -> AsyncIterator[FakeVban]:
+    """A running VBAN remote stand-in (Voicemeeter Banana)."""
+    fake = FakeVban("banana")
+    await fake.start()
+    yield fake
+    await fake.stop()
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    if _REPORT:
+        terminalreporter.section("Voicemeeter benchmarks")
+        for line in _REPORT:
+            terminalreporter.write_line(line)
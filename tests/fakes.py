@@ -0,0 +1,321 @@
+"""
+Local stand-ins for a Voicemeeter host.
+
+FakeCompanion speaks the companion app's WebSocket protocol and FakeVban
+answers like Voicemeeter's VBAN remote, both on 127.0.0.1. Tests, the soak
+harness and the benchmarks drive the real transports against them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import re
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+from custom_components.voicemeeter.const import (
+    BUS_LABELS,
+    KIND_BUSES,
+    KIND_HARDWARE_STRIPS,
+    KIND_VIRTUAL_STRIPS,
+    STRIP_LABELS,
+)
+from custom_components.voicemeeter.params import PARAMETERS
+from custom_components.voicemeeter.vban import (
+    _HEADER,
+    _RT_PACKET,
+    _STATE_MUTE,
+    _STATE_ROUTES,
+    VBAN_PROTOCOL_MASK,
+    VBAN_PROTOCOL_SERVICE,
+    VBAN_PROTOCOL_TXT,
+    VBAN_SERVICE_RTPACKET,
+    _pack_header,
+)
+
+HOST = "127.0.0.1"
+
+_VBAN_KIND_CODES = {"basic": 1, "banana": 2, "potato": 3}
+_ROUTES = ["a1", "a2", "a3", "a4", "a5", "b1", "b2", "b3"]
+
+
+def state_message(
+    kind: str = "banana", protocol: str = "1.1", *, extended: bool = False
+) -> dict[str, Any]:
+    """
+    Build a companion state dump for a Voicemeeter variant.
+
+    With extended=True every catalogue parameter the variant has is
+    included, which is the largest dump a companion could send.
+    """
+    hardware = KIND_HARDWARE_STRIPS[kind]
+    strips = []
+    for index in range(hardware + KIND_VIRTUAL_STRIPS[kind]):
+        strip: dict[str, Any] = {
+            "index": index,
+            "label": STRIP_LABELS[kind][index],
+            "virtual": index >= hardware,
+            "mute": False,
+            "gain": 0.0,
+            **dict.fromkeys(_ROUTES, False),
+        }
+        if extended:
+            for spec in PARAMETERS:
+                if (
+                    spec.target == "strip"
+                    and not spec.core
+                    and spec.applies_to(kind, strip["virtual"])
+                ):
+                    strip[spec.key] = spec.kind(spec.min)
+        strips.append(strip)
+
+    buses = []
+    for index in range(KIND_BUSES[kind]):
+        bus: dict[str, Any] = {
+            "index": index,
+            "label": BUS_LABELS[kind][index],
+            "mute": False,
+            "gain": 0.0,
+        }
+        if extended:
+            for spec in PARAMETERS:
+                if spec.target == "bus" and not spec.core and kind in spec.kinds:
+                    bus[spec.key] = spec.kind(spec.min)
+        buses.append(bus)
+
+    return {
+        "type": "state",
+        "kind": kind,
+        "protocol": protocol,
+        "strips": strips,
+        "buses": buses,
+    }
+
+
+class FakeCompanion:
+    """
+    WebSocket server behaving like the Windows companion app.
+
+    Sends a state dump on connect, applies set/batch commands and echoes
+    each as an update message. The chaos helpers let the soak harness
+    drop, stall and corrupt connections.
+    """
+
+    def __init__(self, kind: str = "banana", *, extended: bool = False) -> None:
+        self.state = state_message(kind, extended=extended)
+        self.received: list[dict[str, Any]] = []
+        self.connections = 0
+        self._sockets: set[web.WebSocketResponse] = set()
+        self._stalled = asyncio.Event()
+        self._stalled.set()
+        self._runner: web.AppRunner | None = None
+        self.port = 0
+
+    async def start(self) -> None:
+        """Listen on a free port on 127.0.0.1."""
+        app = web.Application()
+        app.router.add_get("/ws", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, HOST, 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Close every client and stop listening."""
+        self._stalled.set()
+        await self.drop()
+        if self._runner:
+            await self._runner.cleanup()
+
+    @property
+    def clients(self) -> int:
+        return len(self._sockets)
+
+    async def drop(self) -> None:
+        """Close all client connections."""
+        for ws in list(self._sockets):
+            await ws.close()
+
+    def stall(self) -> None:
+        """Stop answering until resume() is called."""
+        self._stalled.clear()
+
+    def resume(self) -> None:
+        self._stalled.set()
+
+    async def send_raw(self, data: str) -> None:
+        """Send a frame as-is to every client, e.g. a malformed one."""
+        for ws in list(self._sockets):
+            with contextlib.suppress(ConnectionError):
+                await ws.send_str(data)
+
+    async def broadcast(self, message: dict[str, Any]) -> None:
+        for ws in list(self._sockets):
+            with contextlib.suppress(ConnectionError):
+                await ws.send_json(message)
+
+    async def set_kind(self, kind: str) -> None:
+        """Switch Voicemeeter variant and push the new state to clients."""
+        self.state = state_message(kind)
+        await self.broadcast(self.state)
+
+    async def _handle(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+        self._sockets.add(ws)
+        try:
+            await self._stalled.wait()
+            await ws.send_json(self.state)
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    break
+                await self._stalled.wait()
+                await self._handle_command(ws, msg.json())
+        finally:
+            self._sockets.discard(ws)
+        return ws
+
+    async def _handle_command(
+        self, ws: web.WebSocketResponse, message: dict[str, Any]
+    ) -> None:
+        self.received.append(message)
+        commands = message["commands"] if message["type"] == "batch" else [message]
+        for command in commands:
+            channels = self.state["strips" if command["target"] == "strip" else "buses"]
+            channels[command["index"]][command["param"]] = command["value"]
+            await ws.send_json({**command, "type": "update"})
+
+
+def rt_packet(
+    kind: str = "banana",
+    *,
+    strip_state: list[int] | None = None,
+    bus_state: list[int] | None = None,
+    strip_gains: list[float] | None = None,
+    bus_gains: list[float] | None = None,
+    labels: list[str] | None = None,
+    levels: list[float] | None = None,
+) -> bytes:
+    """Build a VBAN RT packet (header included) as Voicemeeter sends it."""
+    layers = [0] * 64
+    input_levels = [round(level * 100) for level in levels or []]
+    input_levels += [0] * (34 - len(input_levels))
+    for index, gain in enumerate(strip_gains or []):
+        layers[index] = round(gain * 100)
+    strip_labels = b"".join(
+        label.encode()[:60].ljust(60, b"\0") for label in (labels or [])
+    )
+    payload = _RT_PACKET.pack(
+        _VBAN_KIND_CODES[kind],
+        0,
+        512,
+        0,
+        0,
+        48000,
+        *input_levels,
+        *[0] * 64,
+        0,
+        *(strip_state or [0] * 8),
+        *(bus_state or [0] * 8),
+        *layers,
+        *[round(gain * 100) for gain in (bus_gains or [0.0] * 8)],
+        strip_labels.ljust(480, b"\0"),
+        b"".ljust(480, b"\0"),
+    )
+    header = _pack_header(
+        VBAN_PROTOCOL_SERVICE, 0, VBAN_SERVICE_RTPACKET, 0, "Voicemeeter-RTP", 0
+    )
+    return header + payload
+
+
+_STATEMENT = re.compile(r"(Strip|Bus)\[(\d+)\]\.([\w.\[\]]+)=([^;]+);")
+_ROUTE_SCRIPT_BITS = {key.upper(): bit for key, bit in _STATE_ROUTES.items()}
+
+
+class _FakeVbanProtocol(asyncio.DatagramProtocol):
+    def __init__(self, host: FakeVban) -> None:
+        self._host = host
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        self._host.handle_datagram(data, addr)
+
+
+class FakeVban:
+    """
+    UDP endpoint behaving like Voicemeeter's VBAN remote.
+
+    Answers RT-packet registrations with an RT packet, applies the mute,
+    gain and route statements of VBAN-TEXT packets and immediately sends a
+    fresh RT packet, like Voicemeeter does on every change.
+    """
+
+    def __init__(self, kind: str = "banana") -> None:
+        self.kind = kind
+        self.strip_state = [0] * 8
+        self.bus_state = [0] * 8
+        self.strip_gains = [0.0] * 8
+        self.bus_gains = [0.0] * 8
+        self.levels = [-60.0] * 34  # input channel levels (dB), silence
+        self.scripts: list[str] = []
+        self.registrations = 0
+        self.silent = False  # stop answering, as if Voicemeeter went away
+        self._client: tuple[str, int] | None = None
+        self._udp: asyncio.DatagramTransport | None = None
+        self.port = 0
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._udp, _ = await loop.create_datagram_endpoint(
+            lambda: _FakeVbanProtocol(self), local_addr=(HOST, 0)
+        )
+        self.port = self._udp.get_extra_info("sockname")[1]
+
+    async def stop(self) -> None:
+        if self._udp:
+            self._udp.close()
+            self._udp = None
+
+    def push(self) -> None:
+        """Send the current state to the registered client."""
+        if self._client is None or self._udp is None or self.silent:
+            return
+        self._udp.sendto(
+            rt_packet(
+                self.kind,
+                strip_state=self.strip_state,
+                bus_state=self.bus_state,
+                strip_gains=self.strip_gains,
+                bus_gains=self.bus_gains,
+                levels=self.levels,
+            ),
+            self._client,
+        )
+
+    def handle_datagram(self, data: bytes, addr: tuple[str, int]) -> None:
+        if self.silent or len(data) < _HEADER.size or data[:4] != b"VBAN":
+            return
+        sub_protocol = data[4] & VBAN_PROTOCOL_MASK
+        if sub_protocol == VBAN_PROTOCOL_SERVICE:
+            self.registrations += 1
+            self._client = addr
+        elif sub_protocol == VBAN_PROTOCOL_TXT:
+            script = data[_HEADER.size :].decode()
+            self.scripts.append(script)
+            for target, index, param, value in _STATEMENT.findall(script):
+                self._apply(target, int(index), param, float(value))
+        self.push()
+
+    def _apply(self, target: str, index: int, param: str, value: float) -> None:
+        states = self.strip_state if target == "Strip" else self.bus_state
+        if param == "Gain":
+            gains = self.strip_gains if target == "Strip" else self.bus_gains
+            gains[index] = value
+            return
+        bit = _STATE_MUTE if param == "Mute" else _ROUTE_SCRIPT_BITS.get(param)
+        if bit is None:
+            return
+        states[index] = states[index] | bit if value else states[index] & ~bit
@@ -0,0 +1 @@
+"""Soak and chaos runs for the connection lifecycle."""
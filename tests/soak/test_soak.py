@@ -0,0 +1,207 @@
+"""
+Soak harness: a loaded entry against a misbehaving companion.
+
+The stand-in randomly drops connections, stalls, sends malformed frames
+and switches Voicemeeter kind (which reloads the entry), while the harness
+also reloads the entry and sends commands. After a warm-up covering every
+action once, task count, open file descriptors and traced memory are
+sampled; after the run they must be back where they were.
+
+Tune with environment variables:
+    VOICEMEETER_SOAK_SECONDS  run time after warm-up (default 5)
+    VOICEMEETER_SOAK_SEED     random seed, to replay a failing run
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+import os
+import random
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import DATA_ENTITY_PLATFORM
+
+from custom_components.voicemeeter import websocket
+from custom_components.voicemeeter.commands import make_command
+from tests.common import async_setup_entry
+from tests.fakes import FakeCompanion
+
+SOAK_SECONDS = float(os.environ.get("VOICEMEETER_SOAK_SECONDS", "5"))
+SOAK_SEED = int(os.environ.get("VOICEMEETER_SOAK_SEED", str(time.time_ns() % 10**6)))
+
+# Allowed drift between the post-warm-up sample and the final one.
+MAX_TASK_GROWTH = 0
+MAX_FD_GROWTH = 0
+# asyncio leaves cancelled timers (heartbeats and timeouts of dropped
+# connections, with their debug-mode source tracebacks) on the heap until
+# more than 100 are scheduled, which plateaus at roughly 200 KiB.
+MAX_MEMORY_GROWTH = 512 * 1024  # bytes
+
+SETTLE_TIMEOUT = 10  # seconds to reconnect and finish reloads after the run
+
+
+@dataclass
+class Sample:
+    tasks: int
+    fds: int
+    memory: int
+
+
+def _forget_unloaded_platforms(hass: HomeAssistant) -> None:
+    """
+    Drop the empty entity platforms Home Assistant keeps after unloads.
+
+    EntityComponent.async_unload_entry resets a platform but leaves it in
+    DATA_ENTITY_PLATFORM, so every reload would otherwise add a few KiB
+    that are not this integration's to free.
+    """
+    for platforms in hass.data.get(DATA_ENTITY_PLATFORM, {}).values():
+        platforms[:] = [platform for platform in platforms if platform.entities]
+
+
+def _sample(hass: HomeAssistant) -> Sample:
+    _forget_unloaded_platforms(hass)
+    gc.collect()
+    return Sample(
+        tasks=len(asyncio.all_tasks()),
+        fds=len(list(Path("/proc/self/fd").iterdir())),
+        memory=tracemalloc.get_traced_memory()[0],
+    )
+
+
+class Chaos:
+    """The actions the harness picks from, counted for the summary."""
+
+    def __init__(
+        self, hass: HomeAssistant, companion: FakeCompanion, entry_id: str
+    ) -> None:
+        self._hass = hass
+        self._companion = companion
+        self._entry_id = entry_id
+        self.counts: Counter[str] = Counter()
+
+    @property
+    def actions(self) -> list[Callable[[random.Random], object]]:
+        return [
+            self.drop,
+            self.stall,
+            self.malformed,
+            self.change_kind,
+            self.reload,
+            self.commands,
+        ]
+
+    async def drop(self, rng: random.Random) -> None:
+        await self._companion.drop()
+
+    async def stall(self, rng: random.Random) -> None:
+        self._companion.stall()
+        await asyncio.sleep(rng.uniform(0.05, 0.3))
+        self._companion.resume()
+
+    async def malformed(self, rng: random.Random) -> None:
+        await self._companion.send_raw(
+            rng.choice(["{not json", '{"type": "update"}', "[]", '"state"'])
+        )
+
+    async def change_kind(self, rng: random.Random) -> None:
+        kind = "potato" if self._companion.state["kind"] == "banana" else "banana"
+        await self._companion.set_kind(kind)
+
+    async def reload(self, rng: random.Random) -> None:
+        await self._hass.config_entries.async_reload(self._entry_id)
+
+    async def commands(self, rng: random.Random) -> None:
+        entry = self._hass.config_entries.async_get_entry(self._entry_id)
+        if entry.state is not ConfigEntryState.LOADED:
+            return
+        await entry.runtime_data.coordinator.async_send_commands(
+            [make_command("strip", i, "mute", rng.random() < 0.5) for i in range(3)]
+        )
+        # The stand-in's log of received commands would grow with the run.
+        self._companion.received.clear()
+
+    async def run(
+        self, action: Callable[[random.Random], object], rng: random.Random
+    ) -> None:
+        self.counts[action.__name__] += 1
+        await action(rng)
+        await asyncio.sleep(rng.uniform(0, 0.05))
+
+
+async def _settle(hass: HomeAssistant, companion: FakeCompanion, entry_id: str) -> None:
+    """Wait until the entry is loaded and connected again."""
+    companion.resume()
+    async with asyncio.timeout(SETTLE_TIMEOUT):
+        while True:
+            await hass.async_block_till_done()
+            entry = hass.config_entries.async_get_entry(entry_id)
+            if (
+                entry.state is ConfigEntryState.LOADED
+                and entry.runtime_data.coordinator.connected
+                and companion.clients == 1
+            ):
+                break
+            await asyncio.sleep(0.05)
+    await asyncio.sleep(0.2)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.timeout(SOAK_SECONDS + 120)
+async def test_connection_lifecycle_soak(
+    hass: HomeAssistant,
+    companion: FakeCompanion,
+    report: Callable[[str], None],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(websocket, "RECONNECT_DELAY", 0.01)
+    rng = random.Random(SOAK_SEED)
+    entry = await async_setup_entry(hass, companion.port)
+    chaos = Chaos(hass, companion, entry.entry_id)
+
+    # Error logs for the malformed frames would pile up in pytest's capture.
+    logging.disable(logging.CRITICAL)
+    tracemalloc.start()
+    try:
+        for action in [*chaos.actions, chaos.change_kind]:  # back to banana
+            await chaos.run(action, rng)
+        await _settle(hass, companion, entry.entry_id)
+        before = _sample(hass)
+
+        deadline = time.monotonic() + SOAK_SECONDS
+        while time.monotonic() < deadline:
+            await chaos.run(rng.choice(chaos.actions), rng)
+        if companion.state["kind"] != "banana":
+            await chaos.change_kind(rng)
+        await _settle(hass, companion, entry.entry_id)
+        after = _sample(hass)
+    finally:
+        tracemalloc.stop()
+        logging.disable(logging.NOTSET)
+
+    report(f"soak: {SOAK_SECONDS:.0f}s, seed {SOAK_SEED}")
+    report(
+        "  actions  " + ", ".join(f"{k} {v}" for k, v in sorted(chaos.counts.items()))
+    )
+    report(f"  companion connections {companion.connections}")
+    report(f"  tasks    {before.tasks} -> {after.tasks}")
+    report(f"  fds      {before.fds} -> {after.fds}")
+    report(
+        f"  memory   {before.memory / 1024:.0f} KiB -> {after.memory / 1024:.0f} KiB"
+    )
+
+    assert after.tasks - before.tasks <= MAX_TASK_GROWTH, (before, after)
+    assert after.fds - before.fds <= MAX_FD_GROWTH, (before, after)
+    assert after.memory - before.memory <= MAX_MEMORY_GROWTH, (before, after)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,79 @@
+"""Tests for batching outbound set commands."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.voicemeeter.commands import CommandBatcher, make_command
+from custom_components.voicemeeter.const import DOMAIN
+from tests.common import async_setup_entry
+from tests.fakes import FakeCompanion
+
+STRIPS = (0, 1, 2)
+
+
+@pytest.mark.parametrize(
+    ("protocol", "frame_types"),
+    [("1.1", ["batch"]), ("1.0", ["set"] * len(STRIPS))],
+)
+async def test_group_action_is_one_frame(
+    hass: HomeAssistant,
+    companion: FakeCompanion,
+    protocol: str,
+    frame_types: list[str],
+) -> None:
+    """One service call on several entities is one batch frame, if supported."""
+    companion.state["protocol"] = protocol
+    entry = await async_setup_entry(hass, companion.port)
+    registry = er.async_get(hass)
+    entity_ids = [
+        registry.async_get_entity_id(
+            SWITCH_DOMAIN, DOMAIN, f"{entry.entry_id}_strip_{index}_mute"
+        )
+        for index in STRIPS
+    ]
+
+    await hass.services.async_call(
+        SWITCH_DOMAIN, SERVICE_TURN_ON, {ATTR_ENTITY_ID: entity_ids}, blocking=True
+    )
+
+    assert [frame["type"] for frame in companion.received] == frame_types
+    if protocol == "1.1":
+        commands = companion.received[0]["commands"]
+        assert sorted(commands, key=lambda command: command["index"]) == [
+            make_command("strip", index, "mute", True) for index in STRIPS
+        ]
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_same_parameter_in_one_tick_keeps_last_value(
+    hass: HomeAssistant,
+) -> None:
+    frames: list[dict[str, Any]] = []
+
+    async def _send(frame: dict[str, Any]) -> None:
+        frames.append(frame)
+
+    batcher = CommandBatcher(hass, _send, lambda: True)
+    await asyncio.gather(
+        batcher.async_add(make_command("strip", 0, "gain", -1.0)),
+        batcher.async_add(make_command("strip", 1, "mute", True)),
+        batcher.async_add(make_command("strip", 0, "gain", -6.0)),
+    )
+
+    assert frames == [
+        {
+            "type": "batch",
+            "commands": [
+                make_command("strip", 0, "gain", -6.0),
+                make_command("strip", 1, "mute", True),
+            ],
+        }
+    ]
@@ -0,0 +1,70 @@
+"""Tests for switching compact routing on and off."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.voicemeeter.const import CONF_COMPACT_ROUTING, DOMAIN
+from custom_components.voicemeeter.sensor import StripRoutingSensor
+from custom_components.voicemeeter.switch import StripRouteSwitch
+from tests.common import async_setup_entry
+from tests.fakes import FakeCompanion
+
+
+async def _set_compact(hass: HomeAssistant, entry_id: str, compact: bool) -> None:
+    entry = hass.config_entries.async_get_entry(entry_id)
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_COMPACT_ROUTING: compact}
+    )
+    await hass.async_block_till_done()
+
+
+async def test_compact_routing_keeps_customisations(
+    hass: HomeAssistant, companion: FakeCompanion
+) -> None:
+    """Toggling the option disables the replaced entities instead of deleting them."""
+    entry = await async_setup_entry(hass, companion.port)
+    registry = er.async_get(hass)
+    route_id = registry.async_get_entity_id(
+        "switch", DOMAIN, StripRouteSwitch.unique_id_for(entry.entry_id, 0, 0)
+    )
+    other_route_id = registry.async_get_entity_id(
+        "switch", DOMAIN, StripRouteSwitch.unique_id_for(entry.entry_id, 0, 1)
+    )
+    registry.async_update_entity(route_id, name="Mic to speakers")
+    registry.async_update_entity(
+        other_route_id, disabled_by=er.RegistryEntryDisabler.USER
+    )
+
+    await _set_compact(hass, entry.entry_id, True)
+
+    route = registry.async_get(route_id)
+    assert route.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+    assert route.name == "Mic to speakers"
+    assert hass.states.get(route_id) is None
+    routing_id = registry.async_get_entity_id(
+        "sensor", DOMAIN, StripRoutingSensor.unique_id_for(entry.entry_id, 0)
+    )
+    assert hass.states.get(routing_id) is not None
+    registry.async_update_entity(routing_id, name="Mic routing")
+
+    await _set_compact(hass, entry.entry_id, False)
+
+    route = registry.async_get(route_id)
+    assert route.disabled_by is None
+    assert route.name == "Mic to speakers"
+    assert hass.states.get(route_id) is not None
+    # Disabled by the user before compact mode, so it stays disabled.
+    assert registry.async_get(other_route_id).disabled_by is (
+        er.RegistryEntryDisabler.USER
+    )
+    routing = registry.async_get(routing_id)
+    assert routing.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+    assert routing.name == "Mic routing"
+
+    await _set_compact(hass, entry.entry_id, True)
+
+    assert registry.async_get(routing_id).disabled_by is None
+    assert hass.states.get(routing_id) is not None
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,256 @@
+"""Tests for the auto-ducking envelope and its timing."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from itertools import pairwise
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant, callback
+
+from custom_components.voicemeeter import websocket
+from custom_components.voicemeeter.const import (
+    CONF_DUCKING,
+    CONF_DUCKING_SOURCE,
+    CONF_DUCKING_TARGETS,
+    TRANSPORT_VBAN,
+)
+from custom_components.voicemeeter.ducking import DuckingConfig, DuckingEngine
+from tests.common import async_setup_entry
+from tests.fakes import FakeCompanion, FakeVban
+
+CONFIG = DuckingConfig(
+    source=0,
+    targets=(1, 2),
+    threshold=-30.0,
+    depth=12.0,
+    attack=0.1,  # 2 ticks of 6 dB
+    release=0.5,  # 10 ticks of 1.2 dB
+    rate=20.0,
+)
+LOAD_BLOCK = 0.004  # seconds the load task holds the event loop per slice
+
+
+class _Coordinator:
+    """Just the parts of the coordinator the engine uses."""
+
+    def __init__(self, gains: list[float]) -> None:
+        self.data = SimpleNamespace(
+            strips=[SimpleNamespace(index=i, gain=g) for i, g in enumerate(gains)]
+        )
+        self.sent: list[tuple[float, dict[int, float]]] = []
+
+    async def async_send_commands(self, commands: list[dict[str, Any]]) -> None:
+        self.sent.append(
+            (time.perf_counter(), {c["index"]: c["value"] for c in commands})
+        )
+
+
+async def _ticks(hass: HomeAssistant, engine: DuckingEngine, count: int) -> None:
+    for _ in range(count):
+        engine._async_tick()
+    await hass.async_block_till_done()
+
+
+async def test_envelope(hass: HomeAssistant) -> None:
+    coordinator = _Coordinator([0.0, -5.0, 0.0])
+    engine = DuckingEngine(hass, coordinator, CONFIG)
+
+    engine.ingest([-10.0])
+    await _ticks(hass, engine, 3)
+    assert [gains for _, gains in coordinator.sent] == [
+        {1: -11.0, 2: -6.0},
+        {1: -17.0, 2: -12.0},
+    ]
+
+    engine.ingest([-50.0])
+    await _ticks(hass, engine, 1)
+    assert coordinator.sent[-1][1] == {1: -15.8, 2: -10.8}
+    await _ticks(hass, engine, 9)
+    assert coordinator.sent[-1][1] == {1: -5.0, 2: 0.0}
+    assert len(coordinator.sent) == 12
+
+
+async def test_peak_is_held_between_ticks(hass: HomeAssistant) -> None:
+    coordinator = _Coordinator([0.0, 0.0, 0.0])
+    engine = DuckingEngine(hass, coordinator, CONFIG)
+
+    # A burst that is already over by the next tick still ducks.
+    engine.ingest([-10.0])
+    engine.ingest([-50.0])
+    await _ticks(hass, engine, 1)
+    assert coordinator.sent == [(coordinator.sent[0][0], {1: -6.0, 2: -6.0})]
+
+
+async def test_stop_restores_gains(hass: HomeAssistant) -> None:
+    coordinator = _Coordinator([0.0, -5.0, 0.0])
+    engine = DuckingEngine(hass, coordinator, CONFIG)
+    engine.ingest([-10.0])
+    await _ticks(hass, engine, 1)
+
+    await engine.async_stop()
+
+    # Sent by the time async_stop returns, without waiting for other tasks.
+    assert coordinator.sent[-1][1] == {1: -5.0, 2: 0.0}
+    await engine.async_stop()
+    assert len(coordinator.sent) == 2
+
+
+async def test_disconnect_releases_and_restores_on_reconnect(
+    hass: HomeAssistant,
+) -> None:
+    coordinator = _Coordinator([0.0, -5.0, 0.0])
+    engine = DuckingEngine(hass, coordinator, CONFIG)
+    engine.ingest([-10.0])
+    await _ticks(hass, engine, 2)
+    assert coordinator.sent[-1][1] == {1: -17.0, 2: -12.0}
+
+    # The mic was still open when the connection dropped.
+    engine.async_handle_disconnect()
+    await _ticks(hass, engine, 5)
+    assert len(coordinator.sent) == 2
+
+    # Strip 2 was changed on the host meanwhile; only strip 1 is restored.
+    engine.async_handle_state(
+        SimpleNamespace(
+            strips=[
+                SimpleNamespace(index=i, gain=g) for i, g in enumerate([0, -17, -3])
+            ]
+        )
+    )
+    await hass.async_block_till_done()
+    assert coordinator.sent[-1][1] == {1: -5.0}
+
+    # Ducking starts afresh from the host's gains once levels are back.
+    engine.ingest([-10.0])
+    await _ticks(hass, engine, 1)
+    assert len(coordinator.sent) == 4
+
+
+async def _time_attack(hass: HomeAssistant, *, load: bool) -> tuple[float, float]:
+    """Run the real control loop; return time to full depth and worst tick gap."""
+    coordinator = _Coordinator([0.0, 0.0, 0.0])
+    engine = DuckingEngine(hass, coordinator, CONFIG)
+    stop_load = asyncio.Event()
+
+    async def _hog() -> None:
+        # Other work keeping the loop busy: blocks in short slices.
+        while not stop_load.is_set():
+            time.sleep(LOAD_BLOCK)  # noqa: ASYNC251
+            await asyncio.sleep(0)
+
+    ticks: list[float] = []
+    tick = engine._async_tick
+
+    @callback
+    def _timed_tick(now: Any = None) -> None:
+        ticks.append(time.perf_counter())
+        tick(now)
+
+    engine._async_tick = _timed_tick
+    load_task = asyncio.create_task(_hog()) if load else None
+    engine.async_start()
+    try:
+        # Level frames as a mic would send them: loud for the attack plus a
+        # few ticks, then quiet until the release has run out.
+        start = time.perf_counter()
+        async with asyncio.timeout(5):
+            while not coordinator.sent or coordinator.sent[-1][1] != {1: 0, 2: 0}:
+                loud = time.perf_counter() - start < CONFIG.attack + 3 / CONFIG.rate
+                engine.ingest([-10.0 if loud else -50.0])
+                await asyncio.sleep(0.01)
+    finally:
+        await engine.async_stop()
+        stop_load.set()
+        if load_task:
+            await load_task
+    await hass.async_block_till_done()
+
+    full_depth = next(
+        sent_at for sent_at, gains in coordinator.sent if gains[1] == -CONFIG.depth
+    )
+    return full_depth - start, max(b - a for a, b in pairwise(ticks))
+
+
+async def test_timing_under_event_loop_load(
+    hass: HomeAssistant, report: Callable[[str], None]
+) -> None:
+    """The envelope keeps to its time constants while the loop is busy."""
+    interval = 1 / CONFIG.rate
+    idle_attack, idle_gap = await _time_attack(hass, load=False)
+    busy_attack, busy_gap = await _time_attack(hass, load=True)
+
+    report(f"ducking at {CONFIG.rate:.0f} Hz, attack {CONFIG.attack * 1000:.0f} ms")
+    for name, attack, gap in (
+        ("idle", idle_attack, idle_gap),
+        (f"loaded ({LOAD_BLOCK * 1000:.0f} ms slices)", busy_attack, busy_gap),
+    ):
+        report(
+            f"  {name:<22} full depth after {attack * 1000:5.1f} ms, "
+            f"worst tick gap {gap * 1000:5.1f} ms"
+        )
+
+    # Load may delay ticks a little, but must not cost a whole tick.
+    for attack, gap in ((idle_attack, idle_gap), (busy_attack, busy_gap)):
+        assert attack < CONFIG.attack + 2 * interval
+        assert gap < 2 * interval
+
+
+async def test_unload_restores_gains_over_vban(
+    hass: HomeAssistant, vban_host: FakeVban
+) -> None:
+    """The restore reaches Voicemeeter even though the transport stops on unload."""
+    vban_host.strip_gains[2] = -5.0
+    entry = await async_setup_entry(
+        hass,
+        vban_host.port,
+        transport=TRANSPORT_VBAN,
+        options={
+            CONF_DUCKING: True,
+            CONF_DUCKING_SOURCE: 0,
+            CONF_DUCKING_TARGETS: [2],
+        },
+    )
+
+    vban_host.levels[:2] = [-10.0, -10.0]
+    vban_host.push()
+    async with asyncio.timeout(5):
+        while vban_host.strip_gains[2] > -17.0:
+            await asyncio.sleep(0.01)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert vban_host.strip_gains[2] == -5.0
+
+
+async def test_disconnect_restores_gains_over_websocket(
+    hass: HomeAssistant, companion: FakeCompanion, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A source loud at the moment of a drop doesn't keep the targets ducked."""
+    monkeypatch.setattr(websocket, "RECONNECT_DELAY", 0.1)
+    companion.state["strips"][2]["gain"] = -5.0
+    entry = await async_setup_entry(
+        hass,
+        companion.port,
+        options={
+            CONF_DUCKING: True,
+            CONF_DUCKING_SOURCE: 0,
+            CONF_DUCKING_TARGETS: [2],
+        },
+    )
+
+    async with asyncio.timeout(5):
+        while companion.state["strips"][2]["gain"] > -17.0:
+            await companion.broadcast({"type": "levels", "strips": [-10.0] * 5})
+            await asyncio.sleep(0.02)
+
+    await companion.drop()
+    async with asyncio.timeout(5):
+        while companion.state["strips"][2]["gain"] != -5.0:
+            await asyncio.sleep(0.02)
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,137 @@
+"""Tests for the voicemeeter/* WebSocket commands."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.typing import WebSocketGenerator
+
+from custom_components.voicemeeter.vban import command_to_script
+from tests.common import async_setup_entry
+from tests.fakes import FakeCompanion
+
+SUBSCRIBERS = 300
+CLIENTS = 4  # subscribers are spread over this many WebSocket connections
+
+
+async def _set(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    entry_id: str,
+    commands: list[dict[str, Any]],
+) -> dict[str, Any]:
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "voicemeeter/set", "entry_id": entry_id, "commands": commands}
+    )
+    return await client.receive_json()
+
+
+async def test_set_forwards_commands(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, companion: FakeCompanion
+) -> None:
+    entry = await async_setup_entry(hass, companion.port)
+
+    response = await _set(
+        hass,
+        hass_ws_client,
+        entry.entry_id,
+        [
+            {"target": "strip", "index": 0, "param": "mute", "value": 1},
+            {"target": "bus", "index": 4, "param": "gain", "value": "-6"},
+        ],
+    )
+    await hass.async_block_till_done()
+
+    assert response["success"]
+    assert companion.received[-1]["commands"] == [
+        {"target": "strip", "index": 0, "param": "mute", "value": True},
+        {"target": "bus", "index": 4, "param": "gain", "value": -6.0},
+    ]
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        # A parameter name ending up verbatim in a VBAN script.
+        {"target": "strip", "index": 0, "param": "Mute=1;Command.Shutdown", "value": 1},
+        {"target": "strip", "index": 8, "param": "mute", "value": 1},
+        {"target": "bus", "index": 5, "param": "gain", "value": 0},
+        # Banana has no A4 bus, and gain has a range.
+        {"target": "strip", "index": 0, "param": "a4", "value": 1},
+        {"target": "bus", "index": 0, "param": "gain", "value": 40},
+    ],
+)
+async def test_set_rejects_invalid_commands(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    companion: FakeCompanion,
+    command: dict[str, Any],
+) -> None:
+    entry = await async_setup_entry(hass, companion.port)
+    valid = {"target": "strip", "index": 0, "param": "mute", "value": 1}
+
+    response = await _set(hass, hass_ws_client, entry.entry_id, [valid, command])
+    await hass.async_block_till_done()
+
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+    assert companion.received == []
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+def test_command_to_script_rejects_unknown_params() -> None:
+    with pytest.raises(ValueError, match="Unknown Voicemeeter parameter"):
+        command_to_script(
+            {
+                "target": "strip",
+                "index": 0,
+                "param": "Mute=1;Command.Shutdown",
+                "value": 1.0,
+            }
+        )
+
+
+async def test_fan_out_to_hundreds_of_subscribers(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, companion: FakeCompanion
+) -> None:
+    """Every subscriber gets the snapshot and each change, exactly once."""
+    entry = await async_setup_entry(hass, companion.port)
+    clients = [await hass_ws_client(hass) for _ in range(CLIENTS)]
+    subscriptions: dict[int, set[int]] = {}
+    for number in range(SUBSCRIBERS):
+        client = clients[number % CLIENTS]
+        await client.send_json_auto_id(
+            {"type": "voicemeeter/subscribe", "entry_id": entry.entry_id}
+        )
+    for client in clients:
+        ids = subscriptions.setdefault(id(client), set())
+        for _ in range(SUBSCRIBERS // CLIENTS):
+            result = await client.receive_json()
+            assert result["success"]
+            ids.add(result["id"])
+            snapshot = await client.receive_json()
+            assert snapshot["event"]["type"] == "state"
+            connection = await client.receive_json()
+            assert connection["event"] == {"type": "connection", "connected": True}
+
+    await companion.broadcast(
+        {"type": "update", "target": "bus", "index": 0, "param": "gain", "value": -3.0}
+    )
+
+    for client in clients:
+        seen = set()
+        for _ in range(SUBSCRIBERS // CLIENTS):
+            message = await client.receive_json()
+            assert message["event"] == {
+                "type": "changes",
+                "changes": [
+                    {"target": "bus", "index": 0, "param": "gain", "value": -3.0}
+                ],
+            }
+            seen.add(message["id"])
+        assert seen == subscriptions[id(client)]
+    assert await hass.config_entries.async_unload(entry.entry_id)
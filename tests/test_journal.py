@@ -0,0 +1,126 @@
+"""Tests for the change journal."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.voicemeeter import journal, websocket
+from custom_components.voicemeeter.commands import make_command
+from custom_components.voicemeeter.const import CONF_JOURNAL, CONF_OFFLINE_QUEUE
+from custom_components.voicemeeter.data import ParamChange
+from custom_components.voicemeeter.journal import (
+    SOURCE_COMMAND,
+    SOURCE_HOST,
+    ChangeJournal,
+)
+from tests.common import async_setup_entry
+from tests.fakes import FakeCompanion
+
+
+def _read(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+async def test_records_are_written_and_queryable(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    path = tmp_path / "journal.jsonl"
+    change_journal = ChangeJournal(hass, path)
+    change_journal.async_start()
+
+    change_journal.record_changes(
+        [ParamChange("strip", 0, "mute", True), ParamChange("bus", 1, "gain", -6.0)]
+    )
+    change_journal.record_commands([make_command("strip", 0, "mute", False)])
+    await change_journal.async_stop()
+
+    records = _read(path)
+    assert [(r["src"], r["target"], r["param"], r["value"]) for r in records] == [
+        (SOURCE_HOST, "strip", "mute", True),
+        (SOURCE_HOST, "bus", "gain", -6.0),
+        (SOURCE_COMMAND, "strip", "mute", False),
+    ]
+    assert change_journal.history(10, target="strip") == records[::-2]
+    assert change_journal.history(1) == records[-1:]
+
+
+async def test_full_batch_flushes_early(hass: HomeAssistant, tmp_path: Path) -> None:
+    path = tmp_path / "journal.jsonl"
+    change_journal = ChangeJournal(hass, path)
+
+    change_journal.record_changes(
+        [ParamChange("strip", 0, "gain", -1.0)] * journal.FLUSH_BATCH
+    )
+    await hass.async_block_till_done()
+
+    assert len(_read(path)) == journal.FLUSH_BATCH
+    await change_journal.async_stop()
+
+
+async def test_rotation(
+    hass: HomeAssistant, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(journal, "MAX_BYTES", 1)
+    path = tmp_path / "journal.jsonl"
+    change_journal = ChangeJournal(hass, path)
+
+    for n in range(journal.BACKUP_COUNT + 2):
+        change_journal.record_changes([ParamChange("strip", 0, "gain", float(-n))])
+        await change_journal.async_stop()
+
+    assert _read(path)[0]["value"] == -(journal.BACKUP_COUNT + 1)
+    for n in range(1, journal.BACKUP_COUNT + 1):
+        backup = path.with_name(f"{path.name}.{n}")
+        assert _read(backup)[0]["value"] == -(journal.BACKUP_COUNT + 1 - n)
+    assert not path.with_name(f"{path.name}.{journal.BACKUP_COUNT + 1}").exists()
+
+
+async def test_overflow_drops_oldest(
+    hass: HomeAssistant, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(journal, "MAX_PENDING", 3)
+    monkeypatch.setattr(journal, "FLUSH_BATCH", 10)
+    path = tmp_path / "journal.jsonl"
+    change_journal = ChangeJournal(hass, path)
+
+    change_journal.record_changes(
+        [ParamChange("strip", 0, "gain", float(-n)) for n in range(5)]
+    )
+    await change_journal.async_stop()
+
+    assert [r["value"] for r in _read(path)] == [-2.0, -3.0, -4.0]
+
+
+async def test_queued_command_is_recorded_once(
+    hass: HomeAssistant, companion: FakeCompanion, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A command issued offline is journaled when it is replayed, not queued."""
+    monkeypatch.setattr(websocket, "RECONNECT_DELAY", 0.2)
+    entry = await async_setup_entry(
+        hass, companion.port, options={CONF_JOURNAL: True, CONF_OFFLINE_QUEUE: True}
+    )
+    coordinator = entry.runtime_data.coordinator
+    await companion.drop()
+    async with asyncio.timeout(5):
+        while coordinator.connected:
+            await asyncio.sleep(0.01)
+
+    command = make_command("strip", 1, "mute", True)
+    await coordinator.async_send_commands([command])
+    assert coordinator.journal.history(10, param="mute") == []
+
+    async with asyncio.timeout(5):
+        while not companion.received:
+            await asyncio.sleep(0.01)
+    await hass.async_block_till_done()
+
+    records = [r for r in coordinator.journal.history(10) if r["src"] == SOURCE_COMMAND]
+    assert [(r["target"], r["index"], r["param"], r["value"]) for r in records] == [
+        ("strip", 1, "mute", True)
+    ]
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,167 @@
+"""Tests for the offline command queue."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.voicemeeter import commands, websocket
+from custom_components.voicemeeter.commands import OfflineCommandQueue, make_command
+from custom_components.voicemeeter.const import (
+    CONF_OFFLINE_QUEUE,
+    CONF_OFFLINE_QUEUE_TTL,
+    DOMAIN,
+    TRANSPORT_VBAN,
+    TRANSPORT_WEBSOCKET,
+)
+from custom_components.voicemeeter.data import VoicemeeterState, parse_state_message
+from custom_components.voicemeeter.params import ParamSelection
+from tests.common import async_setup_entry
+from tests.fakes import FakeCompanion, FakeVban, state_message
+
+TTL = 30  # seconds
+
+
+def _state(**strip_0: object) -> VoicemeeterState:
+    message = state_message("banana")
+    message["strips"][0].update(strip_0)
+    return parse_state_message(message, ParamSelection())
+
+
+def _later(monkeypatch: pytest.MonkeyPatch, seconds: float) -> None:
+    """Move the queue's clock forward, and only the queue's."""
+    now = time.monotonic()
+    monkeypatch.setattr(
+        commands, "time", SimpleNamespace(monotonic=lambda: now + seconds)
+    )
+
+
+def test_queue_keeps_last_write_per_parameter() -> None:
+    queue = OfflineCommandQueue(TTL)
+    queue.add(make_command("strip", 0, "gain", -1.0))
+    queue.add(make_command("strip", 1, "mute", True))
+    queue.add(make_command("strip", 0, "gain", -6.0))
+
+    assert len(queue) == 2
+    # A re-issued command moves to the end.
+    assert queue.drain(_state()) == [
+        make_command("strip", 1, "mute", True),
+        make_command("strip", 0, "gain", -6.0),
+    ]
+    assert len(queue) == 0
+
+
+def test_queue_drops_expired_commands(monkeypatch: pytest.MonkeyPatch) -> None:
+    queue = OfflineCommandQueue(TTL)
+    queue.add(make_command("strip", 0, "gain", -1.0))
+    _later(monkeypatch, TTL / 2)
+    queue.add(make_command("strip", 1, "mute", True))
+    _later(monkeypatch, TTL + 1)
+
+    assert queue.drain(_state()) == [make_command("strip", 1, "mute", True)]
+
+
+def test_queue_skips_commands_the_state_satisfies() -> None:
+    queue = OfflineCommandQueue(TTL)
+    queue.add(
+        make_command("strip", 0, "mute", True),
+        make_command("strip", 0, "gain", -6.0),
+    )
+
+    # The user muted strip 0 on the Windows box while we were offline.
+    assert queue.drain(_state(mute=True)) == [make_command("strip", 0, "gain", -6.0)]
+
+
+async def _wait_connected(hass: HomeAssistant, entry_id: str, connected: bool) -> None:
+    coordinator = hass.config_entries.async_get_entry(entry_id).runtime_data.coordinator
+    async with asyncio.timeout(5):
+        while coordinator.connected != connected:
+            await asyncio.sleep(0.01)
+
+
+async def test_commands_are_replayed_after_reconnect(
+    hass: HomeAssistant, companion: FakeCompanion, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(websocket, "RECONNECT_DELAY", 0.2)
+    entry = await async_setup_entry(
+        hass, companion.port, options={CONF_OFFLINE_QUEUE: True}
+    )
+    coordinator = entry.runtime_data.coordinator
+    await companion.drop()
+    await _wait_connected(hass, entry.entry_id, False)
+
+    assert coordinator.available
+    await coordinator.async_send_commands([make_command("strip", 1, "mute", True)])
+    assert companion.received == []
+
+    async with asyncio.timeout(5):
+        while not companion.received:
+            await asyncio.sleep(0.01)
+    assert companion.received == [
+        {"type": "set", "target": "strip", "index": 1, "param": "mute", "value": True}
+    ]
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.parametrize("transport", [TRANSPORT_WEBSOCKET, TRANSPORT_VBAN])
+async def test_unload_leaves_no_offline_window(
+    hass: HomeAssistant,
+    companion: FakeCompanion,
+    vban_host: FakeVban,
+    transport: str,
+) -> None:
+    """Stopping the transport on unload must not open a new offline window."""
+    port = vban_host.port if transport == TRANSPORT_VBAN else companion.port
+    entry = await async_setup_entry(
+        hass, port, transport=transport, options={CONF_OFFLINE_QUEUE: True}
+    )
+    coordinator = entry.runtime_data.coordinator
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    # A window left open here would also fail the fixture's lingering
+    # timer check.
+    assert not coordinator._offline_window_open
+    assert coordinator._cancel_offline_window is None
+
+
+async def test_expired_window_makes_entities_unavailable(
+    hass: HomeAssistant, companion: FakeCompanion, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """After the TTL the window closes and queued commands are not replayed."""
+    monkeypatch.setattr(websocket, "RECONNECT_DELAY", 0.5)
+    entry = await async_setup_entry(
+        hass,
+        companion.port,
+        options={CONF_OFFLINE_QUEUE: True, CONF_OFFLINE_QUEUE_TTL: TTL},
+    )
+    coordinator = entry.runtime_data.coordinator
+    entity_id = er.async_get(hass).async_get_entity_id(
+        SWITCH_DOMAIN, DOMAIN, f"{entry.entry_id}_strip_1_mute"
+    )
+    await companion.drop()
+    await _wait_connected(hass, entry.entry_id, False)
+    await coordinator.async_send_commands([make_command("strip", 1, "mute", True)])
+    assert hass.states.get(entity_id).state != STATE_UNAVAILABLE
+
+    _later(monkeypatch, TTL + 1)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=TTL + 1))
+    await hass.async_block_till_done()
+    assert not coordinator.available
+    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+
+    await _wait_connected(hass, entry.entry_id, True)
+    await hass.async_block_till_done()
+    assert companion.received == []
+    assert await hass.config_entries.async_unload(entry.entry_id)
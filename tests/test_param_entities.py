@@ -0,0 +1,60 @@
+"""Tests for the extended parameter entities."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.voicemeeter.const import TRANSPORT_VBAN
+from custom_components.voicemeeter.params import parse_param_unique_id
+from tests.common import async_setup_entry
+from tests.fakes import FakeCompanion, FakeVban
+
+
+def _param_keys(hass: HomeAssistant, entry_id: str) -> set[tuple[str, str]]:
+    """(target, key) of every extended parameter entity of an entry."""
+    keys = set()
+    for entity in er.async_entries_for_config_entry(er.async_get(hass), entry_id):
+        param = parse_param_unique_id(entry_id, entity.unique_id)
+        if param is not None:
+            keys.add((param[0], param[2]))
+    return keys
+
+
+async def test_no_extended_entities_for_plain_companion(
+    hass: HomeAssistant, companion: FakeCompanion
+) -> None:
+    """A companion that sends only the core parameters gets no extras."""
+    entry = await async_setup_entry(hass, companion.port)
+
+    assert _param_keys(hass, entry.entry_id) == set()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_extended_entities_for_reporting_companion(
+    hass: HomeAssistant, socket_enabled: None, enable_custom_integrations: None
+) -> None:
+    companion = FakeCompanion("banana", extended=True)
+    await companion.start()
+    try:
+        entry = await async_setup_entry(hass, companion.port)
+        keys = _param_keys(hass, entry.entry_id)
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    finally:
+        await companion.stop()
+
+    assert {("strip", "comp"), ("strip", "eqgain1"), ("bus", "sel")} <= keys
+    # Potato-only parameters don't apply to Banana.
+    assert ("strip", "gain_layer_0") not in keys
+
+
+async def test_vban_gets_the_parameters_of_its_rt_packet(
+    hass: HomeAssistant, vban_host: FakeVban
+) -> None:
+    entry = await async_setup_entry(hass, vban_host.port, transport=TRANSPORT_VBAN)
+
+    keys = _param_keys(hass, entry.entry_id)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert {("strip", "solo"), ("bus", "eq_on"), ("bus", "mode_amix")} <= keys
+    assert ("strip", "comp") not in keys
+    assert ("bus", "sel") not in keys
@@ -0,0 +1,121 @@
+"""Tests for Voicemeeter script compilation and the voicemeeter.execute service."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.voicemeeter.commands import make_command
+from custom_components.voicemeeter.const import DOMAIN
+from custom_components.voicemeeter.data import VoicemeeterState, parse_state_message
+from custom_components.voicemeeter.params import ParamSelection
+from custom_components.voicemeeter.script import (
+    Layout,
+    ScriptError,
+    compile_script,
+    script_to_commands,
+)
+from custom_components.voicemeeter.services import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_SCRIPT,
+    SERVICE_EXECUTE,
+)
+from tests.common import async_setup_entry
+from tests.fakes import FakeCompanion, state_message
+
+INVALID_SCRIPTS = [
+    "Strip[0].Volume=1",  # unknown parameter
+    "Strip[5].Mute=1",  # Banana has strips 0-4
+    "Bus[5].Gain=0",  # and buses 0-4
+    "Strip[0].A4=1",  # but no A4 bus
+    "Strip[0].Mute=2",
+    "Bus[2].Gain=-70",
+    "Strip[0].Mute=1; Bus[2].Gain=13",
+]
+
+
+def _state(kind: str = "banana") -> VoicemeeterState:
+    return parse_state_message(state_message(kind), ParamSelection())
+
+
+def test_parse_statements() -> None:
+    assert script_to_commands("Strip[0].Mute=1; Bus[2].Gain=-10", _state()) == [
+        make_command("strip", 0, "mute", True),
+        make_command("bus", 2, "gain", -10.0),
+    ]
+
+
+def test_names_are_case_insensitive() -> None:
+    assert script_to_commands("strip[1].MUTE=0\nBUS [ 0 ] . gain = -3", _state()) == [
+        make_command("strip", 1, "mute", False),
+        make_command("bus", 0, "gain", -3.0),
+    ]
+
+
+@pytest.mark.parametrize("script", INVALID_SCRIPTS)
+def test_invalid_statements_raise(script: str) -> None:
+    with pytest.raises(ScriptError):
+        script_to_commands(script, _state())
+
+
+def test_compiled_scripts_are_cached() -> None:
+    compile_script.cache_clear()
+    layout = Layout.from_state(_state())
+
+    first = compile_script("Strip[0].Mute=1", layout)
+    second = compile_script("Strip[0].Mute=1", Layout.from_state(_state()))
+    compile_script("Strip[0].Mute=1", Layout.from_state(_state("potato")))
+
+    assert second is first
+    info = compile_script.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+async def test_execute_sends_one_batch(
+    hass: HomeAssistant, companion: FakeCompanion
+) -> None:
+    entry = await async_setup_entry(hass, companion.port)
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_EXECUTE,
+        {
+            ATTR_CONFIG_ENTRY_ID: entry.entry_id,
+            ATTR_SCRIPT: "Strip[0].Mute=1; Bus[2].Gain=-10; Strip[3].B1=0",
+        },
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert companion.received == [
+        {
+            "type": "batch",
+            "commands": [
+                make_command("strip", 0, "mute", True),
+                make_command("bus", 2, "gain", -10.0),
+                make_command("strip", 3, "b1", False),
+            ],
+        }
+    ]
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.parametrize("script", INVALID_SCRIPTS)
+async def test_execute_rejects_invalid_scripts(
+    hass: HomeAssistant, companion: FakeCompanion, script: str
+) -> None:
+    entry = await async_setup_entry(hass, companion.port)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_EXECUTE,
+            {ATTR_CONFIG_ENTRY_ID: entry.entry_id, ATTR_SCRIPT: script},
+            blocking=True,
+        )
+    await hass.async_block_till_done()
+
+    # Nothing is sent, not even the valid statements before the bad one.
+    assert companion.received == []
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,153 @@
+"""Tests for the VBAN transport, offline against a local UDP stand-in."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from custom_components.voicemeeter.vban import (
+    _HEADER,
+    _STATE_MUTE,
+    _STATE_ROUTES,
+    VoicemeeterVban,
+    command_to_script,
+    parse_rt_levels,
+    parse_rt_packet,
+)
+from tests.fakes import HOST, FakeVban, rt_packet
+
+
+def test_parse_rt_packet() -> None:
+    payload = rt_packet(
+        "banana",
+        strip_state=[_STATE_MUTE | _STATE_ROUTES["a1"], _STATE_ROUTES["b2"]] + [0] * 6,
+        strip_gains=[-6.5, 3.0],
+        bus_gains=[0.0, -12.0] + [0.0] * 6,
+        labels=["Mic", "Desk"],
+    )[_HEADER.size :]
+
+    state = parse_rt_packet(payload)
+
+    assert state["kind"] == "banana"
+    assert len(state["strips"]) == 5
+    assert len(state["buses"]) == 5
+    mic, desk = state["strips"][:2]
+    assert (mic["label"], mic["mute"], mic["gain"], mic["a1"]) == (
+        "Mic",
+        True,
+        -6.5,
+        True,
+    )
+    assert (desk["label"], desk["mute"], desk["gain"], desk["b2"]) == (
+        "Desk",
+        False,
+        3.0,
+        True,
+    )
+    assert not state["strips"][2]["virtual"]
+    assert state["strips"][3]["virtual"]
+    assert state["buses"][1]["gain"] == -12.0
+
+
+def test_parse_rt_packet_rejects_garbage() -> None:
+    payload = rt_packet("potato")[_HEADER.size :]
+    assert parse_rt_packet(payload[:-1]) is None
+    assert parse_rt_packet(b"\x09" + payload[1:]) is None
+
+
+def test_parse_rt_levels() -> None:
+    # Hardware strips have 2 channels each, virtual strips 8.
+    levels = [-20.0, -10.0, -60.0, -60.0, -60.0, -60.0, -3.5] + [-60.0] * 15
+    payload = rt_packet("banana", levels=levels)[_HEADER.size :]
+    assert parse_rt_levels(payload, "banana")["strips"] == [
+        -10.0,
+        -60.0,
+        -60.0,
+        -3.5,
+        -60.0,
+    ]
+
+
+@pytest.mark.parametrize(
+    ("command", "script"),
+    [
+        (
+            {"target": "strip", "index": 0, "param": "mute", "value": True},
+            "Strip[0].Mute=1;",
+        ),
+        (
+            {"target": "bus", "index": 2, "param": "gain", "value": -10.0},
+            "Bus[2].Gain=-10.0;",
+        ),
+        (
+            {"target": "strip", "index": 3, "param": "b1", "value": False},
+            "Strip[3].B1=0;",
+        ),
+        (
+            {"target": "bus", "index": 1, "param": "eq_on", "value": True},
+            "Bus[1].EQ.on=1;",
+        ),
+    ],
+)
+def test_command_to_script(command: dict[str, Any], script: str) -> None:
+    assert command_to_script(command) == script
+
+
+async def _wait_for(messages: list[dict[str, Any]], predicate: Any) -> dict[str, Any]:
+    while True:
+        for message in messages:
+            if predicate(message):
+                return message
+        await asyncio.sleep(0.005)
+
+
+async def test_transport_against_udp_standin(socket_enabled: None) -> None:
+    """State, updates and commands round-trip through a local VBAN stand-in."""
+    host = FakeVban("banana")
+    await host.start()
+    messages: list[dict[str, Any]] = []
+    events: list[str] = []
+    transport = VoicemeeterVban(
+        HOST,
+        host.port,
+        "Command1",
+        messages.append,
+        lambda: events.append("connect"),
+        lambda: events.append("disconnect"),
+    )
+    task = asyncio.create_task(transport.start())
+    try:
+        async with asyncio.timeout(5):
+            state = await _wait_for(messages, lambda m: m["type"] == "state")
+            assert state["kind"] == "banana"
+            assert events == ["connect"]
+
+            await transport.send(
+                {
+                    "type": "batch",
+                    "commands": [
+                        {"target": "strip", "index": 0, "param": "mute", "value": True},
+                        {"target": "strip", "index": 1, "param": "gain", "value": -6.0},
+                    ],
+                }
+            )
+            await _wait_for(
+                messages,
+                lambda m: m["type"] == "update" and m["param"] == "gain",
+            )
+    finally:
+        await transport.stop()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await host.stop()
+
+    # Both statements went out in a single VBAN-TEXT packet.
+    assert host.scripts == ["Strip[0].Mute=1;Strip[1].Gain=-6.0;"]
+    updates = {
+        (m["index"], m["param"]): m["value"] for m in messages if m["type"] == "update"
+    }
+    assert updates == {(0, "mute"): True, (1, "gain"): -6.0}
+    assert transport.stats.connects == 1
+    assert events == ["connect", "disconnect"]
@@ -0,0 +1,157 @@
+"""Tests for the parameter watchers behind the device triggers."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from homeassistant.components.automation import DOMAIN as AUTOMATION_DOMAIN
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers import device_registry as dr
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import async_mock_service
+
+from custom_components.voicemeeter.const import DOMAIN
+from custom_components.voicemeeter.data import ParamChange
+from custom_components.voicemeeter.watchers import (
+    DATA_WATCHERS,
+    TRIGGER_MUTED,
+    ThresholdWatcher,
+    TransitionWatcher,
+    WatcherRegistry,
+)
+from tests.common import async_setup_entry
+from tests.fakes import FakeCompanion
+
+
+def test_threshold_watcher_fires_once_per_crossing() -> None:
+    watcher = ThresholdWatcher(
+        above=True, threshold=-10.0, hysteresis=1.0, initial=-20.0
+    )
+    fired = [watcher.evaluate(v) for v in (-12.0, -9.5, -9.0, -10.5, -9.5, -11.0, -9.0)]
+    # Hovering within the hysteresis band doesn't re-arm; dropping below does.
+    assert fired == [False, True, False, False, False, False, True]
+
+
+def test_threshold_watcher_arms_on_first_value() -> None:
+    watcher = ThresholdWatcher(
+        above=False, threshold=-30.0, hysteresis=1.0, initial=None
+    )
+    assert not watcher.evaluate(-40.0)
+    assert not watcher.evaluate(-20.0)
+    assert watcher.evaluate(-31.0)
+
+
+def test_transition_watcher() -> None:
+    watcher = TransitionWatcher(to=True, initial=False)
+    assert [watcher.evaluate(v) for v in (True, True, False, True)] == [
+        True,
+        False,
+        False,
+        True,
+    ]
+
+
+def test_registry_only_evaluates_changed_keys() -> None:
+    registry = WatcherRegistry()
+    fired = []
+    remove = registry.async_add(
+        ("strip", 0, "mute"), TransitionWatcher(to=True, initial=False), fired.append
+    )
+    registry.async_process(
+        [ParamChange("strip", 1, "mute", True), ParamChange("strip", 0, "mute", True)]
+    )
+    assert fired == [True]
+    remove()
+    registry.async_process([ParamChange("strip", 0, "mute", False)])
+    assert fired == [True]
+
+
+async def test_registry_removed_with_entry(
+    hass: HomeAssistant, companion: FakeCompanion
+) -> None:
+    entry = await async_setup_entry(hass, companion.port)
+    assert entry.entry_id in hass.data[DATA_WATCHERS]
+
+    # Reloads keep the registry, so attached triggers survive them.
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.entry_id in hass.data[DATA_WATCHERS]
+
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.entry_id not in hass.data[DATA_WATCHERS]
+
+
+async def _async_setup_mute_automation(
+    hass: HomeAssistant, entry_id: str
+) -> list[ServiceCall]:
+    """Set up an automation on the strip 0 muted trigger; return its calls."""
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, entry_id)})
+    calls = async_mock_service(hass, "test", "automation")
+    assert await async_setup_component(
+        hass,
+        AUTOMATION_DOMAIN,
+        {
+            AUTOMATION_DOMAIN: {
+                "trigger": {
+                    "platform": "device",
+                    "domain": DOMAIN,
+                    "device_id": device.id,
+                    "type": TRIGGER_MUTED,
+                    "target": "strip",
+                    "index": 0,
+                    "param": "mute",
+                },
+                "action": {
+                    "service": "test.automation",
+                    "data": {"value": "{{ trigger.value }}"},
+                },
+            }
+        },
+    )
+    return calls
+
+
+async def _wait_calls(calls: list[ServiceCall]) -> None:
+    async with asyncio.timeout(5):
+        while not calls:
+            await asyncio.sleep(0.01)
+
+
+def _mute_update(state: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "type": "update",
+        "target": "strip",
+        "index": 0,
+        "param": "mute",
+        "value": True,
+    }
+
+
+def _mute_in_renamed_dump(state: dict[str, Any]) -> dict[str, Any]:
+    """Build a state dump muting strip 0 that also renames another strip."""
+    state = copy.deepcopy(state)
+    state["strips"][0]["mute"] = True
+    state["strips"][1]["label"] = "Renamed"
+    return state
+
+
+@pytest.mark.parametrize("push", [_mute_update, _mute_in_renamed_dump])
+async def test_device_trigger_fires_automation(
+    hass: HomeAssistant,
+    companion: FakeCompanion,
+    push: Callable[[dict[str, Any]], dict[str, Any]],
+) -> None:
+    entry = await async_setup_entry(hass, companion.port)
+    calls = await _async_setup_mute_automation(hass, entry.entry_id)
+
+    await companion.broadcast(push(companion.state))
+    await _wait_calls(calls)
+    await hass.async_block_till_done()
+
+    assert [call.data["value"] for call in calls] == [True]
+    assert await hass.config_entries.async_unload(entry.entry_id)
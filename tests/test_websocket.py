@@ -0,0 +1,85 @@
+"""Tests for the WebSocket transport against the local companion stand-in."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import aiohttp
+import pytest
+
+from custom_components.voicemeeter import websocket
+from custom_components.voicemeeter.websocket import VoicemeeterWebSocket
+from tests.fakes import HOST, FakeCompanion
+
+
+class _Client:
+    """A transport for the companion, collecting the messages it delivers."""
+
+    def __init__(self, session: aiohttp.ClientSession, port: int) -> None:
+        self.messages: list[dict[str, Any]] = []
+        self.transport = VoicemeeterWebSocket(
+            session,
+            HOST,
+            port,
+            self.messages.append,
+            lambda: None,
+            lambda: None,
+            offload=self._offload,
+        )
+
+    async def _offload(self, func: Any, *args: Any) -> Any:
+        # Finish later than the frames behind it would, if they didn't wait.
+        await asyncio.sleep(0.05)
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def wait_messages(self, count: int) -> None:
+        async with asyncio.timeout(5):
+            while len(self.messages) < count:
+                await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+async def client(
+    companion: FakeCompanion, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[_Client]:
+    monkeypatch.setattr(websocket, "LOOP_LAG_INTERVAL", 0.01)
+    async with aiohttp.ClientSession() as session:
+        client = _Client(session, companion.port)
+        task = asyncio.create_task(client.transport.start())
+        await client.wait_messages(1)
+        yield client
+        await client.transport.stop()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def test_large_frames_are_offloaded_in_order(
+    companion: FakeCompanion, client: _Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    update = {"type": "update", "target": "strip", "index": 0, "param": "gain"}
+    large = {"type": "levels", "padding": "x" * 200}
+    monkeypatch.setattr(websocket, "LARGE_FRAME_SIZE", len(json.dumps(large)) - 1)
+
+    for frame in (large, {**update, "value": -1.0}, large, {**update, "value": -2.0}):
+        await companion.send_raw(json.dumps(frame))
+    await client.wait_messages(5)
+
+    assert [m["type"] for m in client.messages[1:]] == [
+        "levels",
+        "update",
+        "levels",
+        "update",
+    ]
+    assert client.transport.stats.offloaded_messages == 2
+
+
+async def test_loop_lag_is_recorded_while_connected(client: _Client) -> None:
+    # Something else holding the event loop.
+    time.sleep(0.1)  # noqa: ASYNC251
+    await asyncio.sleep(0.05)
+
+    assert client.transport.stats.loop_lag_max_ms >= 80